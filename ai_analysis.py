@@ -0,0 +1,122 @@
+# OpenAI 기반 AI 분석 모듈
+# 차트 이미지(base64)와 표 데이터를 OpenAI API로 보내 해석을 받아옵니다.
+import base64
+import time
+from io import BytesIO
+
+from config import (
+    OPENAI_API_KEY, OPENAI_MODEL, OPENAI_MAX_TOKENS, OPENAI_TEMPERATURE,
+    OPENAI_API_BASE, OPENAI_TIMEOUT, OPENAI_MAX_RETRIES,
+)
+from perf import timed
+
+RETRY_BASE_DELAY = 1.0       # 429 응답에 Retry-After가 없을 때 첫 재시도 대기 (초, 시도마다 2배)
+RETRY_MAX_DELAY = 20.0
+
+
+def retry_delay(response, attempt):
+    """429 응답 후 재시도 전 대기 시간(초)을 정하는 함수 (Retry-After 우선)"""
+    try:
+        delay = float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        delay = RETRY_BASE_DELAY * (2 ** attempt)
+    return min(max(delay, 0.0), RETRY_MAX_DELAY)
+
+
+@timed('openai')
+def analyze_with_openai(image_base64, table_data=None, analysis_type="시계열 수익률"):
+    """OpenAI API를 사용하여 이미지와 표를 분석하는 함수"""
+    try:
+        # API 키 유효성 검사
+        if not OPENAI_API_KEY or OPENAI_API_KEY == 'your_openai_api_key_here':
+                            return "⚠️ **AI 분석 기능이 비활성화되었습니다.**\n\nAPI 키가 설정되지 않았습니다. AI 분석을 사용하려면:\n\n1. [OpenAI Platform](https://platform.openai.com/account/api-keys)에서 API 키를 생성하세요\n2. Streamlit Cloud Secrets에서 `OPENAI_API_KEY`를 설정하세요\n3. 애플리케이션을 재시작하세요"
+        
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {OPENAI_API_KEY}"
+        }
+        
+        # 메시지 구성
+        messages = [
+            {
+                "role": "system",
+                "content": f"당신은 금융 데이터 분석 전문가입니다. {analysis_type} 차트와 표를 분석하여 한국어로 명확하고 전문적인 해석을 제공해주세요. 주요 인사이트, 트렌드, 패턴을 중심으로 분석해주세요."
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"다음 {analysis_type} 차트와 표를 분석해주세요. 주요 인사이트, 트렌드, 패턴을 한국어로 설명해주세요."
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/png;base64,{image_base64}"
+                        }
+                    }
+                ]
+            }
+        ]
+        
+        # 표 데이터가 있으면 추가
+        if table_data is not None:
+            messages[1]["content"].append({
+                "type": "text",
+                "text": f"\n\n표 데이터:\n{table_data}"
+            })
+        
+        payload = {
+            "model": OPENAI_MODEL,
+            "messages": messages,
+            "max_tokens": OPENAI_MAX_TOKENS,
+            "temperature": OPENAI_TEMPERATURE
+        }
+        
+        import requests
+
+        for attempt in range(OPENAI_MAX_RETRIES + 1):
+            response = requests.post(
+                f"{OPENAI_API_BASE.rstrip('/')}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=OPENAI_TIMEOUT
+            )
+            if response.status_code != 429 or attempt == OPENAI_MAX_RETRIES:
+                break
+            # 요청 한도 초과: 잠시 기다렸다가 다시 요청
+            time.sleep(retry_delay(response, attempt))
+
+        if response.status_code == 200:
+            result = response.json()
+            return result["choices"][0]["message"]["content"]
+        elif response.status_code == 401:
+            error_detail = response.json() if response.text else {}
+            return f"🔐 **API 키 인증 오류**\n\nAPI 키가 유효하지 않습니다. 다음을 확인해주세요:\n\n1. API 키가 올바르게 설정되었는지 확인\n2. API 키가 만료되지 않았는지 확인\n3. [OpenAI Platform](https://platform.openai.com/account/api-keys)에서 새로운 키 생성\n4. API 키에 충분한 크레딧이 있는지 확인\n5. 프로젝트 설정에서 API 키가 활성화되어 있는지 확인\n\n**오류 상세:** {error_detail}\n\n**현재 API 키:** {OPENAI_API_KEY[:10] if OPENAI_API_KEY else 'None'}..."
+        elif response.status_code == 429:
+            return f"⏳ **요청 한도 초과**\n\nOpenAI API 요청이 많아 {OPENAI_MAX_RETRIES}회 재시도 후에도 처리되지 않았습니다. 잠시 후 다시 시도해주세요."
+        else:
+            return f"API 호출 오류: {response.status_code} - {response.text}"
+            
+    except Exception as e:
+        return f"분석 중 오류 발생: {str(e)}"
+
+
+@timed('base64')
+def save_plot_as_base64(fig):
+    """matplotlib 그래프를 base64로 인코딩하는 함수"""
+    try:
+        # 그래프를 바이트로 저장
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
+        buffer.seek(0)
+        
+        # base64로 인코딩
+        image_base64 = base64.b64encode(buffer.getvalue()).decode()
+        buffer.close()
+        
+        return image_base64
+    except Exception as e:
+        import streamlit as st
+        st.error(f"이미지 변환 오류: {e}")
+        return None
@@ -0,0 +1,276 @@
+# 읽기 전용 JSON API (표준 라이브러리 HTTP 서버)
+# 다른 내부 도구가 Streamlit rerun 없이 같은 집계를 받을 수 있도록 운용사별/상품별/기간별/시계열 페이지의
+# 조회 함수를 그대로 써서 JSON으로 돌려줍니다.
+#   GET /api/version                                   현재 data_version
+#   GET /api/managers                                  운용사별 상품 수, 평균 수익률, 총 자산
+#   GET /api/products?manager=운용사                   운용사의 상품 데이터 (자산 규모 순)
+#   GET /api/timeline?start=YYYY-MM-DD&end=YYYY-MM-DD  기준일별 상품 수, 평균 수익률, 총 자산
+#   GET /api/timeseries?manager=운용사&product=상품&product=...&period=1Y&period=3Y&start=...&end=...
+#                                                      상품별 수익률 시계열
+#   GET /api/search?q=검색어                           상품명/운용사명 검색 (일치 후 유사 결과)
+#   GET /api/diff?before=YYYY-MM-DD&after=YYYY-MM-DD&period=1Y&by=fund|manager
+#                                                      두 기준일 사이 상품별/운용사별 변화
+# 기간을 주지 않으면 화면과 같이 최근 1년, 시계열 수익률 기간은 1Y/3Y 입니다.
+# 기준일 비교는 기준일을 주지 않으면 최근 기준일과 바로 앞 기준일, 순위/수익률 기간은 1Y 입니다.
+#
+# 응답에는 data_version과 기본값까지 정한 조회 조건(생략하면 오늘 날짜로 정해지는 기간, 기본 기준일 등)으로 만든
+# ETag가 붙고, 요청의 If-None-Match가 같으면(W/ 약한 검증자도 같은 값으로 봄) 조회하지 않고 304를 돌려줍니다
+# (데이터와 조회 조건이 그대로면 주기적으로 묻는 클라이언트는 헤더만 주고받고, 날짜가 바뀌면 새 기간으로 다시 받음).
+# 조회는 execute_sql_query/frame_cache를 거치므로 같은 프로세스에서 뜬 앱과 조회 결과 캐시를 함께 씁니다.
+# config.py의 API_PORT를 정하면 앱 프로세스 안에서 함께 뜨고, 명령행으로 따로 띄울 수도 있습니다.
+#
+# 사용 예
+#   python api.py --port 8600
+#   curl -i http://127.0.0.1:8600/api/managers
+#   curl -i -H 'If-None-Match: "12-3f2a9c1b7d4e"' http://127.0.0.1:8600/api/managers
+import argparse
+import hashlib
+import json
+import os
+import threading
+import traceback
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from config import API_HOST, API_PORT
+from database import get_data_version
+
+DEFAULT_PERIODS = ["1Y", "3Y"]
+
+_server_lock = threading.Lock()
+_server = {'instance': None, 'error': None}
+
+
+class ApiError(Exception):
+    """요청 파라미터 오류 (400 응답)"""
+
+
+def _param(query, name, default=None, required=False):
+    values = query.get(name)
+    if not values or not values[0]:
+        if required:
+            raise ApiError(f"'{name}' 파라미터가 필요합니다.")
+        return default
+    return values[0]
+
+
+def _date_param(query, name, default):
+    value = _param(query, name)
+    if value is None:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ApiError(f"'{name}'는 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+
+def _date_range(query):
+    """start/end 파라미터를 읽는 함수 (없으면 화면 기본값인 최근 1년)"""
+    today = pd.Timestamp.now()
+    start = _date_param(query, 'start', (today - pd.Timedelta(days=365)).date())
+    end = _date_param(query, 'end', today.date())
+    if start > end:
+        raise ApiError("'start'가 'end'보다 늦습니다.")
+    return start, end
+
+
+def managers_request(query):
+    """운용사별 분석 집계의 (조회 함수, 인자)를 반환하는 함수"""
+    from views.managers import load_manager_summary
+    return load_manager_summary, ()
+
+
+def products_request(query):
+    """운용사 하나의 상품 데이터의 (조회 함수, 인자)를 반환하는 함수"""
+    from views.products import load_products
+    return load_products, (_param(query, 'manager', required=True),)
+
+
+def timeline_request(query):
+    """기준일별 집계의 (조회 함수, 인자)를 반환하는 함수"""
+    from views.periods import load_timeline
+    return load_timeline, _date_range(query)
+
+
+def timeseries_request(query):
+    """선택한 상품들의 수익률 시계열의 (조회 함수, 인자)를 반환하는 함수"""
+    from views.common import PERIOD_MAPPING
+    from views.timeseries import load_timeseries
+    manager = _param(query, 'manager', required=True)
+    products = [name for name in query.get('product', []) if name]
+    if not products:
+        raise ApiError("'product' 파라미터가 하나 이상 필요합니다.")
+    periods = query.get('period') or DEFAULT_PERIODS
+    unknown = [period for period in periods if period not in PERIOD_MAPPING]
+    if unknown:
+        raise ApiError(f"알 수 없는 기간: {unknown} (가능: {list(PERIOD_MAPPING)})")
+    return load_timeseries, (manager, products, periods) + _date_range(query)
+
+
+def search_request(query):
+    """상품명/운용사명 검색의 (조회 함수, 인자)를 반환하는 함수"""
+    from search import search_products
+    return search_products, (_param(query, 'q', required=True),)
+
+
+def diff_request(query):
+    """두 기준일 사이의 상품별(by=fund) 또는 운용사별(by=manager) 변화의 (조회 함수, 인자)를 반환하는 함수"""
+    from views.common import PERIOD_MAPPING
+    from snapshot_diff import load_fund_diff, load_manager_diff, snapshot_dates
+    dates = snapshot_dates()
+    before = _param(query, 'before', dates[1] if len(dates) > 1 else None)
+    after = _param(query, 'after', dates[0] if dates else None)
+    for name, value in (('before', before), ('after', after)):
+        if value not in dates:
+            raise ApiError(f"'{name}' 기준일의 데이터가 없습니다: {value}")
+    if before == after:
+        raise ApiError("'before'와 'after'는 서로 다른 기준일이어야 합니다.")
+    period = _param(query, 'period', '1Y')
+    if period not in PERIOD_MAPPING:
+        raise ApiError(f"알 수 없는 기간: {period} (가능: {list(PERIOD_MAPPING)})")
+    loaders = {'fund': load_fund_diff, 'manager': load_manager_diff}
+    by = _param(query, 'by', 'fund')
+    if by not in loaders:
+        raise ApiError(f"'by'는 {list(loaders)} 중 하나여야 합니다: {by}")
+    return loaders[by], (before, after, PERIOD_MAPPING[period])
+
+
+# 경로 -> 요청 해석 함수 (parse_qs 결과를 받아 기본값까지 정한 (조회 함수, 인자 튜플) 반환, 조회는 하지 않음)
+ROUTES = {
+    '/api/managers': managers_request,
+    '/api/products': products_request,
+    '/api/timeline': timeline_request,
+    '/api/timeseries': timeseries_request,
+    '/api/search': search_request,
+    '/api/diff': diff_request,
+}
+
+
+def frame_json(df):
+    """DataFrame을 JSON 행 목록 문자열로 바꾸는 함수
+
+    공유 캐시의 float32 컬럼(상품별 원본 수익률)은 가장 짧은 십진 표현으로 되돌려 12.3400001526 같은 값이 나가지 않게 합니다.
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if series.dtype == np.float32:
+            series = series.astype(str).astype(np.float64)
+        columns[column] = series
+    return pd.DataFrame(columns, index=df.index).to_json(orient='records', force_ascii=False)
+
+
+def etag(version, path, args=()):
+    """data_version과 경로/조회 인자로 ETag 값을 만드는 함수 ("data_version-조건 해시")"""
+    key = json.dumps([path, list(args)], default=str, ensure_ascii=False).encode('utf-8')
+    return f'"{version}-{hashlib.sha1(key).hexdigest()[:12]}"'
+
+
+def etag_matches(tag, if_none_match):
+    """If-None-Match 헤더 값이 ETag와 맞는지 반환하는 함수 (약한 비교라 W/ 접두어는 떼고 비교)"""
+    requested = [value.strip() for value in (if_none_match or '').split(',')]
+    return '*' in requested or tag in [value[2:] if value.startswith('W/') else value for value in requested]
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """읽기 전용 JSON API 요청 처리기"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload=b'', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(payload)
+
+    def _send_error(self, status, message):
+        self._send(status, json.dumps({'error': message}, ensure_ascii=False).encode('utf-8'))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip('/')
+        if path != '/api/version' and path not in ROUTES:
+            self._send_error(404, f"알 수 없는 경로: {url.path}")
+            return
+
+        try:
+            version = get_data_version()
+            # 기본값까지 정한 조회 조건을 ETag에 넣음 (날짜를 생략한 요청은 날짜가 바뀌면 ETag도 바뀜)
+            load, args = ROUTES[path](parse_qs(url.query)) if path in ROUTES else (None, ())
+            tag = etag(version, path, args)
+            headers = {'ETag': tag, 'Cache-Control': 'no-cache'}
+            # 데이터와 조회 조건이 그대로면 조회하지 않음
+            if etag_matches(tag, self.headers.get('If-None-Match')):
+                self._send(304, headers=headers)
+                return
+
+            if load is None:
+                body = json.dumps({'data_version': version})
+            else:
+                rows = frame_json(load(*args))
+                body = f'{{"data_version": {version}, "rows": {rows}}}'
+            self._send(200, body.encode('utf-8'), headers)
+        except ApiError as e:
+            self._send_error(400, str(e))
+        except Exception as e:
+            traceback.print_exc()
+            self._send_error(500, f"조회 오류: {e}")
+
+
+class ApiServer(ThreadingHTTPServer):
+    """요청마다 스레드를 쓰는 JSON API 서버"""
+
+    daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+
+def start_api_server(host=API_HOST, port=API_PORT):
+    """API 서버를 백그라운드 스레드에서 한 번만 시작하고 서버 객체를 반환하는 함수
+
+    port가 None이면 시작하지 않습니다. 포트를 열지 못하면 다시 시도하지 않고 None을 반환합니다.
+    """
+    if port is None:
+        return None
+    with _server_lock:
+        if _server['instance'] is None and _server['error'] is None:
+            try:
+                server = ApiServer((host, port), ApiHandler)
+            except OSError as e:
+                _server['error'] = str(e)
+                print(f"JSON API 서버를 시작하지 못했습니다 ({host}:{port}): {e}")
+                return None
+            threading.Thread(target=server.serve_forever, name='json-api', daemon=True).start()
+            _server['instance'] = server
+        return _server['instance']
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="분석 결과 읽기 전용 JSON API 서버")
+    parser.add_argument('--host', default=API_HOST)
+    parser.add_argument('--port', type=int, default=API_PORT or 8600)
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    from database import bootstrap_database
+    bootstrap_database()
+
+    server = ApiServer((args.host, args.port), ApiHandler)
+    print(f"JSON API 서버: {server.base_url} (경로: /api/version, {', '.join(ROUTES)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
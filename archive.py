@@ -0,0 +1,215 @@
+# 오래된 기준일 보관(cold archive) 모듈
+# 자주 조회하지 않는 오래된 기준일을 fund_returns에서 꺼내 기준일마다 압축 Parquet 파일 하나로 옮깁니다.
+#   archive_snapshots(asof_date, file_name, row_count, archived_at)  보관된 기준일 목록 (SQLite, 데이터 변경과 같은 트랜잭션)
+#   archive_products(product_id)                                    보관된 행이 가리키는 상품 (차원 정리에서 지우지 않음)
+#
+# 조회할 때는 attach_archive()가 쿼리에 필요한 보관 기준일을 프로세스의 임시 SQLite 캐시 파일로
+# 한 번만 풀어 두고(기준일 단위, 카탈로그가 바뀐 기준일은 다시 읽음), 조회 연결에 ATTACH 한 뒤
+# fund_returns / fund_returns_named와 같은 이름의 TEMP VIEW(원래 테이블 UNION ALL 보관 행)를 만듭니다.
+# SQLite는 이름을 temp 스키마에서 먼저 찾으므로 기존 SQL을 고치지 않아도 보관된 기준일이 함께 조회됩니다.
+# 보관 행은 같은 연결이 읽는 카탈로그에 있는 기준일만 보이므로, 되돌리기/삭제 직후에도 두 번 세지 않습니다.
+# TEMP VIEW는 그 연결에만 보이고 쓰기가 되지 않으므로 조회 전용 연결(execute_sql_query)에서만 붙입니다.
+#
+# Parquet 읽기/쓰기는 pyarrow를 사용하며, 보관된 기준일이 없으면 import 하지 않습니다.
+# 카탈로그에서 빠진 파일은 커밋 뒤 remove_unlisted_files()로 지웁니다 (롤백되어도 파일이 남아 있도록).
+import atexit
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from datetime import date
+
+import pandas as pd
+
+from config import ARCHIVE_DIR, ARCHIVE_TABLE, ARCHIVE_PRODUCT_TABLE, ARCHIVE_COMPRESSION, TABLE_NAME, NAMED_VIEW
+from perf import span
+
+ARCHIVE_SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS {ARCHIVE_TABLE} (
+    asof_date TEXT PRIMARY KEY,
+    file_name TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS {ARCHIVE_PRODUCT_TABLE} (
+    product_id INTEGER PRIMARY KEY
+);
+"""
+
+# 조회 연결에 ATTACH 하는 보관 행 캐시 스키마 이름과 캐시에 풀어 둔 기준일 목록 테이블
+CACHE_SCHEMA = "archive_cache"
+CACHE_LOADED_TABLE = "loaded_snapshots"
+
+# 쿼리 파라미터 중 기준일로 보는 문자열 (date/datetime 파라미터는 그대로 기준일로 봄)
+DATE_PARAM_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+_cache_lock = threading.Lock()
+_cache = {'path': None, 'conn': None}
+
+
+def archive_file_name(asof_date):
+    """기준일의 보관 파일 이름을 반환하는 함수"""
+    return f"{TABLE_NAME}_{asof_date}.parquet"
+
+
+def write_snapshot(df, asof_date):
+    """기준일 하나의 fund_returns 행을 압축 Parquet 파일로 쓰고 파일 이름을 반환하는 함수
+
+    임시 파일에 다 쓴 뒤 이름을 바꾸므로 중간에 실패해도 기존 파일이 깨지지 않습니다.
+    """
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    file_name = archive_file_name(asof_date)
+    path = os.path.join(ARCHIVE_DIR, file_name)
+    df.to_parquet(path + '.tmp', engine='pyarrow', compression=ARCHIVE_COMPRESSION, index=False)
+    os.replace(path + '.tmp', path)
+    return file_name
+
+
+def _read_file(file_name, columns=None):
+    """보관 파일 하나를 읽는 함수 (columns를 주면 그 컬럼만 읽음)"""
+    return pd.read_parquet(os.path.join(ARCHIVE_DIR, file_name), engine='pyarrow', columns=columns)
+
+
+def catalog(conn):
+    """보관된 기준일 목록 [(asof_date, file_name, row_count, archived_at)]를 기준일 순서로 반환하는 함수"""
+    return conn.execute(
+        f"SELECT asof_date, file_name, row_count, archived_at FROM main.{ARCHIVE_TABLE} ORDER BY asof_date"
+    ).fetchall()
+
+
+def read_archive(conn, columns=None, asof_dates=None):
+    """보관된 행을 DataFrame으로 읽는 함수 (asof_dates가 없으면 보관된 모든 기준일)"""
+    entries = catalog(conn)
+    if asof_dates is not None:
+        wanted = set(asof_dates)
+        entries = [entry for entry in entries if entry[0] in wanted]
+    if not entries:
+        return pd.DataFrame(columns=columns)
+    frames = [_read_file(file_name, columns) for _, file_name, _, _ in entries]
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+def query_dates(conn, query, params=None):
+    """쿼리가 읽어야 하는 보관 기준일을 고르는 함수
+
+    fund_returns(또는 뷰)를 읽지 않는 쿼리는 빈 목록입니다. 파라미터에 기준일(YYYY-MM-DD 문자열, date)이 있으면
+    그 최소~최대 범위에 드는 보관 기준일만, 없으면 보관된 모든 기준일을 고릅니다.
+    """
+    if TABLE_NAME not in query:
+        return []
+    archived = [entry[0] for entry in catalog(conn)]
+    if not archived:
+        return []
+    dates = [value.isoformat()[:10] if isinstance(value, date) else value
+             for value in (params or ())
+             if isinstance(value, date) or (isinstance(value, str) and DATE_PARAM_PATTERN.fullmatch(value))]
+    if not dates:
+        return archived
+    start, end = min(dates), max(dates)
+    return [asof_date for asof_date in archived if start <= asof_date <= end]
+
+
+def _remove_cache_file():
+    if _cache['conn'] is not None:
+        _cache['conn'].close()
+        os.remove(_cache['path'])
+
+
+def _cache_connection(conn):
+    """보관 행 캐시 파일 연결을 반환하는 함수 (처음 호출할 때 fund_returns와 같은 정의로 테이블을 만듦)"""
+    if _cache['conn'] is None:
+        handle, path = tempfile.mkstemp(prefix=f"{TABLE_NAME}_archive_", suffix='.sqlite')
+        os.close(handle)
+        cache = sqlite3.connect(path, check_same_thread=False)
+        table_sql = conn.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (TABLE_NAME,)
+        ).fetchone()[0]
+        cache.execute(table_sql)
+        cache.execute(f"CREATE TABLE {CACHE_LOADED_TABLE} (asof_date TEXT PRIMARY KEY, archived_at TEXT)")
+        cache.commit()
+        _cache.update(path=path, conn=cache)
+        atexit.register(_remove_cache_file)
+    return _cache['conn']
+
+
+def sync_cache(conn, asof_dates):
+    """asof_dates의 보관 행이 캐시에 최신 상태로 풀려 있게 하는 함수
+
+    카탈로그에서 빠지거나 다시 보관된 기준일은 캐시에서 지우고, 없는 기준일만 파일에서 읽어 넣습니다.
+    반환값: 이번에 새로 읽은 행 수
+    """
+    entries = {asof_date: (file_name, str(archived_at)) for asof_date, file_name, _, archived_at in catalog(conn)}
+    with _cache_lock:
+        cache = _cache_connection(conn)
+        loaded = dict(cache.execute(f"SELECT asof_date, archived_at FROM {CACHE_LOADED_TABLE}"))
+        stale = [asof_date for asof_date, archived_at in loaded.items()
+                 if asof_date not in entries or entries[asof_date][1] != archived_at]
+        for asof_date in stale:
+            cache.execute(f"DELETE FROM {TABLE_NAME} WHERE asof_date = ?", (asof_date,))
+            cache.execute(f"DELETE FROM {CACHE_LOADED_TABLE} WHERE asof_date = ?", (asof_date,))
+            del loaded[asof_date]
+
+        loaded_rows = 0
+        for asof_date in asof_dates:
+            if asof_date in loaded or asof_date not in entries:
+                continue
+            file_name, archived_at = entries[asof_date]
+            df = _read_file(file_name)
+            columns = list(df.columns)
+            rows = df.astype(object).where(df.notna(), None)
+            cache.executemany(
+                f"INSERT INTO {TABLE_NAME} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})",
+                rows.itertuples(index=False, name=None)
+            )
+            cache.execute(f"INSERT INTO {CACHE_LOADED_TABLE} VALUES (?, ?)", (asof_date, archived_at))
+            loaded_rows += len(df)
+        cache.commit()
+    return loaded_rows
+
+
+def attach_archive(conn, asof_dates):
+    """보관된 기준일 행을 조회 연결에 붙이는 함수 (캐시 ATTACH + 같은 이름의 TEMP VIEW)
+
+    반환값: 캐시에 새로 읽은 보관 행 수
+    """
+    if not asof_dates:
+        return 0
+    with span('sql', f"archive.attach ({len(asof_dates)}개 기준일)") as info:
+        info['rows'] = sync_cache(conn, asof_dates)
+        conn.execute(f"ATTACH DATABASE ? AS {CACHE_SCHEMA}", (_cache['path'],))
+        conn.execute(f"""
+            CREATE TEMP VIEW {TABLE_NAME} AS
+            SELECT * FROM main.{TABLE_NAME}
+            UNION ALL
+            SELECT * FROM {CACHE_SCHEMA}.{TABLE_NAME}
+            WHERE asof_date IN (SELECT asof_date FROM main.{ARCHIVE_TABLE})
+        """)
+        # 운용사/상품명 뷰는 main 스키마의 정의를 그대로 TEMP VIEW로 만들어 위 TEMP VIEW를 읽게 함
+        view_sql = conn.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'view' AND name = ?", (NAMED_VIEW,)
+        ).fetchone()[0]
+        conn.execute(re.sub(r'^CREATE VIEW', 'CREATE TEMP VIEW', view_sql.strip()))
+    return info['rows']
+
+
+def remove_unlisted_files(conn):
+    """카탈로그에 없는 보관 파일을 지우는 함수 (보관 해제/삭제/초기화를 커밋한 뒤 호출)
+
+    반환값: 지운 파일 수
+    """
+    if not os.path.isdir(ARCHIVE_DIR):
+        return 0
+    listed = {entry[1] for entry in catalog(conn)}
+    removed = 0
+    for file_name in os.listdir(ARCHIVE_DIR):
+        if file_name.startswith(f"{TABLE_NAME}_") and file_name not in listed:
+            os.remove(os.path.join(ARCHIVE_DIR, file_name))
+            removed += 1
+    return removed
+
+
+def archive_cutoff(latest_date, months):
+    """최근 기준일에서 months개월 전 날짜(이보다 오래된 기준일이 보관 대상)를 반환하는 함수"""
+    return (pd.Timestamp(latest_date) - pd.DateOffset(months=months)).strftime('%Y-%m-%d')
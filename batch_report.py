@@ -0,0 +1,325 @@
+# 운용사별 월간 리포트 일괄 생성 (명령행 실행용)
+# 상품별 분석/시계열 수익률 페이지의 조회·계산·차트 함수를 그대로 써서
+# 운용사마다 HTML 또는 PDF 리포트를 만듭니다. 운용사는 프로세스 풀에 나눠서 처리하며
+# 각 작업 프로세스는 자기 matplotlib(Agg)과 한글 폰트 설정을 한 번씩만 초기화합니다.
+#
+# 사용 예
+#   python batch_report.py --out reports --format html --workers 4
+#   python batch_report.py --format pdf --managers "운용사A" "운용사B" --periods 1Y 3Y --ai
+import argparse
+import base64
+import html
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).parent
+
+DEFAULT_PERIODS = ["1Y", "3Y"]
+REPORT_DPI = 120
+LEGEND_LIMIT = 20            # 시계열 차트에 범례를 표시하는 최대 상품 수
+TABLE_PAGE_ROWS = 35         # PDF 표 한 페이지에 넣는 행 수
+
+REPORT_CSS = """
+body { font-family: 'Noto Sans KR', 'NanumGothic', sans-serif; margin: 32px; color: #222; }
+h1 { color: #2E86AB; } h2 { color: #2E86AB; border-bottom: 1px solid #ddd; padding-bottom: 4px; }
+img { max-width: 100%; } table { border-collapse: collapse; font-size: 12px; margin-bottom: 16px; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: right; } th { background: #f3f6f9; }
+.meta { color: #666; font-size: 13px; } .ai { background: #f8f9fa; padding: 12px; white-space: pre-wrap; }
+"""
+
+
+def safe_file_name(name):
+    """운용사명을 파일 이름으로 쓸 수 있게 바꾸는 함수"""
+    return re.sub(r'[\\/:*?"<>|\s]+', '_', name).strip('_') or 'manager'
+
+
+def _init_worker(base_dir):
+    """작업 프로세스 초기화: 작업 디렉토리, matplotlib 백엔드, 한글 폰트를 한 번만 설정"""
+    os.chdir(base_dir)
+    import matplotlib
+    matplotlib.use('Agg')
+    from startup import get_pyplot
+    get_pyplot()
+
+
+def figure_to_png(fig):
+    """Figure를 PNG 바이트로 저장하는 함수"""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=REPORT_DPI, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def collect_sections(manager, options):
+    """한 운용사의 리포트 구성 요소(제목, 그림, 표, AI 해설)를 만드는 함수
+
+    반환값: (sections, timings) sections는 ('figure'|'table'|'text', 제목, 내용) 목록
+    """
+    from startup import get_pyplot
+    from timeseries_engine import average_lines
+    from views import products as product_view
+    from views import timeseries as timeseries_view
+    from views.metrics_panel import load_metrics, format_metrics
+
+    plt = get_pyplot()
+    timings = {}
+    sections = []
+    figures = []
+
+    # 상품별 분석: 최신 기준일 스냅샷
+    started = time.perf_counter()
+    df_products = product_view.load_products(manager)
+    if not df_products.empty:
+        df_products = df_products[df_products['asof_date'] == df_products['asof_date'].max()]
+    df_sorted = product_view.sort_products(df_products, options['criteria'])
+    df_chart = product_view.product_window(df_sorted, 0)
+    df_metrics = load_metrics('sharpe', False, manager)
+
+    timeseries_products = timeseries_view.load_products(manager, options['start'], options['end'])['product_name'].tolist()
+    df_timeline = timeseries_view.load_timeseries(
+        manager, timeseries_products, options['periods'], options['start'], options['end']
+    ) if timeseries_products else pd.DataFrame()
+    timings['query'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if not df_sorted.empty:
+        summary = product_view.summarize_products(df_sorted)
+        sections.append(('table', "📊 상품 분석 요약", pd.DataFrame([{
+            '기준일': df_sorted['asof_date'].iloc[0],
+            '총 상품 수': summary['product_count'],
+            '평균 1년 수익률(%)': round(summary['avg_1y_return'], 2),
+            '총 자산(원)': f"{summary['total_assets']:,.0f}",
+        }])))
+        title_suffix = f" (상위 {len(df_chart)}개)" if len(df_chart) < len(df_sorted) else ""
+        heatmap = product_view.build_heatmap_figure(df_chart, manager)
+        figures.append(("🔥 상품별 수익률 히트맵" + title_suffix, heatmap))
+        assets = product_view.build_assets_figure(df_chart, manager)
+        figures.append(("💰 상품별 자산 규모" + title_suffix, assets))
+
+    if not df_metrics.empty:
+        sections.append(('table', "📐 위험/성과 지표", format_metrics(df_metrics, include_manager=False)))
+
+    if not df_timeline.empty:
+        cube = timeseries_view.build_timeseries_cube(df_timeline, timeseries_products, options['periods'])
+        average = average_lines(cube)
+        for period in cube['periods']:
+            fig = timeseries_view.build_timeseries_figure(
+                cube, manager, period, average,
+                show_legend=len(cube['products']) <= LEGEND_LIMIT
+            )
+            figures.append((f"📈 {period} 수익률 시계열", fig))
+        sections.append(('table', "📊 시계열 요약 통계", timeseries_view.summarize_timeseries(cube)))
+    timings['compute'] = time.perf_counter() - started
+
+    # 그림을 PNG로 변환 (AI 해설도 같은 이미지를 사용)
+    started = time.perf_counter()
+    for title, fig in figures:
+        sections.append(('figure', title, figure_to_png(fig)))
+        plt.close(fig)
+    timings['render'] = time.perf_counter() - started
+
+    if options['ai']:
+        from ai_analysis import analyze_with_openai
+        started = time.perf_counter()
+        commented = []
+        for kind, title, content in sections:
+            commented.append((kind, title, content))
+            if kind == 'figure':
+                commentary = analyze_with_openai(base64.b64encode(content).decode(), analysis_type=title)
+                commented.append(('text', "🤖 AI 분석", commentary))
+        sections = commented
+        timings['ai'] = time.perf_counter() - started
+
+    return sections, timings
+
+
+def write_html(path, manager, sections, options):
+    """리포트 구성 요소를 이미지가 포함된 HTML 파일 하나로 쓰는 함수"""
+    parts = [
+        f"<html><head><meta charset='utf-8'><title>{html.escape(manager)} 리포트</title>",
+        f"<style>{REPORT_CSS}</style></head><body>",
+        f"<h1>{html.escape(manager)} 리포트</h1>",
+        f"<p class='meta'>분석 기간: {options['start']} ~ {options['end']} · 수익률 기간: {', '.join(options['periods'])}</p>",
+    ]
+    for kind, title, content in sections:
+        parts.append(f"<h2>{html.escape(title)}</h2>")
+        if kind == 'figure':
+            parts.append(f"<img src='data:image/png;base64,{base64.b64encode(content).decode()}'>")
+        elif kind == 'table':
+            parts.append(content.to_html(index=False, float_format=lambda value: f"{value:,.2f}", na_rep='-'))
+        else:
+            parts.append(f"<div class='ai'>{html.escape(str(content))}</div>")
+    parts.append("</body></html>")
+    Path(path).write_text('\n'.join(parts), encoding='utf-8')
+
+
+def write_pdf(path, manager, sections, options):
+    """리포트 구성 요소를 matplotlib PdfPages로 PDF 파일에 쓰는 함수 (추가 의존성 없음)"""
+    import matplotlib.image as mpimg
+    from matplotlib.backends.backend_pdf import PdfPages
+    from startup import get_pyplot
+    from views.common import set_axis_labels
+
+    plt = get_pyplot()
+
+    def text_page(pdf, title, text):
+        fig = plt.figure(figsize=(11.69, 8.27))
+        ax = fig.add_axes([0.05, 0.05, 0.9, 0.85])
+        ax.axis('off')
+        set_axis_labels(ax, title=title)
+        ax.text(0, 1, text, va='top', ha='left', fontsize=10, wrap=True, transform=ax.transAxes)
+        pdf.savefig(fig)
+        plt.close(fig)
+
+    with PdfPages(path) as pdf:
+        text_page(pdf, f"{manager} 리포트",
+                  f"분석 기간: {options['start']} ~ {options['end']}\n수익률 기간: {', '.join(options['periods'])}")
+        for kind, title, content in sections:
+            if kind == 'figure':
+                fig = plt.figure(figsize=(11.69, 8.27))
+                ax = fig.add_axes([0.02, 0.02, 0.96, 0.9])
+                ax.imshow(mpimg.imread(BytesIO(content), format='png'))
+                ax.axis('off')
+                set_axis_labels(ax, title=title)
+                pdf.savefig(fig)
+                plt.close(fig)
+            elif kind == 'table':
+                df_table = content.copy()
+                for column in df_table.select_dtypes('number').columns:
+                    df_table[column] = df_table[column].map(lambda value: '-' if pd.isna(value) else f"{value:,.2f}")
+                for start in range(0, max(len(df_table), 1), TABLE_PAGE_ROWS):
+                    df_page = df_table.iloc[start:start + TABLE_PAGE_ROWS].astype(str)
+                    fig = plt.figure(figsize=(11.69, 8.27))
+                    ax = fig.add_axes([0.02, 0.02, 0.96, 0.88])
+                    ax.axis('off')
+                    set_axis_labels(ax, title=title if start == 0 else f"{title} (계속)")
+                    if not df_page.empty:
+                        table = ax.table(cellText=df_page.values, colLabels=list(df_page.columns), loc='upper center')
+                        table.auto_set_font_size(False)
+                        table.set_fontsize(8)
+                    pdf.savefig(fig)
+                    plt.close(fig)
+            else:
+                text_page(pdf, title, str(content))
+
+
+def render_manager_report(manager, options):
+    """한 운용사의 리포트를 만들어 저장하고 단계별 소요 시간을 반환하는 함수 (작업 프로세스에서 실행)"""
+    started = time.perf_counter()
+    result = {'manager': manager, 'path': None, 'error': None, 'pid': os.getpid()}
+    try:
+        sections, timings = collect_sections(manager, options)
+        path = Path(options['out']) / f"{safe_file_name(manager)}.{options['format']}"
+        write_started = time.perf_counter()
+        if options['format'] == 'pdf':
+            write_pdf(path, manager, sections, options)
+        else:
+            write_html(path, manager, sections, options)
+        timings['write'] = time.perf_counter() - write_started
+        result.update(path=str(path), timings=timings)
+    except Exception as e:
+        result.update(error=f"{type(e).__name__}: {e}", timings={})
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def write_index(out_dir, results, options):
+    """생성된 리포트 목록 index.html을 쓰는 함수 (HTML 형식일 때)"""
+    rows = []
+    for result in sorted(results, key=lambda item: item['manager']):
+        name = html.escape(result['manager'])
+        if result['path']:
+            link = f"<a href='{html.escape(Path(result['path']).name)}'>{name}</a>"
+        else:
+            link = f"{name} (실패: {html.escape(result['error'])})"
+        rows.append(f"<tr><td style='text-align:left'>{link}</td><td>{result['seconds']:.2f}s</td></tr>")
+    Path(out_dir, 'index.html').write_text(
+        f"<html><head><meta charset='utf-8'><style>{REPORT_CSS}</style></head><body>"
+        f"<h1>운용사별 리포트</h1><p class='meta'>분석 기간: {options['start']} ~ {options['end']}</p>"
+        f"<table><tr><th>운용사</th><th>생성 시간</th></tr>{''.join(rows)}</table></body></html>",
+        encoding='utf-8'
+    )
+
+
+def run_batch(managers, options, workers=None):
+    """운용사 목록을 프로세스 풀로 나눠 리포트를 만들고 결과 목록을 반환하는 함수"""
+    Path(options['out']).mkdir(parents=True, exist_ok=True)
+    results = []
+    # fork 대신 spawn: 부모 프로세스의 matplotlib/SQLite 상태를 물려받지 않도록
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(str(BASE_DIR),)) as executor:
+        futures = {executor.submit(render_manager_report, manager, options): manager for manager in managers}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = "실패: " + result['error'] if result['error'] else result['path']
+            print(f"  [{len(results)}/{len(managers)}] {result['manager']} {result['seconds']:.2f}s -> {status}", flush=True)
+    if options['format'] == 'html':
+        write_index(options['out'], results, options)
+    return results
+
+
+def print_timings(results, wall_seconds):
+    """운용사별 단계 소요 시간 표와 전체 소요 시간을 출력하는 함수"""
+    stages = ['query', 'compute', 'render', 'ai', 'write']
+    print(f"\n{'운용사':<24}" + ''.join(f"{stage:>9}" for stage in stages) + f"{'total':>9}  pid")
+    for result in sorted(results, key=lambda item: -item['seconds']):
+        timings = result['timings']
+        cells = ''.join(f"{timings[stage]:9.2f}" if stage in timings else f"{'-':>9}" for stage in stages)
+        print(f"{result['manager'][:24]:<24}{cells}{result['seconds']:9.2f}  {result['pid']}")
+
+    total_work = sum(result['seconds'] for result in results)
+    failed = sum(1 for result in results if result['error'])
+    print(f"\n운용사 {len(results)}개 (실패 {failed}개), 작업 합계 {total_work:.2f}s, "
+          f"실제 소요 {wall_seconds:.2f}s (병렬 효율 x{total_work / wall_seconds if wall_seconds else 0:.1f})")
+
+
+def main(argv=None):
+    today = pd.Timestamp.now().normalize()
+    parser = argparse.ArgumentParser(description="운용사별 상품/시계열 리포트 일괄 생성")
+    parser.add_argument('--out', default='reports', help="리포트 저장 디렉토리")
+    parser.add_argument('--format', choices=['html', 'pdf'], default='html', help="리포트 형식")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--managers', nargs='*', help="대상 운용사 (기본: 전체)")
+    parser.add_argument('--start', default=str((today - pd.Timedelta(days=365)).date()), help="시계열 시작일")
+    parser.add_argument('--end', default=str(today.date()), help="시계열 종료일")
+    parser.add_argument('--periods', nargs='+', default=DEFAULT_PERIODS, help="시계열 수익률 기간 (예: 1Y 3Y)")
+    parser.add_argument('--criteria', default="자산 규모", help="상품 정렬 기준 (자산 규모/수익률/상품명)")
+    parser.add_argument('--ai', action='store_true', help="차트마다 AI 해설 포함 (OpenAI API 호출)")
+    args = parser.parse_args(argv)
+
+    options = {
+        'out': str(Path(args.out).resolve()),
+        'format': args.format,
+        'start': args.start,
+        'end': args.end,
+        'periods': args.periods,
+        'criteria': args.criteria,
+        'ai': args.ai,
+    }
+    os.chdir(BASE_DIR)
+
+    from database import bootstrap_database
+    from views.products import load_managers
+    bootstrap_database()
+    managers = args.managers or load_managers()['manager'].tolist()
+    if not managers:
+        print("운용사 데이터가 없습니다.")
+        return []
+
+    print(f"운용사 {len(managers)}개 리포트 생성 ({args.format}, 작업 프로세스 {args.workers or os.cpu_count()}개)")
+    started = time.perf_counter()
+    results = run_batch(managers, options, workers=args.workers)
+    print_timings(results, time.perf_counter() - started)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,447 @@
+# 성능 벤치마크 (업로드 적재, 페이지별 SQL, 검색, 조회 캐시 적중, pandas 후처리, 차트 렌더링, AI 이미지 인코딩)
+# 임시 작업 디렉토리에 synthetic_data.py로 만든 DB를 두고 각 단계를 반복 측정한 뒤
+# (페이지별 SQL 항목은 매번 frame_cache를 비우고 실제 조회 시간을, cache 항목은 캐시 적중 시간을 잼)
+# 결과를 JSON으로 저장합니다. 커밋마다 결과 파일을 남겨 두고 --compare로 비교합니다.
+# 앱의 DB 파일(fund_returns.db)은 건드리지 않습니다.
+#
+# 사용 예
+#   python benchmark.py --size small
+#   python benchmark.py --size medium --repeat 7 --out bench/medium-new.json --compare bench/medium-old.json
+#   python benchmark.py --compare bench/old.json bench/new.json      (측정 없이 두 결과 비교)
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+
+# 크기 이름 -> (운용사 수, 운용사당 상품 수, 기준일 수)
+BENCHMARK_SIZES = {
+    'small': (5, 20, 24),
+    'medium': (20, 100, 60),
+    'large': (50, 200, 120),
+}
+
+DEFAULT_REPEAT = 5
+DEFAULT_SEED = 0
+SLOWER_THRESHOLD = 1.10      # 비교 시 이 배수 이상 느려지면 표시
+RESULT_VERSION = 1
+
+
+def summarize_timings(timings, **extra):
+    """반복 측정 시간 목록(ms)을 통계 딕셔너리로 만드는 함수"""
+    return {
+        'repeat': len(timings),
+        'min_ms': min(timings),
+        'median_ms': statistics.median(timings),
+        'mean_ms': statistics.fmean(timings),
+        'max_ms': max(timings),
+        **extra,
+    }
+
+
+def time_case(func, repeat, teardown=None):
+    """func를 repeat번 실행해 소요 시간 통계(ms)를 반환하는 함수
+
+    teardown은 매 실행 결과를 받아 정리하는 함수로, 측정 시간에는 포함되지 않습니다.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+        if teardown:
+            teardown(result)
+    return summarize_timings(timings)
+
+
+def git_revision():
+    """현재 커밋 해시와 작업 트리 변경 여부를 반환하는 함수 (git이 없으면 None)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=BASE_DIR, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                    capture_output=True, text=True, cwd=BASE_DIR).stdout.strip())
+        return {'commit': commit, 'dirty': dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+def environment_info():
+    """결과 비교에 필요한 실행 환경 정보를 모으는 함수"""
+    import matplotlib
+    import numpy
+    import pandas
+    import streamlit
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'sqlite': sqlite3.sqlite_version,
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'matplotlib': matplotlib.__version__,
+        'streamlit': streamlit.__version__,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 측정 항목
+# ---------------------------------------------------------------------------
+
+def benchmark_upload(excel_path, asof_date, repeat):
+    """업로드 페이지의 단계별 처리 시간을 측정하는 함수
+
+    매 반복마다 같은 기준일을 새로 적재한 뒤 롤백하므로 반복 간 DB 상태가 같습니다.
+    """
+    import pandas as pd
+    from database import get_db_connection, ingest_records
+    from metrics import refresh_metrics
+    from sketches import refresh_sketches
+    from views.upload import build_records
+
+    stages = {name: [] for name in ['read_excel', 'build_records', 'ingest_records',
+                                    'refresh_metrics', 'refresh_sketches', 'total']}
+    row_count = 0
+    for _ in range(repeat):
+        conn = get_db_connection()
+        try:
+            started = time.perf_counter()
+            df = pd.read_excel(excel_path, sheet_name=0)
+            stages['read_excel'].append(time.perf_counter() - started)
+
+            step = time.perf_counter()
+            records = build_records(df, asof_date)
+            stages['build_records'].append(time.perf_counter() - step)
+
+            step = time.perf_counter()
+            row_count = ingest_records(conn, records)[0]
+            stages['ingest_records'].append(time.perf_counter() - step)
+
+            step = time.perf_counter()
+            refresh_metrics(conn)
+            stages['refresh_metrics'].append(time.perf_counter() - step)
+
+            step = time.perf_counter()
+            refresh_sketches(conn, [asof_date])
+            stages['refresh_sketches'].append(time.perf_counter() - step)
+            stages['total'].append(time.perf_counter() - started)
+        finally:
+            conn.rollback()
+            conn.close()
+
+    return {
+        f"upload.{name}": summarize_timings([value * 1000 for value in seconds], rows=row_count)
+        for name, seconds in stages.items()
+    }
+
+
+def page_inputs(df):
+    """페이지 조회에 쓸 대표 조건(기간, 운용사, 상품 목록)을 정하는 함수"""
+    dates = sorted(df['asof_date'].unique())
+    manager_sizes = df.groupby('manager')['product_name'].nunique()
+    manager = manager_sizes.idxmax()
+    return {
+        'start': dates[0],
+        'end': dates[-1],
+        'year_start': dates[max(0, len(dates) - 12)],
+        'manager': manager,
+        'product': df.loc[df['manager'] == manager, 'product_name'].min(),
+        'periods': ['1Y', '3Y'],
+    }
+
+
+def typo_query(word):
+    """단어 가운데 글자 하나를 바꾼 검색어를 만드는 함수 (오타 검색 측정용)"""
+    i = len(word) // 2
+    return word[:i] + ('X' if word[i] != 'X' else 'Y') + word[i + 1:]
+
+
+def build_cases(inputs):
+    """(분류, 이름, 실행 함수, 정리 함수) 측정 항목 목록을 만드는 함수
+
+    후처리/차트 항목은 입력 데이터를 미리 조회해 두고 해당 단계만 측정합니다.
+    """
+    from ai_analysis import save_plot_as_base64
+    from database import execute_sql_query, get_read_connection
+    from export import write_csv
+    from frame_cache import clear_cache
+    from search import search_products
+    from sketches import sketch_query, merge_rows
+    from startup import get_pyplot
+    from timeseries_engine import average_lines
+    from views import managers, periods, products, returns, timeseries
+    from views.common import selected_columns
+    from views.grid import build_page_query, build_count_query
+    from views.metrics_panel import load_metrics, format_metrics
+
+    plt = get_pyplot()
+    start, end, manager = inputs['start'], inputs['end'], inputs['manager']
+    year_start = inputs['year_start']
+    return_periods = inputs['periods']
+    cols = selected_columns(['1M', '3M', '6M', '1Y', '2Y', '3Y'])
+
+    def close(fig):
+        plt.close(fig)
+
+    def uncached(func):
+        """공유 조회 캐시(frame_cache)를 비우고 실행 (캐시 적중이 아니라 SQL 조회 시간을 잼)"""
+        def run():
+            clear_cache()
+            return func()
+        return run
+
+    def render_png(build):
+        """차트를 만들고 st.pyplot처럼 PNG로 렌더링"""
+        def run():
+            fig = build()
+            fig.savefig(BytesIO(), format='png', bbox_inches='tight')
+            return fig
+        return run
+
+    def export_csv():
+        query, params = returns.export_query(year_start, end)
+        conn = get_read_connection(query, params)
+        try:
+            return write_csv(conn, query, params, BytesIO())
+        finally:
+            conn.close()
+
+    # 후처리/차트 입력 (한 번만 조회)
+    df_sketch_rows = execute_sql_query(sketch_query(cols), params=list(cols) + [start, end])
+    sketches = merge_rows(df_sketch_rows, cols)
+    df_manager = managers.load_manager_summary()
+    df_top = managers.sort_managers(df_manager, "평균 수익률")[0].head(10)
+    df_products = products.load_products(manager)
+    df_products_sorted = products.sort_products(df_products, "자산 규모")
+    df_window = products.product_window(df_products_sorted, 0)
+    df_timeline = periods.load_timeline(start, end)
+    product_names = timeseries.load_products(manager, year_start, end)['product_name'].tolist()
+    df_series = timeseries.load_timeseries(manager, product_names, return_periods, year_start, end)
+    cube = timeseries.build_timeseries_cube(df_series, product_names, return_periods)
+    average = average_lines(cube)
+    grid_query, grid_params = build_page_query(
+        products.PRODUCTS_SQL, products.PRODUCT_GRID_COLUMNS, ['asof_date', 'product_id'], 'total_amount', True
+    )
+    count_query, count_params = build_count_query(products.PRODUCTS_SQL)
+    encode_figure = products.build_heatmap_figure(df_window, manager)
+    product = inputs['product']
+    word = product.split()[-1]
+    typo = typo_query(word)
+    # 짧은 단어 하나에 오타가 있어도 그 단어를 가진 상품을 찾는지 확인 (세 글자 조각 겹침만으로는 못 찾음)
+    if not search_products(typo)['product_name'].str.contains(word, regex=False).any():
+        raise RuntimeError(f"오타 검색으로 상품을 찾지 못했습니다: {typo!r} -> {word!r}")
+
+    cases = [
+        # 페이지별 SQL
+        ('sql', 'returns.count', uncached(lambda: returns.count_returns(start, end)), None),
+        ('sql', 'returns.sketches', lambda: execute_sql_query(sketch_query(cols), params=list(cols) + [start, end]), None),
+        ('sql', 'returns.rank_products', uncached(lambda: returns.rank_products(start, end, 'r_1y')), None),
+        ('sql', 'managers.summary', uncached(managers.load_manager_summary), None),
+        ('sql', 'products.load', uncached(lambda: products.load_products(manager)), None),
+        ('sql', 'products.grid_page', lambda: execute_sql_query(grid_query, params=[manager] + grid_params), None),
+        ('sql', 'products.grid_count', lambda: execute_sql_query(count_query, params=[manager] + count_params), None),
+        ('sql', 'periods.timeline', uncached(lambda: periods.load_timeline(start, end)), None),
+        ('sql', 'timeseries.products', uncached(lambda: timeseries.load_products(manager, year_start, end)), None),
+        ('sql', 'timeseries.load', uncached(lambda: timeseries.load_timeseries(
+            manager, product_names, return_periods, year_start, end)), None),
+        ('sql', 'metrics.top', lambda: load_metrics('sharpe', False, None, 100), None),
+        ('sql', 'export.csv_1y', export_csv, None),
+        ('sql', 'search.exact', lambda: search_products(product), None),
+        ('sql', 'search.typo', lambda: search_products(typo), None),
+
+        # 조회 캐시 적중 (워밍업 실행이 채운 결과를 다시 받음)
+        ('cache', 'managers.summary', managers.load_manager_summary, None),
+        ('cache', 'products.load', lambda: products.load_products(manager), None),
+        ('cache', 'periods.timeline', lambda: periods.load_timeline(start, end), None),
+
+        # pandas/NumPy 후처리
+        ('pandas', 'returns.statistics', lambda: returns.compute_statistics(merge_rows(df_sketch_rows, cols), cols), None),
+        ('pandas', 'managers.sort_summarize', lambda: (managers.sort_managers(df_manager, "평균 수익률"),
+                                                        managers.summarize_managers(df_manager)), None),
+        ('pandas', 'products.sort_summarize', lambda: (products.sort_products(df_products, "자산 규모"),
+                                                        products.summarize_products(df_products)), None),
+        ('pandas', 'periods.summarize', lambda: periods.summarize_timeline(df_timeline), None),
+        ('pandas', 'timeseries.cube_summary', lambda: timeseries.summarize_timeseries(
+            timeseries.build_timeseries_cube(df_series, product_names, return_periods)), None),
+        ('pandas', 'metrics.format', lambda: format_metrics(load_metrics('sharpe', False, manager)), None),
+
+        # 차트 (생성 + PNG 렌더링)
+        ('chart', 'returns.histogram', render_png(lambda: returns.build_histogram_figure(sketches, '1Y')), close),
+        ('chart', 'returns.boxplot', render_png(lambda: returns.build_boxplot_figure(sketches, cols)), close),
+        ('chart', 'managers.returns', render_png(lambda: managers.build_returns_figure(df_top, 10)), close),
+        ('chart', 'products.heatmap', render_png(lambda: products.build_heatmap_figure(df_window, manager)), close),
+        ('chart', 'products.assets', render_png(lambda: products.build_assets_figure(df_window, manager)), close),
+        ('chart', 'periods.return_trend', render_png(lambda: periods.build_return_trend_figure(df_timeline)), close),
+        ('chart', 'timeseries.line', render_png(lambda: timeseries.build_timeseries_figure(
+            cube, manager, return_periods[0], average, show_legend=False)), close),
+
+        # AI 분석용 이미지 인코딩 (dpi 300 PNG -> base64)
+        ('ai', 'save_plot_as_base64.heatmap', lambda: save_plot_as_base64(encode_figure), None),
+    ]
+    return cases
+
+
+def print_case(name, stats):
+    print(f"  {name:<44} {stats['median_ms']:10.2f} ms", flush=True)
+
+
+def run_benchmarks(n_managers, n_products, n_dates, repeat=DEFAULT_REPEAT, seed=DEFAULT_SEED,
+                   workdir=None, only=None):
+    """합성 DB를 만들어 모든 항목을 측정하고 결과 딕셔너리를 반환하는 함수"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from synthetic_data import generate_returns, load_database, write_excel_files
+
+    keep_workdir = workdir is not None
+    workdir = Path(workdir or tempfile.mkdtemp(prefix='fund_bench_'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    original_cwd = Path.cwd()
+    # DB_FILE은 작업 디렉토리 기준 상대 경로: 앱 DB 대신 작업 디렉토리의 DB를 사용
+    os.chdir(workdir)
+    try:
+        if Path(workdir, 'fund_returns.db').exists():
+            os.remove(Path(workdir, 'fund_returns.db'))
+
+        started = time.perf_counter()
+        df = generate_returns(n_managers, n_products, n_dates, seed=seed)
+        generate_seconds = time.perf_counter() - started
+
+        # 마지막 기준일은 업로드 측정용으로 남겨 두고 나머지를 먼저 적재
+        last_date = df['asof_date'].max()
+        excel_path = write_excel_files(df[df['asof_date'] == last_date], workdir / 'xlsx')[last_date]
+        started = time.perf_counter()
+        load_database(df[df['asof_date'] < last_date])
+        load_seconds = time.perf_counter() - started
+
+        cases = {}
+        if not only or 'upload' in only:
+            cases.update(benchmark_upload(excel_path, last_date, repeat))
+            for name, stats in cases.items():
+                print_case(name, stats)
+        load_database(df[df['asof_date'] == last_date])
+
+        for group, name, func, teardown in build_cases(page_inputs(df)):
+            if only and group not in only:
+                continue
+            func()  # 워밍업 (지연 import, SQLite 페이지 캐시)
+            cases[f"{group}.{name}"] = time_case(func, repeat, teardown)
+            print_case(f"{group}.{name}", cases[f"{group}.{name}"])
+
+        return {
+            'version': RESULT_VERSION,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git': git_revision(),
+            'environment': environment_info(),
+            'dataset': {
+                'managers': n_managers,
+                'products_per_manager': n_products,
+                'dates': n_dates,
+                'seed': seed,
+                'rows': len(df),
+                'db_bytes': os.path.getsize('fund_returns.db'),
+                'generate_seconds': generate_seconds,
+                'load_seconds': load_seconds,
+            },
+            'cases': cases,
+        }
+    finally:
+        os.chdir(original_cwd)
+        if not keep_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare_results(baseline, current):
+    """두 결과의 항목별 중앙값을 비교해 (이름, 이전 ms, 현재 ms, 배수) 목록을 반환하는 함수"""
+    rows = []
+    for name in sorted(set(baseline['cases']) | set(current['cases'])):
+        before = baseline['cases'].get(name, {}).get('median_ms')
+        after = current['cases'].get(name, {}).get('median_ms')
+        ratio = after / before if before and after is not None else None
+        rows.append((name, before, after, ratio))
+    return rows
+
+
+def print_comparison(baseline, current, threshold=SLOWER_THRESHOLD):
+    """비교 결과를 표로 출력하고 느려진 항목 수를 반환하는 함수"""
+    def label(result):
+        commit = (result.get('git') or {}).get('commit') or 'unknown'
+        return commit[:8] + ('+' if (result.get('git') or {}).get('dirty') else '')
+
+    if baseline.get('dataset', {}).get('rows') != current.get('dataset', {}).get('rows'):
+        print("⚠️ 두 결과의 데이터 크기가 다릅니다. 같은 --size/--seed로 측정한 결과끼리 비교하세요.")
+
+    print(f"\n{'항목':<48}{label(baseline):>12}{label(current):>12}{'배수':>8}")
+    slower = 0
+    for name, before, after, ratio in compare_results(baseline, current):
+        mark = ''
+        if ratio is not None and ratio >= threshold:
+            mark = '  ▲ 느려짐'
+            slower += 1
+        elif ratio is not None and ratio <= 1 / threshold:
+            mark = '  ▼ 빨라짐'
+        cells = [f"{value:12.2f}" if value is not None else f"{'-':>12}" for value in (before, after)]
+        cells.append(f"{ratio:8.2f}" if ratio is not None else f"{'-':>8}")
+        print(f"{name:<48}{''.join(cells)}{mark}")
+    return slower
+
+
+def default_output_path(size_name):
+    """결과 파일 기본 경로 (benchmark_results/<커밋>-<크기>.json)"""
+    commit = git_revision()['commit'] or 'nogit'
+    return Path('benchmark_results') / f"{commit[:8]}-{size_name}.json"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="업로드/SQL/후처리/차트 성능 벤치마크")
+    parser.add_argument('--size', choices=list(BENCHMARK_SIZES), default='small', help="데이터 크기 프리셋")
+    parser.add_argument('--managers', type=int, help="운용사 수 (프리셋 대신)")
+    parser.add_argument('--products', type=int, help="운용사당 상품 수 (프리셋 대신)")
+    parser.add_argument('--dates', type=int, help="기준일 수 (프리셋 대신)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="항목별 반복 횟수")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="합성 데이터 seed")
+    parser.add_argument('--only', nargs='+', choices=['upload', 'sql', 'cache', 'pandas', 'chart', 'ai'], help="측정할 분류만")
+    parser.add_argument('--workdir', help="합성 DB를 둘 디렉토리 (기본: 임시 디렉토리, 끝나면 삭제)")
+    parser.add_argument('--out', help="결과 JSON 경로 (기본: benchmark_results/<커밋>-<크기>.json)")
+    parser.add_argument('--compare', nargs='+', metavar='JSON',
+                        help="이전 결과와 비교 (파일 2개를 주면 측정 없이 두 결과만 비교)")
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) >= 2:
+        before, after = (json.loads(Path(path).read_text(encoding='utf-8')) for path in args.compare[:2])
+        sys.exit(1 if print_comparison(before, after) else 0)
+
+    n_managers, n_products, n_dates = BENCHMARK_SIZES[args.size]
+    n_managers = args.managers or n_managers
+    n_products = args.products or n_products
+    n_dates = args.dates or n_dates
+    custom = any([args.managers, args.products, args.dates])
+    size_name = f"{n_managers}x{n_products}x{n_dates}" if custom else args.size
+
+    out_path = Path(args.out) if args.out else default_output_path(size_name)
+    workdir = Path(args.workdir).resolve() if args.workdir else None
+    sys.path.insert(0, str(BASE_DIR))
+
+    print(f"벤치마크: 운용사 {n_managers}개 x 상품 {n_products}개 x 기준일 {n_dates}개, 반복 {args.repeat}회")
+    result = run_benchmarks(n_managers, n_products, n_dates, args.repeat, args.seed, workdir, args.only)
+    result['dataset']['size'] = size_name
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n결과 저장: {out_path} ({len(result['cases'])}개 항목, {result['dataset']['rows']:,}행)")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare[0]).read_text(encoding='utf-8'))
+        print_comparison(baseline, result)
@@ -4,9 +4,59 @@ OPENAI_API_KEY = 'your_openai_api_key_here'
 
 # 데이터베이스 설정
 DB_FILE = "fund_returns.db"
-TABLE_NAME = "fund_returns"
+TABLE_NAME = "fund_returns"          # 기준일 x 상품 수익률 (fact 테이블)
+MANAGER_TABLE = "managers"           # 운용사 차원 테이블
+PRODUCT_TABLE = "products"           # 상품 차원 테이블
+NAMED_VIEW = "fund_returns_named"    # 운용사/상품명을 붙인 조회용 뷰
+METRICS_TABLE = "product_metrics"    # 상품별 위험/성과 지표 (업로드 후 재계산)
+SKETCH_TABLE = "return_sketches"     # 기준일 x 수익률 기간별 분포 요약 (히스토그램, 분위수)
+SEARCH_TABLE = "product_search"      # 상품/운용사 이름 FTS5 trigram 검색 색인 (products 트리거로 동기화)
+META_TABLE = "app_meta"              # 데이터 버전 등 앱 메타데이터 (쓰기마다 data_version 증가)
+VACUUM_STEP_PAGES = 2000             # 삭제 후 빈 페이지를 한 번에 돌려주는 최대 페이지 수 (incremental vacuum)
+
+# 오래된 기준일 보관 (archive.py, 기준일마다 압축 Parquet 파일 하나)
+ARCHIVE_DIR = "archive"                      # 보관 파일 폴더
+ARCHIVE_TABLE = "archive_snapshots"          # 보관된 기준일 목록
+ARCHIVE_PRODUCT_TABLE = "archive_products"   # 보관된 행이 가리키는 상품 (차원 정리에서 제외)
+ARCHIVE_AFTER_MONTHS = 36                    # 최근 기준일보다 이만큼(개월) 오래된 기준일을 보관 대상으로 표시
+ARCHIVE_COMPRESSION = "zstd"                 # Parquet 압축 방식
 
 # OpenAI API 설정
 OPENAI_MODEL = "gpt-4o"
 OPENAI_MAX_TOKENS = 1000
 OPENAI_TEMPERATURE = 0.3
+OPENAI_API_BASE = "https://api.openai.com/v1"   # 부하 테스트 시 로컬 mock 서버 주소로 변경
+OPENAI_TIMEOUT = 60          # 요청 한 번의 최대 대기 시간 (초)
+OPENAI_MAX_RETRIES = 2       # 429(요청 한도 초과) 응답 시 재시도 횟수
+
+# 성능 계측 내보내기 (None이면 파일로 내보내지 않음)
+PERF_METRICS_JSONL = "perf_metrics.jsonl"   # rerun마다 구간 기록 한 줄씩 추가
+PERF_METRICS_PROM = "perf_metrics.prom"     # Prometheus 텍스트 형식 누적값 (rerun마다 갱신)
+PERF_HISTORY_SIZE = 30                      # 관리자 성능 패널에 보관할 최근 rerun 수
+
+# 느린 쿼리 로그 (실행~결과 읽기 시간이 SLOW_QUERY_MS 이상이면 실행 계획과 함께 기록, None이면 파일 기록 안 함)
+SLOW_QUERY_MS = 100
+SLOW_QUERY_LOG = "slow_queries.jsonl"
+
+# 업로드 작업 (단일 쓰기 스레드에서 실행, 묶음마다 커밋해 읽기 세션이 오래 기다리지 않도록 함)
+UPLOAD_CHUNK_ROWS = 2000     # 한 번에 적재/커밋하는 행 수
+JOB_POLL_SECONDS = 1.0       # 업로드/삭제 작업 진행 상황 조회 주기 (초)
+WRITE_JOB_HISTORY = 20       # 보관하는 끝난 쓰기 작업 수
+
+# 분석 결과 내보내기 (export.py는 묶음 단위로 파일에 쓰지만, 다운로드 버튼은 파일 전체를 세션마다 서버 메모리에 올림)
+EXPORT_DOWNLOAD_MAX_MB = 200  # 다운로드 한 번에 메모리에 올리는 최대 파일 크기 (MB), 넘으면 내려주지 않고 기간을 줄이도록 안내
+
+# 세션 간 공유 조회 결과 캐시 (frame_cache.py, 쿼리 x data_version마다 한 벌, dtype 축소 후 저장)
+FRAME_CACHE_MB = 256         # 캐시 전체 메모리 예산 (MB), 넘으면 오래 쓰지 않은 결과부터 버림
+WARM_TOP_MANAGERS = 3        # 캐시 예열 때 상품별 분석을 미리 조회할 총 자산 상위 운용사 수 (0이면 안 함)
+
+# 읽기 전용 JSON API (api.py, 운용사별/상품별/기간별/시계열 집계, data_version + 조회 조건 ETag)
+API_HOST = "127.0.0.1"       # 로컬에서만 접근 (다른 호스트에 열려면 "0.0.0.0")
+API_PORT = None              # 포트를 정하면 앱 프로세스 안에서 함께 시작 (None이면 시작 안 함)
+
+# 상품 검색 (search.py, 시계열 수익률 화면의 검색창)
+SEARCH_LIMIT = 50            # 한 번에 보여 줄 최대 검색 결과 수
+
+# 업로드 검증 (validation.py)
+UPLOAD_MIN_RETURN = -100.0   # 이보다 작은 수익률(%)은 잘못된 값으로 거부
+UPLOAD_ROBUST_Z_LIMIT = 6.0  # |robust z-score|가 이보다 크면 이상치로 표시 (값은 저장)
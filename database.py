@@ -0,0 +1,563 @@
+# SQLite 데이터베이스 접근 모듈
+# 연결 생성, 테이블 초기화, 쿼리 실행, 데이터 적재를 한 곳에서 관리합니다.
+#
+# 스키마
+#   managers(manager_id, name)                    운용사 차원 테이블
+#   products(product_id, manager_id, name)        상품 차원 테이블
+#   fund_returns(asof_date, product_id, r_* ...)  기준일 x 상품 수익률 (PK: asof_date, product_id)
+#   fund_returns_named                            운용사/상품명을 붙인 조회용 뷰
+#   product_metrics(product_id, 지표 ...)          상품별 위험/성과 지표 (metrics.py에서 계산)
+#   return_sketches(asof_date, column_name, ...)  기준일별 분포 요약 (sketches.py에서 계산)
+#   product_search(product_name, manager)         상품/운용사 이름 FTS5 trigram 검색 색인 (search.py, 트리거로 동기화)
+#   app_meta(key, value)                          data_version 등 메타데이터
+#   archive_snapshots / archive_products          Parquet으로 보관한 기준일 목록 (archive.py)
+#
+# 오래된 기준일은 archive_snapshots()로 Parquet 파일에 옮기며, 조회 전용 연결(get_read_connection(): execute_sql_query,
+# 내보내기)은 쿼리가 그 기준일을 읽어야 할 때 보관 행을 연결에 붙여(archive.attach_archive) 기존 SQL 그대로 함께 조회합니다.
+#
+# 데이터를 바꾸는 함수(적재, 기준일 삭제/보관/되돌리기, 전체 초기화)는 같은 트랜잭션에서 data_version을 올립니다.
+# 조회 결과를 캐시하는 쪽은 이 값을 키에 넣어 데이터가 바뀌면 캐시를 버립니다.
+# get_data_version()은 캐시 조회마다 불리므로 프로세스에 하나 열어 둔 연결로 PRAGMA data_version만 확인하고,
+# 다른 연결(쓰기 스레드, 다른 프로세스)이 커밋했을 때만 app_meta를 다시 읽습니다.
+# 새 DB는 auto_vacuum=INCREMENTAL로 만들어 삭제 후 빈 페이지를 파일 크기에서 돌려줄 수 있게 합니다.
+import functools
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from config import (
+    DB_FILE, TABLE_NAME, MANAGER_TABLE, PRODUCT_TABLE, NAMED_VIEW, METRICS_TABLE, SKETCH_TABLE, META_TABLE,
+    ARCHIVE_TABLE, ARCHIVE_PRODUCT_TABLE, SEARCH_TABLE, UPLOAD_CHUNK_ROWS, VACUUM_STEP_PAGES,
+)
+from archive import ARCHIVE_SCHEMA_SQL, attach_archive, query_dates, read_archive, write_snapshot
+from metrics import METRICS_SCHEMA_SQL, refresh_metrics
+from perf import span, query_label
+from query_log import ObservedConnection
+from search import SEARCH_SCHEMA_SQL, rebuild_search_index, search_index_stale
+from sketches import SKETCH_SCHEMA_SQL, refresh_sketches
+
+# 수익률/총액 컬럼 (fact 테이블의 값 컬럼)
+VALUE_COLUMNS = ['r_1m', 'r_3m', 'r_6m', 'r_1y', 'r_2y', 'r_3y', 'since_inception', 'total_amount']
+
+# 적재용 레코드 튜플의 컬럼 순서
+RECORD_COLUMNS = ['asof_date', 'manager', 'product_name'] + VALUE_COLUMNS
+
+SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS {MANAGER_TABLE} (
+    manager_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS {PRODUCT_TABLE} (
+    product_id INTEGER PRIMARY KEY,
+    manager_id INTEGER NOT NULL REFERENCES {MANAGER_TABLE}(manager_id),
+    name TEXT NOT NULL,
+    UNIQUE (manager_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+    asof_date TEXT NOT NULL,
+    product_id INTEGER NOT NULL REFERENCES {PRODUCT_TABLE}(product_id),
+    r_1m REAL,
+    r_3m REAL,
+    r_6m REAL,
+    r_1y REAL,
+    r_2y REAL,
+    r_3y REAL,
+    since_inception REAL,
+    total_amount REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (asof_date, product_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_product ON {TABLE_NAME} (product_id, asof_date);
+
+CREATE VIEW IF NOT EXISTS {NAMED_VIEW} AS
+SELECT f.asof_date,
+       m.name AS manager,
+       p.name AS product_name,
+       f.product_id,
+       p.manager_id,
+       f.r_1m, f.r_3m, f.r_6m, f.r_1y, f.r_2y, f.r_3y,
+       f.since_inception, f.total_amount, f.created_at
+FROM {TABLE_NAME} f
+JOIN {PRODUCT_TABLE} p ON p.product_id = f.product_id
+JOIN {MANAGER_TABLE} m ON m.manager_id = p.manager_id;
+
+CREATE TABLE IF NOT EXISTS {META_TABLE} (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+""" + METRICS_SCHEMA_SQL + SKETCH_SCHEMA_SQL + ARCHIVE_SCHEMA_SQL + SEARCH_SCHEMA_SQL
+
+# 전체 초기화 때 지우고 다시 만드는 데이터 테이블/뷰 (app_meta는 data_version을 이어가야 하므로 제외)
+DATA_TABLES = [
+    SEARCH_TABLE, METRICS_TABLE, SKETCH_TABLE, ARCHIVE_TABLE, ARCHIVE_PRODUCT_TABLE, TABLE_NAME, PRODUCT_TABLE, MANAGER_TABLE,
+]
+
+DATA_VERSION_KEY = 'data_version'
+AUTO_VACUUM_INCREMENTAL = 2
+
+# data_version 읽기 전용 연결과 마지막으로 읽은 값
+_version_lock = threading.Lock()
+_version_state = {'file': None, 'conn': None, 'pragma': None, 'value': None}
+
+
+def _table_columns(cursor, table_name):
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    return [row[1] for row in cursor.fetchall()]
+
+
+def _migrate_legacy_table(conn):
+    """운용사/상품명 문자열을 행마다 저장하던 예전 테이블을 정규화 스키마로 옮기는 함수
+
+    이름 바꾸기부터 예전 테이블 삭제까지 한 트랜잭션에서 하며, 실패하면 되돌리고 예외를 다시 던집니다
+    (다음 시작 때 처음부터 다시 시도). 예전 버전이 중간에 멈춰 fund_returns_legacy만 남은 DB면
+    그 테이블에서 마저 옮기며, 그 사이 새로 적재된 행은 덮어쓰지 않습니다.
+    """
+    cursor = conn.cursor()
+    legacy_table = f"{TABLE_NAME}_legacy"
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        if 'manager' in _table_columns(cursor, TABLE_NAME):
+            cursor.execute(f"ALTER TABLE {TABLE_NAME} RENAME TO {legacy_table}")
+        for statement in _schema_statements():
+            cursor.execute(statement)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {MANAGER_TABLE} (name)
+            SELECT DISTINCT manager FROM {legacy_table}
+            WHERE manager IS NOT NULL AND product_name IS NOT NULL
+        """)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {PRODUCT_TABLE} (manager_id, name)
+            SELECT DISTINCT m.manager_id, l.product_name
+            FROM {legacy_table} l JOIN {MANAGER_TABLE} m ON m.name = l.manager
+            WHERE l.product_name IS NOT NULL
+        """)
+        # 같은 기준일에 중복 업로드된 행은 나중에 저장된 행(id가 큰 행)을 남깁니다.
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {TABLE_NAME} (asof_date, product_id, {', '.join(VALUE_COLUMNS)}, created_at)
+            SELECT l.asof_date, p.product_id, {', '.join('l.' + col for col in VALUE_COLUMNS)}, l.created_at
+            FROM {legacy_table} l
+            JOIN {MANAGER_TABLE} m ON m.name = l.manager
+            JOIN {PRODUCT_TABLE} p ON p.manager_id = m.manager_id AND p.name = l.product_name
+            WHERE l.asof_date IS NOT NULL
+            AND l.id IN (SELECT MAX(id) FROM {legacy_table} GROUP BY asof_date, manager, product_name)
+        """)
+        cursor.execute(f"DROP TABLE {legacy_table}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+# 데이터베이스 초기화 함수
+def init_database():
+    """SQLite 데이터베이스와 테이블을 초기화하는 함수"""
+    try:
+        conn = sqlite3.connect(DB_FILE)
+        cursor = conn.cursor()
+
+        # 빈 DB 파일이면 테이블을 만들기 전에 incremental auto-vacuum 지정 (기존 파일은 reclaim_space에서 변환)
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
+        # 예전(비정규화) 스키마나 중간에 멈춘 변환의 예전 테이블이 남아 있으면 먼저 변환
+        migrated = False
+        if 'manager' in _table_columns(cursor, TABLE_NAME) or _table_columns(cursor, f"{TABLE_NAME}_legacy"):
+            _migrate_legacy_table(conn)
+            migrated = True
+
+        # 테이블/인덱스/뷰 생성
+        cursor.executescript(SCHEMA_SQL)
+
+        # 변환 직후이거나 지표/스케치 테이블이 비어 있으면 (도입 전 DB) 기존 이력으로 채움
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {METRICS_TABLE})")
+        if migrated or not cursor.fetchone()[0]:
+            refresh_metrics(conn)
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {SKETCH_TABLE})")
+        if migrated or not cursor.fetchone()[0]:
+            refresh_sketches(conn)
+        # 검색 색인은 트리거가 채우므로 색인 도입 전 DB일 때만 다시 만듦
+        if search_index_stale(cursor):
+            rebuild_search_index(conn)
+        conn.commit()
+
+        # 변환으로 비워진 페이지 정리
+        if migrated:
+            conn.execute("VACUUM")
+        conn.close()
+    except Exception as e:
+        pass
+
+
+# 데이터베이스 연결 함수
+def get_db_connection():
+    """SQLite 데이터베이스 연결을 반환하는 함수 (쿼리 시간/실행 계획을 query_log에 기록)"""
+    return sqlite3.connect(DB_FILE, factory=ObservedConnection)
+
+
+def get_read_connection(query, params=None):
+    """query를 실행할 조회 전용 연결을 반환하는 함수
+
+    쿼리가 보관된 기준일을 읽어야 하면 그 기준일의 보관 행을 연결에 붙여 둡니다 (연결은 호출한 쪽에서 닫음).
+    """
+    conn = get_db_connection()
+    try:
+        attach_archive(conn, query_dates(conn, query, params))
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+# SQLite 쿼리 실행 함수 (pandas 경고 해결)
+def execute_sql_query(query, params=None):
+    """SQLite 쿼리를 실행하고 DataFrame을 반환하는 함수 (성능 계측 구간 'sql')
+
+    쿼리가 보관된 기준일을 읽어야 하면 그 기준일의 보관 행을 연결에 붙인 뒤 실행합니다.
+    """
+    with span('sql', query_label(query)) as info:
+        conn = get_read_connection(query, params)
+        try:
+            if params:
+                df = pd.read_sql_query(query, conn, params=params)
+            else:
+                df = pd.read_sql_query(query, conn)
+            info['rows'] = len(df)
+            return df
+        finally:
+            conn.close()
+
+
+def resolve_product_ids(cursor, pairs):
+    """(운용사, 상품명) 쌍을 product_id로 일괄 변환하는 함수
+
+    처음 보는 운용사/상품은 차원 테이블에 추가합니다.
+    반환값: {(운용사, 상품명): product_id}
+    """
+    pairs = set(pairs)
+    manager_names = {manager for manager, _ in pairs}
+
+    cursor.executemany(
+        f"INSERT OR IGNORE INTO {MANAGER_TABLE} (name) VALUES (?)",
+        [(name,) for name in manager_names]
+    )
+    cursor.execute(f"SELECT name, manager_id FROM {MANAGER_TABLE}")
+    manager_ids = dict(cursor.fetchall())
+
+    cursor.executemany(
+        f"INSERT OR IGNORE INTO {PRODUCT_TABLE} (manager_id, name) VALUES (?, ?)",
+        [(manager_ids[manager], product_name) for manager, product_name in pairs]
+    )
+    cursor.execute(f"SELECT manager_id, name, product_id FROM {PRODUCT_TABLE}")
+    id_to_manager = {manager_id: name for name, manager_id in manager_ids.items()}
+    return {
+        (id_to_manager[manager_id], name): product_id
+        for manager_id, name, product_id in cursor.fetchall()
+        if (id_to_manager.get(manager_id), name) in pairs
+    }
+
+
+def ingest_records(conn, records):
+    """RECORD_COLUMNS 순서의 레코드 튜플을 정규화 스키마에 적재하는 함수
+
+    운용사/상품명이 없는 행은 키를 만들 수 없으므로 건너뜁니다. 같은 기준일에
+    같은 상품이 다시 들어오면 값을 덮어씁니다. 반환값: (적재 건수, 건너뛴 건수)
+    """
+    valid = [record for record in records if record[0] and record[1] and record[2]]
+    skipped = len(records) - len(valid)
+    if not valid:
+        return 0, skipped
+
+    cursor = conn.cursor()
+    product_ids = resolve_product_ids(cursor, ((record[1], record[2]) for record in valid))
+
+    upsert_sql = f"""
+        INSERT INTO {TABLE_NAME} (asof_date, product_id, {', '.join(VALUE_COLUMNS)})
+        VALUES (?, ?, {', '.join(['?'] * len(VALUE_COLUMNS))})
+        ON CONFLICT (asof_date, product_id) DO UPDATE SET
+            {', '.join(f'{col} = excluded.{col}' for col in VALUE_COLUMNS)},
+            created_at = CURRENT_TIMESTAMP
+    """
+    cursor.executemany(
+        upsert_sql,
+        ((record[0], product_ids[(record[1], record[2])]) + tuple(record[3:]) for record in valid)
+    )
+    bump_data_version(cursor)
+    return len(valid), skipped
+
+
+
+def ingest_in_chunks(conn, records, chunk_rows=UPLOAD_CHUNK_ROWS, on_progress=None):
+    """레코드를 chunk_rows개씩 적재하고 묶음마다 커밋하는 함수
+
+    쓰기 잠금을 묶음 하나를 적재하는 동안만 잡으므로 큰 파일을 올리는 중에도 다른 세션의
+    조회가 오래 막히지 않습니다. 같은 기준일/상품은 덮어쓰므로 중간에 실패해도 다시 올리면 됩니다.
+    on_progress(처리한 행 수, 전체 행 수)는 묶음마다 호출됩니다. 반환값: (적재 건수, 건너뛴 건수)
+    """
+    saved = skipped = 0
+    for start in range(0, len(records), chunk_rows):
+        chunk = records[start:start + chunk_rows]
+        chunk_saved, chunk_skipped = ingest_records(conn, chunk)
+        conn.commit()
+        saved += chunk_saved
+        skipped += chunk_skipped
+        if on_progress:
+            on_progress(start + len(chunk), len(records))
+    return saved, skipped
+
+
+def bump_data_version(cursor):
+    """data_version을 1 올리는 함수 (데이터를 바꾸는 트랜잭션 안에서 호출)"""
+    cursor.execute(
+        f"INSERT INTO {META_TABLE} (key, value) VALUES (?, 1) "
+        f"ON CONFLICT (key) DO UPDATE SET value = value + 1",
+        (DATA_VERSION_KEY,)
+    )
+
+
+def _read_data_version(conn):
+    row = conn.execute(f"SELECT value FROM {META_TABLE} WHERE key = ?", (DATA_VERSION_KEY,)).fetchone()
+    return row[0] if row else 0
+
+
+def get_data_version(conn=None):
+    """현재 data_version을 반환하는 함수 (기록이 없으면 0)
+
+    conn을 주면 그 연결(열린 트랜잭션 포함)에서 읽습니다. 주지 않으면 프로세스에 하나 열어 둔 연결의
+    PRAGMA data_version이 그대로일 때 마지막으로 읽은 값을 돌려줍니다 (연결을 새로 열지 않음).
+    """
+    if conn is not None:
+        return _read_data_version(conn)
+
+    with _version_lock:
+        try:
+            stat = os.stat(DB_FILE)
+        except OSError:
+            return 0
+        # DB_FILE은 상대 경로이므로 작업 디렉토리가 바뀌거나 파일을 새로 만들면 다시 연결
+        file_id = (os.path.abspath(DB_FILE), stat.st_dev, stat.st_ino)
+        if _version_state['file'] != file_id:
+            if _version_state['conn'] is not None:
+                _version_state['conn'].close()
+            _version_state.update(file=file_id, conn=sqlite3.connect(DB_FILE, check_same_thread=False),
+                                  pragma=None, value=None)
+        conn = _version_state['conn']
+        pragma = conn.execute("PRAGMA data_version").fetchone()[0]
+        if pragma != _version_state['pragma'] or _version_state['value'] is None:
+            _version_state.update(pragma=pragma, value=_read_data_version(conn))
+        return _version_state['value']
+
+
+def prune_dimensions(cursor):
+    """적재되거나 보관된 기준일이 하나도 없는 상품/운용사를 차원 테이블에서 지우는 함수"""
+    cursor.execute(f"""
+        DELETE FROM {PRODUCT_TABLE}
+        WHERE NOT EXISTS (SELECT 1 FROM {TABLE_NAME} f WHERE f.product_id = {PRODUCT_TABLE}.product_id)
+        AND product_id NOT IN (SELECT product_id FROM {ARCHIVE_PRODUCT_TABLE})
+    """)
+    cursor.execute(f"""
+        DELETE FROM {MANAGER_TABLE}
+        WHERE NOT EXISTS (SELECT 1 FROM {PRODUCT_TABLE} p WHERE p.manager_id = {MANAGER_TABLE}.manager_id)
+    """)
+
+
+def refresh_archive_products(conn):
+    """archive_products를 보관 목록에 남은 기준일 파일이 가리키는 상품으로 다시 채우는 함수 (호출한 쪽에서 commit)"""
+    product_ids = read_archive(conn, columns=['product_id'])['product_id'].unique()
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {ARCHIVE_PRODUCT_TABLE}")
+    cursor.executemany(f"INSERT INTO {ARCHIVE_PRODUCT_TABLE} (product_id) VALUES (?)",
+                       ((int(product_id),) for product_id in product_ids))
+
+
+def delete_snapshots(conn, asof_dates, refresh=True):
+    """기준일 데이터와 그 기준일의 분포 요약을 삭제하는 함수
+
+    fund_returns는 (asof_date, product_id)가 기본 키라서 기준일 조건 삭제는 키 범위만 읽습니다.
+    보관된 기준일은 목록에서 빼고 archive_products를 남은 보관 기준일로 다시 채우며(삭제한 기준일에만 있던
+    상품도 차원 정리 대상이 되도록), 파일은 커밋 뒤 archive.remove_unlisted_files()가 지웁니다.
+    refresh=True면 빈 차원 정리와 위험/성과 지표 재계산까지 합니다 (같은 기준일을 바로 다시
+    적재하는 교체 업로드는 적재 후에 한 번만 하도록 False로 호출).
+    호출한 쪽에서 commit 합니다. 반환값: 삭제된 레코드 수
+    """
+    asof_dates = list(dict.fromkeys(asof_dates))
+    if not asof_dates:
+        return 0
+    placeholders = ','.join(['?'] * len(asof_dates))
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE asof_date IN ({placeholders})", asof_dates)
+    deleted_count = cursor.rowcount
+    cursor.execute(f"SELECT COALESCE(SUM(row_count), 0) FROM {ARCHIVE_TABLE} WHERE asof_date IN ({placeholders})",
+                   asof_dates)
+    deleted_count += cursor.fetchone()[0]
+    cursor.execute(f"DELETE FROM {ARCHIVE_TABLE} WHERE asof_date IN ({placeholders})", asof_dates)
+    if cursor.rowcount:
+        refresh_archive_products(conn)
+    cursor.execute(f"DELETE FROM {SKETCH_TABLE} WHERE asof_date IN ({placeholders})", asof_dates)
+    if refresh:
+        prune_dimensions(cursor)
+        refresh_metrics(conn)
+    bump_data_version(cursor)
+    return deleted_count
+
+
+def archive_snapshots(conn, asof_dates, on_progress=None):
+    """기준일 데이터를 Parquet 파일로 옮기고 fund_returns에서 지우는 함수 (기준일마다 커밋)
+
+    분포 요약(return_sketches)과 위험/성과 지표는 그대로 두며, 옮긴 행은 execute_sql_query()와
+    refresh_metrics()가 보관 파일에서 함께 읽습니다. on_progress(처리한 기준일 수, 전체 기준일 수)는
+    기준일마다 호출됩니다. 반환값: 옮긴 레코드 수
+    """
+    asof_dates = sorted(set(asof_dates))
+    cursor = conn.cursor()
+    archived_count = 0
+    for index, asof_date in enumerate(asof_dates, start=1):
+        df = pd.read_sql_query(f"SELECT * FROM {TABLE_NAME} WHERE asof_date = ?", conn, params=[asof_date])
+        if not df.empty:
+            # 이미 보관된 기준일이면 기존 보관 행에 합침 (같은 상품은 지금 값 우선)
+            existing = read_archive(conn, asof_dates=[asof_date])
+            if not existing.empty:
+                df = pd.concat([existing[~existing['product_id'].isin(df['product_id'])], df], ignore_index=True)
+            file_name = write_snapshot(df, asof_date)
+            cursor.execute(
+                f"INSERT INTO {ARCHIVE_TABLE} (asof_date, file_name, row_count, archived_at) VALUES (?, ?, ?, ?) "
+                f"ON CONFLICT (asof_date) DO UPDATE SET file_name = excluded.file_name, "
+                f"row_count = excluded.row_count, archived_at = excluded.archived_at",
+                (asof_date, file_name, len(df), datetime.now().isoformat(sep=' '))
+            )
+            cursor.execute(
+                f"INSERT OR IGNORE INTO {ARCHIVE_PRODUCT_TABLE} (product_id) "
+                f"SELECT product_id FROM {TABLE_NAME} WHERE asof_date = ?",
+                (asof_date,)
+            )
+            cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE asof_date = ?", (asof_date,))
+            archived_count += cursor.rowcount
+            bump_data_version(cursor)
+            conn.commit()
+        if on_progress:
+            on_progress(index, len(asof_dates))
+    return archived_count
+
+
+def restore_snapshots(conn, asof_dates):
+    """보관된 기준일 데이터를 fund_returns로 되돌리는 함수
+
+    같은 기준일/상품이 이미 적재되어 있으면 적재된 값을 남기고, archive_products는 남은 보관 기준일로 다시 채웁니다. 파일은 커밋 뒤
+    archive.remove_unlisted_files()가 지웁니다. 호출한 쪽에서 commit 합니다. 반환값: 되돌린 레코드 수
+    """
+    df = read_archive(conn, asof_dates=asof_dates)
+    if df.empty:
+        return 0
+    columns = list(df.columns)
+    rows = df.astype(object).where(df.notna(), None)
+    cursor = conn.cursor()
+    cursor.executemany(
+        f"INSERT INTO {TABLE_NAME} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))}) "
+        f"ON CONFLICT (asof_date, product_id) DO NOTHING",
+        rows.itertuples(index=False, name=None)
+    )
+    restored_count = cursor.rowcount
+    placeholders = ','.join(['?'] * len(asof_dates))
+    cursor.execute(f"DELETE FROM {ARCHIVE_TABLE} WHERE asof_date IN ({placeholders})", list(asof_dates))
+    refresh_archive_products(conn)
+    bump_data_version(cursor)
+    return restored_count
+
+
+def _schema_statements():
+    """SCHEMA_SQL을 문장 단위로 나누는 함수 (트랜잭션 안에서 하나씩 실행하기 위해)"""
+    statements, current = [], ''
+    for line in SCHEMA_SQL.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ''
+    return [statement for statement in statements if statement]
+
+
+def truncate_all(conn):
+    """모든 데이터 테이블을 지우고 빈 테이블로 다시 만드는 함수 (한 트랜잭션에서 커밋까지)
+
+    행을 하나씩 지우는 DELETE 대신 테이블을 통째로 DROP하므로 큰 DB에서도 빠르며,
+    비워진 페이지는 reclaim_space()로, 보관 파일은 archive.remove_unlisted_files()로 정리합니다.
+    반환값: 삭제된 레코드 수 (보관된 행 포함)
+    """
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute(f"SELECT (SELECT COUNT(*) FROM {TABLE_NAME}) + "
+                       f"(SELECT COALESCE(SUM(row_count), 0) FROM {ARCHIVE_TABLE})")
+        deleted_count = cursor.fetchone()[0]
+        cursor.execute(f"DROP VIEW IF EXISTS {NAMED_VIEW}")
+        for table in DATA_TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+        for statement in _schema_statements():
+            cursor.execute(statement)
+        bump_data_version(cursor)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return deleted_count
+
+
+def reclaim_space(conn, step_pages=VACUUM_STEP_PAGES):
+    """삭제로 생긴 빈 페이지를 DB 파일에서 돌려주는 함수 (반환값: 돌려준 바이트 수)
+
+    incremental auto-vacuum DB는 step_pages씩 나눠 돌려주어 쓰기 잠금을 짧게 잡습니다.
+    예전에 만든(auto_vacuum 없음) DB는 이번에 한 번 VACUUM 해서 incremental 방식으로 바꾸고,
+    파일의 절반 넘게 비어 있을 때도 VACUUM 합니다.
+    열린 트랜잭션이 없는 상태에서 호출해야 합니다.
+    """
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages_before = conn.execute("PRAGMA page_count").fetchone()[0]
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL or free_pages * 2 > pages_before:
+        # 파일 대부분이 빈 페이지면(전체 초기화 직후 등) 남은 데이터만 복사하는 VACUUM이 더 빠름
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+    else:
+        while free_pages:
+            # 결과 행을 다 읽어야 요청한 페이지 수만큼 진행됨
+            conn.execute(f"PRAGMA incremental_vacuum({int(step_pages)})").fetchall()
+            remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if remaining >= free_pages:
+                break
+            free_pages = remaining
+    return (pages_before - conn.execute("PRAGMA page_count").fetchone()[0]) * page_size
+
+
+# 데이터베이스 초기화 (강화된 보호 로직)
+# rerun마다 sqlite_master를 조회하지 않도록 프로세스당 한 번만 실행합니다.
+@functools.lru_cache(maxsize=None)
+def bootstrap_database():
+    """DB 파일과 테이블 존재 여부를 프로세스당 한 번만 확인하는 함수"""
+    if not os.path.exists(DB_FILE):
+        init_database()
+        return True
+
+    # DB 파일이 존재하면 스키마 상태만 확인
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        # 테이블/뷰 존재 여부와 예전 스키마 여부 확인
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name IN (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (TABLE_NAME, MANAGER_TABLE, PRODUCT_TABLE, NAMED_VIEW, METRICS_TABLE, SKETCH_TABLE, META_TABLE,
+             ARCHIVE_TABLE, ARCHIVE_PRODUCT_TABLE, SEARCH_TABLE)
+        )
+        schema_complete = cursor.fetchone()[0] == 10
+        legacy_schema = 'manager' in _table_columns(cursor, TABLE_NAME)
+        conn.close()
+
+        if not schema_complete or legacy_schema:
+            init_database()
+
+    except Exception as e:
+        init_database()
+    return True
@@ -0,0 +1,79 @@
+# 시계열 라인 차트용 다운샘플링 (LTTB: Largest-Triangle-Three-Buckets)
+# 기준일이 많이 쌓여도 차트 하나에 그리는 점 수를 POINT_BUDGET 안으로 줄입니다.
+# LTTB는 구간마다 앞뒤 점과 만드는 삼각형 넓이가 가장 큰 점을 고르므로
+# 고점/저점 같은 눈에 띄는 모양이 유지됩니다. 점 수가 예산 이하이면 원본을 그대로 씁니다.
+import numpy as np
+import pandas as pd
+
+POINT_BUDGET = 600           # 차트 하나에 그리는 최대 점 수 (모든 라인 합계)
+MIN_POINTS_PER_LINE = 50     # 라인이 많아도 라인당 최소한 남기는 점 수
+
+
+def points_per_line(n_lines, budget=POINT_BUDGET):
+    """차트 점 예산을 라인 수로 나눈 라인당 최대 점 수를 반환하는 함수"""
+    return max(MIN_POINTS_PER_LINE, budget // max(n_lines, 1))
+
+
+def to_plot_dates(dates):
+    """기준일 문자열 배열을 날짜 축에 쓸 datetime64 배열로 바꾸는 함수
+
+    문자열을 그대로 그리면 matplotlib이 범주형 축으로 처리해 라인마다 기준일이 다를 때
+    순서가 섞이므로, 날짜형으로 바꿔 모든 라인이 같은 시간 축을 쓰게 합니다.
+    """
+    return pd.to_datetime(np.asarray(dates)).to_numpy()
+
+
+def lttb_indices(x, y, threshold):
+    """LTTB로 남길 점의 인덱스를 고르는 함수 (x는 오름차순 숫자 배열, NaN 없음)"""
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # 첫/마지막 점을 뺀 나머지를 threshold-2개 구간으로 나눔
+    edges = (np.arange(threshold - 1) * (n - 2) / (threshold - 2)).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 구간의 평균점 (마지막 구간 다음은 마지막 점)
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_line(x, y, max_points):
+    """라인 하나를 max_points 이하로 줄이는 함수
+
+    x는 datetime64 또는 숫자 배열. 반환값: (x, y, 줄였는지 여부)
+    점 수가 max_points 이하이면 원본을 그대로 반환합니다.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    if len(x) <= max_points:
+        return x, y, False
+
+    # 값이 없는 점은 빼고 고름 (원본에서도 선이 끊기는 지점)
+    valid = ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    if len(x) <= max_points:
+        return x, y, True
+
+    x_numeric = x.astype('datetime64[ns]').astype(np.int64) if np.issubdtype(x.dtype, np.datetime64) else x
+    keep = lttb_indices(x_numeric, y, max_points)
+    return x[keep], y[keep], True
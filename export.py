@@ -0,0 +1,124 @@
+# 분석 결과 내보내기 (CSV / Excel)
+# 조회 결과를 DataFrame으로 모으지 않고 SQLite 커서에서 fetchmany로 조금씩 읽어
+# 바로 파일에 씁니다. 파일을 쓰는 동안은 결과 크기와 관계없이 메모리에 한 묶음(EXPORT_CHUNK_ROWS)만 올라갑니다
+# (화면의 다운로드 버튼은 만든 파일 전체를 메모리에 올림, views/export_panel.py 참고).
+#   - CSV  : 묶음 단위로 문자열을 만들어 씀 (iter_csv_chunks는 스트리밍 응답에도 그대로 사용 가능)
+#   - Excel: openpyxl write-only 모드 (행을 디스크 임시 파일로 흘려보냄), 시트당 최대 행 수를 넘으면 다음 시트
+import csv
+import io
+import os
+import tempfile
+
+from database import get_read_connection
+
+EXPORT_CHUNK_ROWS = 5000
+EXCEL_MAX_ROWS = 1048576      # 엑셀 시트 최대 행 수 (헤더 포함)
+
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'Excel': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+
+def iter_rows(conn, query, params=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """쿼리 결과를 (헤더, 행 묶음 이터레이터)로 반환하는 함수"""
+    cursor = conn.cursor()
+    cursor.execute(query, params or [])
+    header = [column[0] for column in cursor.description]
+
+    def chunks():
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    return header, chunks()
+
+
+def iter_csv_chunks(conn, query, params=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """쿼리 결과를 CSV 바이트 묶음으로 하나씩 만들어 내는 제너레이터
+
+    엑셀에서 한글이 깨지지 않도록 첫 묶음에 UTF-8 BOM을 붙입니다.
+    """
+    header, chunks = iter_rows(conn, query, params, chunk_rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8')
+
+    for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+
+
+def write_csv(conn, query, params, fileobj):
+    """쿼리 결과를 CSV로 파일 객체(바이너리)에 쓰고 데이터 행 수를 반환하는 함수"""
+    header, chunks = iter_rows(conn, query, params)
+    text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+    writer = csv.writer(text)
+    writer.writerow(header)
+    row_count = 0
+    for rows in chunks:
+        writer.writerows(rows)
+        row_count += len(rows)
+    text.flush()
+    text.detach()
+    return row_count
+
+
+def write_xlsx(conn, query, params, fileobj, sheet_title='data'):
+    """쿼리 결과를 openpyxl write-only 모드로 엑셀 파일에 쓰고 데이터 행 수를 반환하는 함수"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    header, chunks = iter_rows(conn, query, params)
+
+    sheet_number = 0
+    sheet = None
+    sheet_rows = EXCEL_MAX_ROWS
+    row_count = 0
+    for rows in chunks:
+        for row in rows:
+            if sheet_rows >= EXCEL_MAX_ROWS:
+                sheet_number += 1
+                sheet = workbook.create_sheet(title=sheet_title if sheet_number == 1 else f"{sheet_title}_{sheet_number}")
+                sheet.append(header)
+                sheet_rows = 1
+            sheet.append(row)
+            sheet_rows += 1
+            row_count += 1
+
+    if sheet is None:
+        workbook.create_sheet(title=sheet_title).append(header)
+    workbook.save(fileobj)
+    return row_count
+
+
+def export_to_file(query, params, export_format='CSV', directory=None):
+    """쿼리 결과를 임시 파일로 내보내고 (파일 경로, 행 수)를 반환하는 함수 (보관된 기준일 행 포함)"""
+    extension, _ = EXPORT_FORMATS[export_format]
+    fd, path = tempfile.mkstemp(suffix=f'.{extension}', prefix='fund_export_', dir=directory)
+    try:
+        conn = get_read_connection(query, params)
+    except Exception:
+        os.close(fd)
+        os.remove(path)
+        raise
+    try:
+        with os.fdopen(fd, 'wb') as fileobj:
+            if export_format == 'Excel':
+                row_count = write_xlsx(conn, query, params, fileobj)
+            else:
+                row_count = write_csv(conn, query, params, fileobj)
+    except Exception:
+        os.remove(path)
+        raise
+    finally:
+        conn.close()
+    return path, row_count
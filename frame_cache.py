@@ -0,0 +1,140 @@
+# 프로세스 공유 DataFrame 캐시
+# 같은 (쿼리, 파라미터, data_version) 조회 결과를 세션마다 따로 들고 있지 않도록 프로세스에 한 벌만 둡니다.
+#   - 상품별 원본 수익률 컬럼(r_1m ~ since_inception)은 float32, 정수는 가장 작은 정수형,
+#     반복되는 문자열 컬럼(운용사/상품명/기준일)은 category로 줄여 저장
+#     (평균/총 자산 같은 집계와 금액, 스케치 합계는 화면/AI 표/API에 그대로 나가므로 float64 유지)
+#   - 캐시 전체 크기가 FRAME_CACHE_MB를 넘으면 가장 오래 쓰지 않은 결과부터 버림 (LRU)
+#   - data_version이 바뀌면 이전 버전 결과는 다시 쓰이지 않으므로 새 결과를 넣을 때 먼저 버림
+# 조회 결과로 다시 계산한 결과(기준일 비교 등)도 cached_result()로 같은 예산/버전 규칙 아래 둡니다.
+# warmer.py가 업로드 뒤/메뉴 이동 때 기본 화면의 결과를 warm_frame()으로 미리 넣어 둡니다.
+# 세션은 frame_key()로 만든 키만 session_state에 두고 그릴 때마다 load_frame(key)로 받습니다
+# (버려졌거나 데이터가 바뀌었으면 그때 다시 조회).
+# 돌려주는 DataFrame은 여러 세션이 함께 읽는 공유본이므로 제자리 수정하지 말고 복사해서 바꿔야 합니다.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from config import FRAME_CACHE_MB
+from database import execute_sql_query, get_data_version
+
+# float32로 줄이는 컬럼 (상품별 원본 수익률, 행 수가 가장 많은 시계열/상품 조회의 대부분)
+FLOAT32_COLUMNS = {'r_1m', 'r_3m', 'r_6m', 'r_1y', 'r_2y', 'r_3y', 'since_inception'}
+
+# 고유값 비율이 이 이하인 문자열 컬럼만 category로 변환 (대부분 다른 값이면 오히려 커짐)
+CATEGORY_MAX_RATIO = 0.5
+
+_lock = threading.Lock()
+_frames = OrderedDict()       # (data_version, 쿼리, 파라미터) -> (DataFrame, 바이트 수), 최근 사용 순
+_stats = {'hits': 0, 'misses': 0, 'warmed': 0, 'evictions': 0, 'bytes': 0}
+
+
+def frame_key(query, params=None):
+    """캐시 키(쿼리, 파라미터 튜플)를 만드는 함수 (session_state에는 이 키만 저장)"""
+    return (query, tuple(params or ()))
+
+
+def compact_frame(df):
+    """조회 결과 DataFrame의 컬럼 dtype을 줄인 새 DataFrame을 반환하는 함수"""
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_float_dtype(series) and column in FLOAT32_COLUMNS:
+            series = series.astype(np.float32)
+        elif pd.api.types.is_integer_dtype(series):
+            series = pd.to_numeric(series, downcast='integer')
+        elif series.dtype == object and len(series) and series.nunique() <= len(series) * CATEGORY_MAX_RATIO:
+            series = series.astype('category')
+        columns[column] = series
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _evict(cache_key):
+    _, size = _frames.pop(cache_key)
+    _stats['bytes'] -= size
+    _stats['evictions'] += 1
+
+
+def _query(key):
+    query, params = key
+    return compact_frame(execute_sql_query(query, params=list(params) or None))
+
+
+def _store(cache_key, df):
+    """조회 결과를 캐시에 넣고 캐시에 남은 결과를 반환하는 함수 (_lock 안에서 호출)"""
+    for stale_key in [k for k in _frames if k[0] != cache_key[0]]:
+        _evict(stale_key)
+    if cache_key in _frames:
+        # 다른 세션이 먼저 같은 결과를 넣었으면 그것을 공유
+        _frames.move_to_end(cache_key)
+        return _frames[cache_key][0]
+    size = int(df.memory_usage(deep=True).sum())
+    _frames[cache_key] = (df, size)
+    _stats['bytes'] += size
+    # 예산을 넘으면 오래된 결과부터 버림 (방금 넣은 결과 하나는 예산보다 커도 남김)
+    while _stats['bytes'] > FRAME_CACHE_MB * 1024 * 1024 and len(_frames) > 1:
+        _evict(next(iter(_frames)))
+    return df
+
+
+def _load(key, compute):
+    cache_key = (get_data_version(),) + key
+    with _lock:
+        entry = _frames.get(cache_key)
+        if entry is not None:
+            _frames.move_to_end(cache_key)
+            _stats['hits'] += 1
+            return entry[0]
+
+    df = compute()
+    with _lock:
+        _stats['misses'] += 1
+        return _store(cache_key, df)
+
+
+def load_frame(key):
+    """frame_key()로 만든 키의 조회 결과를 반환하는 함수 (캐시에 없거나 데이터가 바뀌었으면 다시 조회)"""
+    return _load(key, lambda: _query(key))
+
+
+def warm_frame(key):
+    """키의 조회 결과가 캐시에 없을 때만 조회해 넣는 함수 (예열용, 적중/미스 통계에는 넣지 않음)
+
+    반환값: (캐시에 있는 DataFrame, 새로 조회했는지 여부)
+    """
+    cache_key = (get_data_version(),) + key
+    with _lock:
+        entry = _frames.get(cache_key)
+        if entry is not None:
+            return entry[0], False
+    df = _query(key)
+    with _lock:
+        _stats['warmed'] += 1
+        return _store(cache_key, df), True
+
+
+def cached_query(query, params=None):
+    """execute_sql_query와 같지만 결과를 공유 캐시에서 꺼내는 함수 (돌려받은 DataFrame은 읽기 전용으로 사용)"""
+    return load_frame(frame_key(query, params))
+
+
+def cached_result(name, params, build):
+    """build()로 계산한 DataFrame을 (name, params, data_version) 키로 공유 캐시에 두는 함수
+
+    캐시에 없거나 데이터가 바뀌었을 때만 build()를 호출합니다. 돌려받은 DataFrame은 읽기 전용으로 사용합니다.
+    """
+    return _load((name, tuple(params)), lambda: compact_frame(build()))
+
+
+def cache_stats():
+    """캐시 상태 {entries, bytes, budget_bytes, hits, misses, warmed, evictions}를 반환하는 함수"""
+    with _lock:
+        return dict(_stats, entries=len(_frames), budget_bytes=FRAME_CACHE_MB * 1024 * 1024)
+
+
+def clear_cache():
+    """캐시를 모두 비우는 함수 (테스트/벤치마크용)"""
+    with _lock:
+        _frames.clear()
+        _stats.update(hits=0, misses=0, warmed=0, evictions=0, bytes=0)
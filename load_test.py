@@ -0,0 +1,372 @@
+# 다중 세션 부하 테스트
+# 여러 사용자가 동시에 앱을 쓰는 상황을 흉내 냅니다.
+#   - 세션마다 프로세스 하나를 띄워 Streamlit AppTest로 실제 app.py 페이지를 차례로 열고 "실행" 버튼을 누릅니다
+#   - 시계열 수익률 페이지는 AI 분석을 켜고 실행하며, OpenAI 호출은 mock_openai.py의 로컬 서버로 보냅니다
+#     (응답 지연과 429 비율 설정 가능)
+#   - 선택적으로 쓰기 프로세스가 업로드와 같은 적재(BEGIN IMMEDIATE ~ 커밋)를 반복해 잠금 경합을 만듭니다
+# 결과로 페이지별 rerun 지연 백분위수, SQLite 잠금 대기 시간, 세션 프로세스별 메모리를 출력합니다.
+# 앱의 DB 파일(fund_returns.db)은 건드리지 않고 임시 작업 디렉토리의 합성 DB를 사용합니다.
+#
+# 사용 예
+#   python load_test.py --sessions 4 --iterations 2
+#   python load_test.py --sessions 8 --writers 1 --latency 2 --rate-429 0.2 --out load_results.json
+#   python load_test.py --db /path/to/fund_returns.db --pages "📊 상품별 분석" "📅 기간별 분석"
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+
+# 세션이 차례로 여는 페이지 (업로드/초기화 페이지는 데이터를 바꾸므로 제외)
+DEFAULT_PAGES = [
+    "🏠 메인 화면",
+    "📈 수익률 분석",
+    "🏢 운용사별 분석",
+    "📊 상품별 분석",
+    "📅 기간별 분석",
+    "📈 시계열 수익률",
+    "🔀 기준일 비교",
+]
+AI_PAGE = "📈 시계열 수익률"
+
+# 합성 DB 크기: (운용사 수, 운용사당 상품 수, 기준일 수)
+DEFAULT_DATASET = (10, 30, 24)
+
+PERCENTILES = (50, 90, 95, 99)
+DEFAULT_TIMEOUT = 180        # AppTest rerun 한 번의 최대 시간 (초)
+LOCK_TIMEOUT = 30.0          # 잠금 측정용 연결의 대기 한도 (초)
+WRITER_PAUSE = 0.5           # 쓰기 프로세스의 적재 사이 대기 (초)
+STOP_FILE = '.load_test_stop'
+
+
+def percentile(values, q):
+    """최근접 순위 방식으로 q 백분위수를 구하는 함수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(values):
+    """값 목록(ms)을 건수, 백분위수, 최댓값 딕셔너리로 만드는 함수"""
+    summary = {'count': len(values)}
+    for q in PERCENTILES:
+        summary[f'p{q}'] = percentile(values, q)
+    summary['max'] = max(values) if values else None
+    return summary
+
+
+def memory_usage():
+    """현재 프로세스의 RSS와 최대 RSS(MB)를 반환하는 함수"""
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    try:
+        with open('/proc/self/statm') as fileobj:
+            rss_pages = int(fileobj.read().split()[1])
+        rss_mb = rss_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        rss_mb = None
+    return {'rss_mb': rss_mb, 'peak_rss_mb': peak_mb}
+
+
+def shared_lock_wait(db_file):
+    """읽기 잠금(SHARED)을 얻을 때까지 기다린 시간(ms)을 재는 함수 (실패하면 None)"""
+    conn = sqlite3.connect(db_file, timeout=LOCK_TIMEOUT, isolation_level=None)
+    try:
+        started = time.perf_counter()
+        conn.execute("BEGIN")
+        conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
+        waited = (time.perf_counter() - started) * 1000
+        conn.execute("COMMIT")
+        return waited
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+
+
+def prepare_database(workdir, db_path=None, dataset=DEFAULT_DATASET, seed=0):
+    """작업 디렉토리에 부하 테스트용 DB를 준비하는 함수 (db_path가 있으면 복사, 없으면 합성)"""
+    target = Path(workdir, 'fund_returns.db')
+    if db_path:
+        shutil.copyfile(db_path, target)
+        return {'source': str(db_path)}
+
+    import pandas as pd
+    from synthetic_data import generate_returns, load_database
+
+    # 시계열 페이지의 기본 조회 기간(최근 1년)에 데이터가 있도록 이번 달 말일을 마지막 기준일로
+    end_date = (pd.Timestamp.now().normalize() + pd.offsets.MonthEnd(0)).strftime('%Y-%m-%d')
+    df = generate_returns(*dataset, end_date=end_date, seed=seed)
+    original_cwd = Path.cwd()
+    os.chdir(workdir)
+    try:
+        load_database(df)
+    finally:
+        os.chdir(original_cwd)
+    return {'managers': dataset[0], 'products_per_manager': dataset[1], 'dates': dataset[2], 'rows': len(df)}
+
+
+def _click_run_button(at):
+    """페이지의 "실행" 버튼을 눌렀으면 True를 반환하는 함수"""
+    for button in at.button:
+        if button.label and '실행' in button.label and '초기화' not in button.label:
+            button.click()
+            return True
+    return False
+
+
+def _last_perf(at):
+    """마지막 rerun의 perf 기록에서 분류별 시간(ms)을 꺼내는 함수"""
+    try:
+        history = at.session_state['perf_history']
+    except KeyError:
+        return {}
+    return dict(history[-1]['categories']) if history else {}
+
+
+def run_session(session_id, options):
+    """세션 하나를 맡은 프로세스: 페이지를 차례로 열고 rerun마다 지연/잠금 대기/메모리를 기록하는 함수"""
+    os.chdir(options['workdir'])
+    sys.path.insert(0, str(BASE_DIR))
+    from streamlit.testing.v1 import AppTest
+
+    from config import DB_FILE, OPENAI_API_USE_PW
+
+    at = AppTest.from_file(str(BASE_DIR / 'app.py'), default_timeout=options['timeout'])
+    steps = []
+
+    def rerun(iteration, menu, action):
+        lock_wait = shared_lock_wait(DB_FILE)
+        started = time.perf_counter()
+        at.run()
+        steps.append({
+            'session': session_id,
+            'iteration': iteration,
+            'page': menu,
+            'action': action,
+            'ms': (time.perf_counter() - started) * 1000,
+            'lock_wait_ms': lock_wait,
+            'errors': len(at.exception) + len(at.error),
+            'perf': _last_perf(at),
+            'memory': memory_usage(),
+        })
+
+    for iteration in range(options['iterations']):
+        for menu in options['pages']:
+            at.session_state['menu'] = menu
+            if menu == AI_PAGE and options['ai']:
+                at.session_state['ai_analysis_checkbox'] = True
+                at.session_state['ai_password_input'] = OPENAI_API_USE_PW
+            rerun(iteration, menu, 'open')
+            # 페이지를 연 뒤 "실행" 버튼이 있으면 눌러서 한 번 더 rerun
+            if _click_run_button(at):
+                rerun(iteration, menu, 'run')
+    return {'session': session_id, 'steps': steps, 'memory': memory_usage()}
+
+
+def run_writer(writer_id, options):
+    """쓰기 프로세스: 마지막 기준일을 업로드처럼 다시 적재하며 쓰기 잠금 대기/보유 시간을 기록하는 함수"""
+    os.chdir(options['workdir'])
+    sys.path.insert(0, str(BASE_DIR))
+    from config import DB_FILE
+    from database import RECORD_COLUMNS, get_db_connection, ingest_records
+    from metrics import refresh_metrics
+    from sketches import refresh_sketches
+
+    conn = get_db_connection()
+    try:
+        asof_date = conn.execute("SELECT MAX(asof_date) FROM fund_returns").fetchone()[0]
+        records = conn.execute(
+            f"SELECT {', '.join(RECORD_COLUMNS)} FROM fund_returns_named WHERE asof_date = ?", (asof_date,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    waits, holds, locked = [], [], 0
+    while not os.path.exists(STOP_FILE):
+        conn = sqlite3.connect(DB_FILE, timeout=LOCK_TIMEOUT)
+        try:
+            started = time.perf_counter()
+            conn.execute("BEGIN IMMEDIATE")
+            acquired = time.perf_counter()
+            ingest_records(conn, records)
+            refresh_metrics(conn)
+            refresh_sketches(conn, [asof_date])
+            conn.commit()
+            waits.append((acquired - started) * 1000)
+            holds.append((time.perf_counter() - acquired) * 1000)
+        except sqlite3.OperationalError as e:
+            conn.rollback()
+            if 'locked' not in str(e):
+                raise
+            locked += 1
+        finally:
+            conn.close()
+        time.sleep(WRITER_PAUSE)
+    return {'writer': writer_id, 'wait_ms': waits, 'hold_ms': holds, 'locked_errors': locked,
+            'memory': memory_usage()}
+
+
+def build_report(sessions, writers, mock_counts, elapsed, options):
+    """세션/쓰기 프로세스 결과를 모아 보고서 딕셔너리를 만드는 함수"""
+    steps = [step for session in sessions for step in session['steps']]
+    pages = {}
+    for step in steps:
+        pages.setdefault(step['page'], []).append(step)
+
+    def page_summary(items):
+        summary = summarize([item['ms'] for item in items])
+        summary['errors'] = sum(item['errors'] for item in items)
+        summary['openai_ms'] = summarize([item['perf'].get('openai', 0.0) for item in items
+                                          if item['perf'].get('openai')])
+        summary['sql_ms'] = summarize([item['perf'].get('sql', 0.0) for item in items if item['perf']])
+        return summary
+
+    lock_waits = [step['lock_wait_ms'] for step in steps if step['lock_wait_ms'] is not None]
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'options': {key: value for key, value in options.items() if key != 'workdir'},
+        'elapsed_seconds': elapsed,
+        'reruns': page_summary(steps),
+        'pages': {page: page_summary(items) for page, items in pages.items()},
+        'reader_lock_wait_ms': summarize(lock_waits),
+        'reader_lock_failures': sum(step['lock_wait_ms'] is None for step in steps),
+        'writer_lock_wait_ms': summarize([ms for writer in writers for ms in writer['wait_ms']]),
+        'writer_hold_ms': summarize([ms for writer in writers for ms in writer['hold_ms']]),
+        'writer_locked_errors': sum(writer['locked_errors'] for writer in writers),
+        'memory': {f"session-{session['session']}": {
+            'rss_mb': session['memory']['rss_mb'],
+            'peak_rss_mb': max(step['memory']['peak_rss_mb'] for step in session['steps']),
+        } for session in sessions},
+        'mock_openai': mock_counts,
+    }
+
+
+def _format_ms(value):
+    return '-' if value is None else f"{value:,.0f}"
+
+
+def print_report(report):
+    """보고서를 표 형태로 출력하는 함수"""
+    columns = ['count'] + [f'p{q}' for q in PERCENTILES] + ['max']
+    print(f"\n{'rerun 지연 (ms)':<24}" + ''.join(f"{name:>9}" for name in columns) + f"{'오류':>7}")
+    rows = list(report['pages'].items()) + [('전체', report['reruns'])]
+    for page, summary in rows:
+        print(f"{page:<24}" + f"{summary['count']:>9}"
+              + ''.join(f"{_format_ms(summary[name]):>9}" for name in columns[1:]) + f"{summary['errors']:>7}")
+
+    ai_page = report['pages'].get(AI_PAGE)
+    if ai_page and ai_page['openai_ms']['count']:
+        openai_ms = ai_page['openai_ms']
+        print(f"\nOpenAI 구간 (ms): p50 {_format_ms(openai_ms['p50'])} · p95 {_format_ms(openai_ms['p95'])}"
+              f" · max {_format_ms(openai_ms['max'])} ({openai_ms['count']}회)")
+
+    reader = report['reader_lock_wait_ms']
+    print(f"\n읽기 잠금 대기 (ms): p50 {_format_ms(reader['p50'])} · p95 {_format_ms(reader['p95'])}"
+          f" · max {_format_ms(reader['max'])} · 실패 {report['reader_lock_failures']}")
+    writer = report['writer_lock_wait_ms']
+    if writer['count']:
+        hold = report['writer_hold_ms']
+        print(f"쓰기 잠금 대기 (ms): p50 {_format_ms(writer['p50'])} · p95 {_format_ms(writer['p95'])}"
+              f" · max {_format_ms(writer['max'])} · 보유 p50 {_format_ms(hold['p50'])}"
+              f" · 적재 {writer['count']}회 · locked 오류 {report['writer_locked_errors']}")
+
+    print("\n세션 프로세스 메모리 (MB)")
+    for name, memory in report['memory'].items():
+        rss = '-' if memory['rss_mb'] is None else f"{memory['rss_mb']:,.0f}"
+        print(f"  {name:<12} RSS {rss:>6} · 최대 {memory['peak_rss_mb']:,.0f}")
+
+    counts = report['mock_openai']
+    print(f"\nmock OpenAI 요청 {counts['requests']}건 (완료 {counts['completed']}, 429 {counts['rate_limited']})"
+          f" · 전체 {report['elapsed_seconds']:.1f}s")
+
+
+def run_load_test(options):
+    """mock 서버와 세션/쓰기 프로세스를 띄워 부하 테스트를 실행하고 보고서를 반환하는 함수"""
+    from mock_openai import start_mock_server
+
+    server = start_mock_server(latency=options['latency'], jitter=options['jitter'],
+                               rate_429=options['rate_429'], retry_after=options['retry_after'])
+    # spawn된 세션 프로세스가 config를 import할 때 mock 서버를 보도록 환경 변수로 전달
+    os.environ['OPENAI_API_BASE'] = server.base_url
+    os.environ['OPENAI_API_KEY'] = 'mock-openai-key'
+
+    stop_path = Path(options['workdir'], STOP_FILE)
+    stop_path.unlink(missing_ok=True)
+    context = multiprocessing.get_context('spawn')
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=options['sessions'] + options['writers'],
+                                 mp_context=context) as executor:
+            writer_futures = [executor.submit(run_writer, i, options) for i in range(options['writers'])]
+            session_futures = [executor.submit(run_session, i, options) for i in range(options['sessions'])]
+            try:
+                sessions = [future.result() for future in session_futures]
+            finally:
+                stop_path.touch()
+            writers = [future.result() for future in writer_futures]
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+    return build_report(sessions, writers, dict(server.counts), elapsed, options)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="다중 세션 부하 테스트 (로컬 mock OpenAI 서버 사용)")
+    parser.add_argument('--sessions', type=int, default=4, help="동시 세션(프로세스) 수")
+    parser.add_argument('--iterations', type=int, default=1, help="세션마다 페이지 목록을 반복하는 횟수")
+    parser.add_argument('--pages', nargs='+', default=DEFAULT_PAGES, help="세션이 여는 메뉴 이름")
+    parser.add_argument('--writers', type=int, default=0, help="동시에 재적재를 반복하는 쓰기 프로세스 수")
+    parser.add_argument('--no-ai', action='store_true', help="시계열 페이지에서 AI 분석을 끔")
+    parser.add_argument('--latency', type=float, default=1.0, help="mock OpenAI 평균 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.2, help="mock OpenAI 응답 지연 ± 범위 (초)")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="mock OpenAI 429 응답 비율 (0~1)")
+    parser.add_argument('--retry-after', type=int, default=1, help="429 응답의 Retry-After (초)")
+    parser.add_argument('--db', help="합성 DB 대신 복사해 쓸 DB 파일")
+    parser.add_argument('--dataset', type=int, nargs=3, default=DEFAULT_DATASET,
+                        metavar=('MANAGERS', 'PRODUCTS', 'DATES'), help="합성 DB 크기")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="rerun 한 번의 최대 시간 (초)")
+    parser.add_argument('--workdir', help="DB를 둘 작업 디렉토리 (기본: 임시 디렉토리, 끝나면 삭제)")
+    parser.add_argument('--out', help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    keep_workdir = args.workdir is not None
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix='fund_load_'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    try:
+        dataset = prepare_database(workdir, args.db, tuple(args.dataset))
+        print(f"작업 디렉토리: {workdir} · DB: {dataset}")
+        options = {
+            'workdir': str(workdir),
+            'sessions': args.sessions,
+            'iterations': args.iterations,
+            'pages': args.pages,
+            'writers': args.writers,
+            'ai': not args.no_ai,
+            'latency': args.latency,
+            'jitter': args.jitter,
+            'rate_429': args.rate_429,
+            'retry_after': args.retry_after,
+            'timeout': args.timeout,
+            'dataset': dataset,
+        }
+        report = run_load_test(options)
+        print_report(report)
+        if args.out:
+            Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+            print(f"결과 저장: {args.out}")
+    finally:
+        if not keep_workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
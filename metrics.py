@@ -0,0 +1,196 @@
+# 상품별 위험/성과 지표 계산 모듈
+# fund_returns에 쌓인 1개월 수익률(r_1m) 이력을 (기준일 x 상품) 행렬로 만든 뒤
+# NumPy 벡터 연산으로 모든 상품의 지표를 한 번에 계산해 product_metrics 테이블에 저장합니다.
+# 업로드 직후 한 번 계산해 두므로 화면에서는 인덱스가 걸린 테이블을 정렬/필터만 합니다.
+#
+# 기준일이 월말 스냅샷이라고 가정하고 연율화에는 PERIODS_PER_YEAR(12)를 사용합니다.
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from archive import read_archive
+from config import TABLE_NAME, MANAGER_TABLE, PRODUCT_TABLE, METRICS_TABLE
+
+PERIODS_PER_YEAR = 12
+ROLLING_WINDOW = 12          # 롤링 통계 창 크기 (기준일 수)
+RISK_FREE_RATE = 0.0         # 연 무위험 수익률 (소수)
+MIN_OBSERVATIONS = 2         # 지표를 계산할 최소 관측 수
+
+# 지표 컬럼 -> 화면 표시 이름
+METRIC_LABELS = {
+    'n_obs': '관측 수',
+    'ann_return': '연환산 수익률(%)',
+    'volatility': '변동성(%)',
+    'max_drawdown': '최대낙폭(%)',
+    'downside_deviation': '하방편차(%)',
+    'sharpe': '샤프 비율',
+    'sortino': '소르티노 비율',
+    'hit_rate': '승률(%)',
+    'rolling_return': f'최근 {ROLLING_WINDOW}개월 수익률(%)',
+    'rolling_volatility': f'최근 {ROLLING_WINDOW}개월 변동성(%)',
+}
+
+METRIC_COLUMNS = list(METRIC_LABELS.keys())
+
+# 정렬 기준으로 허용하는 컬럼 (인덱스가 있는 컬럼)
+SORTABLE_METRICS = ['ann_return', 'volatility', 'max_drawdown', 'sharpe', 'sortino', 'hit_rate', 'rolling_return']
+
+METRICS_SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS {METRICS_TABLE} (
+    product_id INTEGER PRIMARY KEY REFERENCES {PRODUCT_TABLE}(product_id),
+    first_date TEXT,
+    last_date TEXT,
+    {', '.join(f'{col} REAL' for col in METRIC_COLUMNS)},
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+{''.join(f'''
+CREATE INDEX IF NOT EXISTS idx_{METRICS_TABLE}_{col} ON {METRICS_TABLE} ({col});''' for col in SORTABLE_METRICS)}
+"""
+
+
+def return_matrix(df_returns):
+    """(asof_date, product_id, r_1m) 행들을 (기준일 x 상품) 소수 수익률 행렬로 바꾸는 함수"""
+    date_codes, dates = pd.factorize(df_returns['asof_date'], sort=True)
+    product_codes, product_ids = pd.factorize(df_returns['product_id'], sort=True)
+    matrix = np.full((len(dates), len(product_ids)), np.nan)
+    matrix[date_codes, product_codes] = df_returns['r_1m'].to_numpy(dtype=float) / 100.0
+    return np.asarray(dates), np.asarray(product_ids), matrix
+
+
+def max_drawdown(matrix):
+    """상품별 최대낙폭을 계산하는 함수 (값이 없는 기준일은 수익률 0으로 간주)
+
+    시작 가치 1을 고점에 포함하므로 첫 달 손실도 낙폭으로 잡힙니다.
+    """
+    wealth = np.cumprod(1.0 + np.nan_to_num(matrix, nan=0.0), axis=0)
+    running_peak = np.maximum(np.maximum.accumulate(wealth, axis=0), 1.0)
+    return (wealth / running_peak - 1.0).min(axis=0)
+
+
+def rolling_statistics(matrix, window=ROLLING_WINDOW):
+    """창 크기만큼의 롤링 누적 수익률과 연환산 변동성을 모든 기준일에 대해 계산하는 함수
+
+    누적합 차분으로 계산하므로 O(기준일 x 상품)입니다. 창 안에 관측이 모자라면 NaN.
+    반환값: (rolling_return, rolling_volatility) 각각 (기준일 x 상품)
+    """
+    valid = ~np.isnan(matrix)
+    log_growth = np.where(valid, np.log1p(np.where(valid, matrix, 0.0)), 0.0)
+    values = np.where(valid, matrix, 0.0)
+
+    def window_sum(arr):
+        csum = np.cumsum(arr, axis=0)
+        shifted = np.zeros_like(csum)
+        shifted[window:] = csum[:-window]
+        return csum - shifted
+
+    count = window_sum(valid.astype(float))
+    total = window_sum(values)
+    total_sq = window_sum(values ** 2)
+    full = count >= window
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rolling_return = np.where(full, np.expm1(window_sum(log_growth)), np.nan)
+        variance = (total_sq - total ** 2 / count) / (count - 1)
+        rolling_volatility = np.where(full, np.sqrt(np.clip(variance, 0.0, None)) * np.sqrt(PERIODS_PER_YEAR), np.nan)
+    return rolling_return, rolling_volatility
+
+
+def compute_metrics(df_returns, risk_free_rate=RISK_FREE_RATE):
+    """모든 상품의 위험/성과 지표를 한 번에 계산해 DataFrame으로 반환하는 함수
+
+    수익률 계열 지표는 % 단위, 비율 지표는 단위 없음으로 반환합니다.
+    """
+    if df_returns.empty:
+        return pd.DataFrame(columns=['product_id', 'first_date', 'last_date'] + METRIC_COLUMNS)
+
+    dates, product_ids, matrix = return_matrix(df_returns)
+    valid = ~np.isnan(matrix)
+    n_obs = valid.sum(axis=0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        mean = np.nanmean(matrix, axis=0)
+        volatility = np.nanstd(matrix, axis=0, ddof=1) * np.sqrt(PERIODS_PER_YEAR)
+        ann_return = np.expm1(np.nansum(np.log1p(matrix), axis=0) * PERIODS_PER_YEAR / n_obs)
+        downside = np.where(valid, np.minimum(matrix, 0.0), np.nan)
+        downside_deviation = np.sqrt(np.nanmean(downside ** 2, axis=0)) * np.sqrt(PERIODS_PER_YEAR)
+        excess = mean * PERIODS_PER_YEAR - risk_free_rate
+        sharpe = np.where(volatility > 0, excess / volatility, np.nan)
+        sortino = np.where(downside_deviation > 0, excess / downside_deviation, np.nan)
+        hit_rate = (np.where(valid, matrix, 0.0) > 0).sum(axis=0) / n_obs
+
+    rolling_return, rolling_volatility = rolling_statistics(matrix)
+
+    # 상품별 첫/마지막 관측 기준일
+    first_index = valid.argmax(axis=0)
+    last_index = len(dates) - 1 - valid[::-1].argmax(axis=0)
+    columns = np.arange(len(product_ids))
+
+    metrics = pd.DataFrame({
+        'product_id': product_ids,
+        'first_date': dates[first_index],
+        'last_date': dates[last_index],
+        'n_obs': n_obs,
+        'ann_return': ann_return * 100,
+        'volatility': volatility * 100,
+        'max_drawdown': max_drawdown(matrix) * 100,
+        'downside_deviation': downside_deviation * 100,
+        'sharpe': sharpe,
+        'sortino': sortino,
+        'hit_rate': hit_rate * 100,
+        'rolling_return': rolling_return[last_index, columns] * 100,
+        'rolling_volatility': rolling_volatility[last_index, columns] * 100,
+    })
+
+    # 관측이 너무 적은 상품은 분산 기반 지표를 비워 둡니다.
+    too_short = metrics['n_obs'] < MIN_OBSERVATIONS
+    metrics.loc[too_short, ['volatility', 'downside_deviation', 'sharpe', 'sortino']] = np.nan
+    return metrics
+
+
+def refresh_metrics(conn):
+    """fund_returns 전체 이력(보관된 기준일 포함)으로 product_metrics 테이블을 다시 계산하는 함수
+
+    호출한 쪽에서 commit 합니다. 반환값: 계산된 상품 수
+    """
+    df_returns = pd.read_sql_query(f"SELECT asof_date, product_id, r_1m FROM {TABLE_NAME}", conn)
+    df_archived = read_archive(conn, columns=['asof_date', 'product_id', 'r_1m'])
+    if not df_archived.empty:
+        df_returns = pd.concat([df_archived, df_returns], ignore_index=True)
+    metrics = compute_metrics(df_returns)
+
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {METRICS_TABLE}")
+    columns = ['product_id', 'first_date', 'last_date'] + METRIC_COLUMNS
+    rows = metrics[columns].astype(object).where(metrics[columns].notna(), None)
+    cursor.executemany(
+        f"INSERT INTO {METRICS_TABLE} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})",
+        rows.itertuples(index=False, name=None)
+    )
+    return len(metrics)
+
+
+def metrics_query(sort_by='sharpe', ascending=False, manager=None, limit=None):
+    """정렬/필터 조건으로 지표 조회 SQL과 파라미터를 만드는 함수"""
+    if sort_by not in SORTABLE_METRICS:
+        sort_by = 'sharpe'
+    # 값이 없는(관측이 모자란) 상품은 순위에서 제외해 정렬 컬럼 인덱스를 그대로 사용합니다.
+    where = f"WHERE x.{sort_by} IS NOT NULL"
+    params = []
+    if manager is not None:
+        where += " AND m.name = ?"
+        params.append(manager)
+    query = f"""
+        SELECT m.name as manager, p.name as product_name, x.last_date,
+               {', '.join('x.' + col for col in METRIC_COLUMNS)}
+        FROM {METRICS_TABLE} x
+        JOIN {PRODUCT_TABLE} p ON p.product_id = x.product_id
+        JOIN {MANAGER_TABLE} m ON m.manager_id = p.manager_id
+        {where}
+        ORDER BY x.{sort_by} {'ASC' if ascending else 'DESC'}
+    """
+    if limit:
+        query += " LIMIT ?"
+        params.append(int(limit))
+    return query, params
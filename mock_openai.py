@@ -0,0 +1,113 @@
+# 부하 테스트용 로컬 OpenAI chat completions mock 서버 (표준 라이브러리만 사용)
+# POST {base}/chat/completions 요청에 OpenAI와 같은 형식의 응답을 돌려줍니다.
+#   - latency/jitter : 응답 전 대기 시간 (초, 평균과 ±범위)
+#   - rate_429       : 이 확률로 429 응답(Retry-After 헤더 포함)을 돌려줌
+# 앱은 환경 변수 OPENAI_API_BASE=http://127.0.0.1:<port>/v1 로 이 서버를 가리키게 합니다.
+#
+# 사용 예
+#   python mock_openai.py --port 8765 --latency 1.5 --jitter 0.5 --rate-429 0.1
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MOCK_REPLY = "📊 (mock) 차트의 전반적인 추세는 완만한 상승이며, 변동성은 기간 초반에 가장 컸습니다."
+
+
+class MockCompletionsHandler(BaseHTTPRequestHandler):
+    """chat completions 요청을 흉내 내는 요청 처리기 (설정은 server 속성에서 읽음)"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send_json(404, {'error': {'message': f"unknown path {self.path}"}})
+            return
+
+        server.count('requests')
+        if random.random() < server.rate_429:
+            server.count('rate_limited')
+            self._send_json(429, {'error': {'message': "Rate limit reached (mock)", 'type': 'requests'}},
+                            headers={'Retry-After': str(server.retry_after)})
+            return
+
+        time.sleep(max(0.0, server.latency + random.uniform(-server.jitter, server.jitter)))
+        server.count('completed')
+        self._send_json(200, {
+            'id': f"chatcmpl-mock-{int(time.time() * 1000)}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'mock'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': MOCK_REPLY},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+        })
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """지연/429 설정과 요청 수 집계를 가진 mock 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, latency=1.0, jitter=0.0, rate_429=0.0, retry_after=1):
+        super().__init__(address, MockCompletionsHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.counts = {'requests': 0, 'rate_limited': 0, 'completed': 0}
+        self._counts_lock = threading.Lock()
+
+    def count(self, name):
+        with self._counts_lock:
+            self.counts[name] += 1
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def start_mock_server(port=0, latency=1.0, jitter=0.0, rate_429=0.0, retry_after=1):
+    """mock 서버를 백그라운드 스레드에서 시작하고 서버 객체를 반환하는 함수 (port=0이면 빈 포트)"""
+    server = MockOpenAIServer(('127.0.0.1', port), latency, jitter, rate_429, retry_after)
+    threading.Thread(target=server.serve_forever, name='mock-openai', daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="로컬 OpenAI chat completions mock 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=1.0, help="평균 응답 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="응답 지연 ± 범위 (초)")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument('--retry-after', type=int, default=1, help="429 응답의 Retry-After (초)")
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(('127.0.0.1', args.port), args.latency, args.jitter, args.rate_429, args.retry_after)
+    print(f"mock OpenAI 서버: {server.base_url} (지연 {args.latency}±{args.jitter}s, 429 비율 {args.rate_429})")
+    print(f"앱 실행 예: OPENAI_API_BASE={server.base_url} OPENAI_API_KEY=mock streamlit run app.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n요청 집계: {server.counts}")
@@ -0,0 +1,216 @@
+# rerun 단위 성능 계측
+# SQL 조회, 차트 생성/렌더링, pandas 후처리, 이미지 인코딩, OpenAI 호출을 구간(span)으로 기록합니다.
+# app.py가 rerun 시작/끝에 begin_rerun/end_rerun을 부르고, 그 사이에 같은 스레드에서 기록된
+# 구간을 모아 하나의 rerun 기록을 만듭니다. rerun 밖(배치 리포트, 벤치마크 등)에서는 기록하지 않습니다.
+#
+# 내보내기 (config.py)
+#   PERF_METRICS_JSONL : rerun마다 한 줄씩 추가하는 JSONL 파일
+#   PERF_METRICS_PROM  : 프로세스 누적값을 Prometheus 텍스트 형식으로 rerun마다 다시 쓰는 파일
+#                        (node_exporter textfile collector 등으로 수집)
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from config import PERF_METRICS_JSONL, PERF_METRICS_PROM
+
+# 구간 분류 (표시 순서). rerun 시간 중 어느 구간에도 속하지 않은 시간은 'other'
+CATEGORIES = ['sql', 'pandas', 'chart', 'base64', 'openai']
+OTHER_CATEGORY = 'other'
+
+CATEGORY_LABELS = {
+    'sql': 'SQL 조회',
+    'pandas': 'pandas 후처리',
+    'chart': '차트 생성/렌더링',
+    'base64': '이미지 인코딩',
+    'openai': 'OpenAI 호출',
+    'other': '기타 (Streamlit 등)',
+}
+
+# Prometheus 히스토그램 구간 경계 (초)
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+SPAN_NAME_LENGTH = 80
+
+_local = threading.local()
+_export_lock = threading.Lock()
+
+# 프로세스 누적값: (metric, page, category) -> {'count', 'sum', 'buckets'}
+_totals = {}
+
+
+def _active():
+    return getattr(_local, 'spans', None) is not None
+
+
+def recording():
+    """현재 스레드에서 rerun을 기록 중인지 반환하는 함수"""
+    return _active()
+
+
+def begin_rerun(page=None):
+    """현재 스레드에서 새 rerun 기록을 시작하는 함수"""
+    _local.spans = []
+    _local.depth = 0
+    _local.page = page
+    _local.started = time.perf_counter()
+    _local.started_at = time.time()
+
+
+def set_page(page):
+    """진행 중인 rerun 기록의 페이지 이름을 정하는 함수"""
+    if _active():
+        _local.page = page
+
+
+@contextmanager
+def span(category, name):
+    """블록 실행 시간을 현재 rerun에 구간으로 기록하는 컨텍스트 매니저
+
+    with 문이 돌려주는 딕셔너리에 값을 넣으면(예: 행 수) 구간 기록에 함께 남습니다.
+    """
+    if not _active():
+        yield {}
+        return
+
+    info = {}
+    depth = _local.depth
+    _local.depth += 1
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        end = time.perf_counter()
+        _local.depth = depth
+        # 다른 rerun이 시작되며 기록이 바뀌었을 수 있으므로 다시 확인
+        if _active():
+            _local.spans.append({
+                'category': category,
+                'name': name[:SPAN_NAME_LENGTH],
+                'start_ms': (start - _local.started) * 1000,
+                'ms': (end - start) * 1000,
+                'depth': depth,
+                **info,
+            })
+
+
+def timed(category, name=None):
+    """함수 실행 시간을 구간으로 기록하는 데코레이터 (name이 없으면 함수 이름)"""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active():
+                return func(*args, **kwargs)
+            with span(category, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def query_label(query):
+    """SQL을 구간 이름으로 쓸 수 있게 한 줄로 줄이는 함수"""
+    return ' '.join(query.split())
+
+
+def end_rerun():
+    """현재 rerun 기록을 마치고 내보낸 뒤 기록 딕셔너리를 반환하는 함수 (기록 중이 아니면 None)"""
+    if not _active():
+        return None
+    total_ms = (time.perf_counter() - _local.started) * 1000
+    spans = _local.spans
+    _local.spans = None
+
+    # 분류별 합계는 바깥 구간만 더함 (중첩 구간이 두 번 세어지지 않도록)
+    by_category = {category: 0.0 for category in CATEGORIES}
+    for item in spans:
+        if item['depth'] == 0:
+            by_category[item['category']] = by_category.get(item['category'], 0.0) + item['ms']
+    by_category[OTHER_CATEGORY] = max(0.0, total_ms - sum(by_category.values()))
+
+    record = {
+        'ts': datetime.fromtimestamp(_local.started_at).isoformat(timespec='milliseconds'),
+        'page': _local.page or 'unknown',
+        'total_ms': total_ms,
+        'categories': by_category,
+        'spans': spans,
+    }
+    export_record(record)
+    return record
+
+
+# ---------------------------------------------------------------------------
+# 내보내기
+# ---------------------------------------------------------------------------
+
+def _observe(metric, page, category, seconds):
+    entry = _totals.setdefault((metric, page, category), {
+        'count': 0, 'sum': 0.0, 'buckets': [0] * len(HISTOGRAM_BUCKETS)
+    })
+    entry['count'] += 1
+    entry['sum'] += seconds
+    for i, bound in enumerate(HISTOGRAM_BUCKETS):
+        if seconds <= bound:
+            entry['buckets'][i] += 1
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+
+
+def prometheus_text():
+    """프로세스 누적 계측값을 Prometheus 텍스트 형식 문자열로 만드는 함수"""
+    help_text = {
+        'fund_app_rerun_seconds': "페이지 rerun 전체 소요 시간",
+        'fund_app_span_seconds': "rerun 안의 분류별(SQL, 차트 등) 소요 시간 합계",
+    }
+    lines = []
+    for metric in help_text:
+        lines.append(f"# HELP {metric} {help_text[metric]}")
+        lines.append(f"# TYPE {metric} histogram")
+        for (name, page, category), entry in sorted(_totals.items()):
+            if name != metric:
+                continue
+            labels = f'page="{_label_value(page)}"'
+            if category is not None:
+                labels += f',category="{_label_value(category)}"'
+            for bound, count in zip(HISTOGRAM_BUCKETS, entry['buckets']):
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {entry["count"]}')
+            lines.append(f"{metric}_sum{{{labels}}} {entry['sum']:.6f}")
+            lines.append(f"{metric}_count{{{labels}}} {entry['count']}")
+    return '\n'.join(lines) + '\n'
+
+
+def _write_atomic(path, text):
+    """수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체하는 함수"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.perf_', suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as fileobj:
+        fileobj.write(text)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def export_record(record):
+    """rerun 기록을 JSONL 파일과 Prometheus 텍스트 파일로 내보내는 함수
+
+    계측 때문에 페이지가 실패하지 않도록 파일 쓰기 오류는 무시합니다.
+    """
+    with _export_lock:
+        _observe('fund_app_rerun_seconds', record['page'], None, record['total_ms'] / 1000)
+        for category, ms in record['categories'].items():
+            _observe('fund_app_span_seconds', record['page'], category, ms / 1000)
+        try:
+            if PERF_METRICS_JSONL:
+                with open(PERF_METRICS_JSONL, 'a', encoding='utf-8') as fileobj:
+                    fileobj.write(json.dumps(record, ensure_ascii=False) + '\n')
+            if PERF_METRICS_PROM:
+                _write_atomic(PERF_METRICS_PROM, prometheus_text())
+        except OSError:
+            pass
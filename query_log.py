@@ -0,0 +1,269 @@
+# SQL 관측 (느린 쿼리 로그 + 쿼리 유형별 통계)
+# get_db_connection()이 돌려주는 연결은 ObservedConnection이라서 execute_sql_query(pandas)와
+# 페이지/업로드 코드의 cursor.execute 호출이 모두 여기를 거칩니다.
+#   - 실행 시간은 execute부터 결과 행을 다 읽을 때까지(fetch 포함)로 잽니다
+#   - 리터럴/IN 목록 길이만 다른 쿼리는 같은 지문(fingerprint)으로 묶어 호출 수, 시간, 행 수를 누적합니다
+#   - 처음 보는 지문과 SLOW_QUERY_MS를 넘은 실행은 EXPLAIN QUERY PLAN을 받아 두고,
+#     인덱스 없이 테이블 전체를 읽는 단계(SCAN)가 있으면 표시합니다
+#   - 느린 실행은 파라미터, 행 수, 실행 계획과 함께 SLOW_QUERY_LOG(JSONL)에 한 줄씩 남깁니다
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from config import SLOW_QUERY_MS, SLOW_QUERY_LOG
+
+# 실행 계획을 받을 문장 (DDL/PRAGMA/트랜잭션 제어문은 제외)
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+PARAM_LOG_LIMIT = 20          # 로그에 남기는 파라미터 수
+PARAM_TEXT_LENGTH = 60        # 문자열 파라미터를 자르는 길이
+SAMPLE_SQL_LENGTH = 2000
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE)
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+_stats_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+# 지문 -> 누적 통계
+_query_stats = {}
+
+
+def normalize_sql(sql):
+    """리터럴과 자리표시자 목록을 지운 정규화 SQL을 만드는 함수 (지문 계산용)"""
+    text = ' '.join(sql.split())
+    text = _STRING_LITERAL.sub('?', text)
+    text = _NUMBER_LITERAL.sub('?', text)
+    # IN (?, ?, ?)처럼 개수만 다른 목록은 하나로
+    return _PLACEHOLDER_LIST.sub('(...)', text)
+
+
+def fingerprint(sql):
+    """정규화 SQL의 짧은 해시를 반환하는 함수"""
+    return hashlib.sha1(normalize_sql(sql).encode('utf-8')).hexdigest()[:12]
+
+
+def _param_repr(value):
+    if isinstance(value, str) and len(value) > PARAM_TEXT_LENGTH:
+        return value[:PARAM_TEXT_LENGTH] + '…'
+    if isinstance(value, bytes):
+        return f"<{len(value)} bytes>"
+    return value
+
+
+def loggable_params(parameters):
+    """로그에 남길 수 있도록 파라미터를 자르고 정리하는 함수"""
+    if isinstance(parameters, dict):
+        return {key: _param_repr(value) for key, value in list(parameters.items())[:PARAM_LOG_LIMIT]}
+    return [_param_repr(value) for value in list(parameters or ())[:PARAM_LOG_LIMIT]]
+
+
+def explain(connection, sql, parameters):
+    """EXPLAIN QUERY PLAN 결과를 들여쓴 문자열 목록으로 반환하는 함수 (실패하면 빈 목록)"""
+    try:
+        # 관측용이 아닌 기본 커서를 써서 EXPLAIN 자체는 기록하지 않음
+        cursor = sqlite3.Cursor(connection)
+        try:
+            rows = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters or ()).fetchall()
+        finally:
+            cursor.close()
+    except sqlite3.Error:
+        return []
+
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append('  ' * depth[node_id] + detail)
+    return lines
+
+
+def full_scan_steps(plan):
+    """실행 계획에서 인덱스 없이 테이블 전체를 읽는 단계를 골라내는 함수
+
+    서브쿼리/CTE 결과와 SQLite 내부 테이블(sqlite_master 등)을 읽는 SCAN은 제외합니다.
+    """
+    steps = [line.strip() for line in plan]
+    derived = {step.split()[1] for step in steps if step.startswith(('MATERIALIZE ', 'CO-ROUTINE '))}
+    return [
+        step for step in steps
+        if step.startswith('SCAN ') and ' USING ' not in step and 'CONSTANT ROW' not in step
+        and not step.startswith(('SCAN (subquery', 'SCAN sqlite_')) and step.split()[1] not in derived
+    ]
+
+
+def record_query(connection, sql, parameters, elapsed_ms, rows, executemany=False):
+    """실행이 끝난 쿼리 하나를 통계에 더하고, 필요하면 실행 계획과 느린 쿼리 로그를 남기는 함수"""
+    key = fingerprint(sql)
+    statement = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ''
+    slow = elapsed_ms >= SLOW_QUERY_MS
+
+    with _stats_lock:
+        entry = _query_stats.get(key)
+        first_seen = entry is None
+        if first_seen:
+            entry = _query_stats[key] = {
+                'fingerprint': key,
+                'sql': normalize_sql(sql)[:SAMPLE_SQL_LENGTH],
+                'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0, 'slow_count': 0,
+                'plan': [], 'full_scans': [], 'last_slow': None,
+            }
+        entry['count'] += 1
+        entry['total_ms'] += elapsed_ms
+        entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+        entry['rows'] += max(rows, 0)
+        entry['slow_count'] += slow
+
+    if not (first_seen or slow) or statement not in EXPLAINABLE:
+        return
+
+    plan = explain(connection, sql, parameters)
+    full_scans = full_scan_steps(plan)
+    with _stats_lock:
+        entry['plan'] = plan
+        entry['full_scans'] = full_scans
+
+    if slow:
+        item = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'fingerprint': key,
+            'ms': round(elapsed_ms, 3),
+            'rows': rows,
+            'sql': ' '.join(sql.split())[:SAMPLE_SQL_LENGTH],
+            'params': loggable_params(parameters),
+            'executemany': executemany,
+            'plan': plan,
+            'full_scans': full_scans,
+        }
+        with _stats_lock:
+            entry['last_slow'] = item
+        write_slow_log(item)
+
+
+def write_slow_log(item):
+    """느린 쿼리 한 건을 JSONL 파일에 추가하는 함수 (쓰기 오류는 무시)"""
+    if not SLOW_QUERY_LOG:
+        return
+    with _log_lock:
+        try:
+            with open(SLOW_QUERY_LOG, 'a', encoding='utf-8') as fileobj:
+                fileobj.write(json.dumps(item, ensure_ascii=False, default=str) + '\n')
+        except OSError:
+            pass
+
+
+def query_stats():
+    """지문별 누적 통계 목록을 전체 시간이 큰 순서로 반환하는 함수"""
+    with _stats_lock:
+        entries = [dict(entry) for entry in _query_stats.values()]
+    return sorted(entries, key=lambda entry: entry['total_ms'], reverse=True)
+
+
+def reset_query_stats():
+    """지문별 누적 통계를 비우는 함수"""
+    with _stats_lock:
+        _query_stats.clear()
+
+
+class ObservedCursor(sqlite3.Cursor):
+    """실행~fetch 완료까지의 시간을 재서 record_query로 넘기는 커서"""
+
+    _pending = None
+
+    def _finish(self):
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        sql, parameters, elapsed, rows = pending
+        if rows is None:
+            rows = self.rowcount
+        record_query(self.connection, sql, parameters, elapsed * 1000, rows)
+
+    def _track(self, fetch, *args):
+        start = time.perf_counter()
+        result = fetch(*args)
+        if self._pending is not None:
+            sql, parameters, elapsed, rows = self._pending
+            self._pending = (sql, parameters, elapsed + time.perf_counter() - start, rows)
+        return result
+
+    def _add_rows(self, count, exhausted):
+        if self._pending is not None:
+            sql, parameters, elapsed, rows = self._pending
+            self._pending = (sql, parameters, elapsed, (rows or 0) + count)
+            if exhausted:
+                self._finish()
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        start = time.perf_counter()
+        result = super().execute(sql, parameters)
+        elapsed = time.perf_counter() - start
+        # 결과 행이 없는 문장(INSERT 등)은 바로 기록, SELECT는 다 읽을 때까지 기다림
+        self._pending = (sql, parameters, elapsed, 0 if self.description else None)
+        if self.description is None:
+            self._finish()
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        seq_of_parameters = iter(seq_of_parameters)
+        first = next(seq_of_parameters, None)
+        if first is None:
+            return super().executemany(sql, [])
+
+        def chained():
+            yield first
+            yield from seq_of_parameters
+
+        start = time.perf_counter()
+        result = super().executemany(sql, chained())
+        record_query(self.connection, sql, first, (time.perf_counter() - start) * 1000, self.rowcount,
+                     executemany=True)
+        return result
+
+    def fetchone(self):
+        row = self._track(super().fetchone)
+        self._add_rows(row is not None, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._track(super().fetchmany, self.arraysize if size is None else size)
+        self._add_rows(len(rows), not rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._track(super().fetchall)
+        self._add_rows(len(rows), True)
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._track(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        self._add_rows(1, False)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+
+class ObservedConnection(sqlite3.Connection):
+    """cursor()와 execute()가 ObservedCursor를 쓰는 연결 (sqlite3.connect의 factory로 사용)"""
+
+    def cursor(self, factory=ObservedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
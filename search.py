@@ -0,0 +1,170 @@
+# 상품/운용사 이름 검색 모듈 (SQLite FTS5 trigram 색인)
+# product_search(product_name, manager) 가상 테이블은 rowid = product_id 이며, products 테이블의
+# INSERT/DELETE 트리거로 적재/차원 정리/전체 초기화와 같은 트랜잭션에서 함께 바뀝니다.
+# trigram 색인은 세 글자 이상 부분 문자열을 색인만으로 찾으므로 LIKE '%...%'처럼 전체를 훑지 않습니다.
+#   - 검색어를 공백으로 나눠 모든 단어를 상품명 또는 운용사명에 포함한 상품을 먼저 찾고 (일치)
+#   - 결과가 모자라면 단어마다 한 글자가 틀리거나 빠지거나 더해진 형태를 포함한 상품을 찾고 (유사, 오타 하나)
+#   - 그래도 모자라면 세 글자 조각 중 일부만 맞는 후보를 모아 조각이 겹치는 비율로 거릅니다 (유사)
+# 짧은 이름은 오타 하나로 세 글자 조각 대부분이 깨지므로(펀드0O15 -> 4개 중 3개) 겹침 비율과 따로 찾습니다.
+# 두 글자 이하 단어는 trigram으로 찾을 수 없어 검색 테이블(상품 수만큼의 작은 테이블)에서 LIKE로 거릅니다.
+import pandas as pd
+
+from config import MANAGER_TABLE, PRODUCT_TABLE, SEARCH_TABLE, SEARCH_LIMIT
+
+TRIGRAM = 3
+
+# 유사 검색 후보를 남기는 최소 겹침 비율 (similarity() 값)
+FUZZY_MIN_SIMILARITY = 0.5
+
+# 유사 검색에서 FTS5 순위로 먼저 모으는 후보 수 (limit의 배수)
+FUZZY_CANDIDATE_FACTOR = 5
+
+SEARCH_SCHEMA_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+    product_name, manager, tokenize = 'trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert AFTER INSERT ON {PRODUCT_TABLE} BEGIN
+    INSERT INTO {SEARCH_TABLE} (rowid, product_name, manager)
+    SELECT new.product_id, new.name, name FROM {MANAGER_TABLE} WHERE manager_id = new.manager_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete AFTER DELETE ON {PRODUCT_TABLE} BEGIN
+    DELETE FROM {SEARCH_TABLE} WHERE rowid = old.product_id;
+END;
+"""
+
+SEARCH_COLUMNS = ['product_id', 'manager', 'product_name', 'match']
+
+
+def rebuild_search_index(conn):
+    """검색 색인을 products/managers 테이블로 다시 채우는 함수 (호출한 쪽에서 commit, 반환값: 색인한 상품 수)"""
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+    cursor.execute(f"""
+        INSERT INTO {SEARCH_TABLE} (rowid, product_name, manager)
+        SELECT p.product_id, p.name, m.name
+        FROM {PRODUCT_TABLE} p JOIN {MANAGER_TABLE} m ON m.manager_id = p.manager_id
+    """)
+    return cursor.rowcount
+
+
+def search_index_stale(cursor):
+    """검색 색인의 상품 수가 products 테이블과 다른지 반환하는 함수 (색인 도입 전 DB 확인용)"""
+    cursor.execute(f"SELECT (SELECT COUNT(*) FROM {PRODUCT_TABLE}) != (SELECT COUNT(*) FROM {SEARCH_TABLE})")
+    return bool(cursor.fetchone()[0])
+
+
+def _phrase(term):
+    """FTS5 MATCH 구문에서 단어를 문자열 그대로 찾도록 따옴표로 감싸는 함수"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like(term):
+    """LIKE 특수 문자를 이스케이프한 부분 일치 패턴을 만드는 함수"""
+    return '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+
+def _typo_patterns(term):
+    """한 글자가 틀리거나(_로 바꿈) 빠지거나(_를 끼움) 더해진(한 글자 뺌) 형태의 LIKE 패턴 목록을 만드는 함수
+
+    trigram 색인은 ESCAPE 없는 LIKE만 색인으로 찾으므로 %, _가 든 단어는 빈 목록을 반환합니다.
+    """
+    if '%' in term or '_' in term:
+        return []
+    variants = {term[:i] + '_' + term[i + 1:] for i in range(len(term))}
+    variants |= {term[:i] + '_' + term[i:] for i in range(1, len(term))}
+    variants |= {term[:i] + term[i + 1:] for i in range(len(term))}
+    return sorted('%' + variant + '%' for variant in variants)
+
+
+def trigrams(text):
+    """문자열의 세 글자 조각 집합을 만드는 함수 (대소문자 무시)"""
+    text = text.lower()
+    return {text[i:i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+def similarity(term_grams, text):
+    """검색 단어별 세 글자 조각이 text에 들어 있는 비율의 평균을 반환하는 함수 (0~1)
+
+    단어마다 따로 재므로 한 단어에 오타가 있어도 나머지 단어가 맞으면 후보로 남습니다.
+    """
+    text_grams = trigrams(text)
+    return sum(len(grams & text_grams) / len(grams) for grams in term_grams) / len(term_grams)
+
+
+def _search(match=None, like_terms=(), typo_terms=(), exclude=(), order='product_name', limit=SEARCH_LIMIT):
+    # database가 이 모듈의 스키마를 import 하므로 조회 함수는 호출할 때 import
+    from database import execute_sql_query
+
+    conditions, params = [], []
+    if match:
+        conditions.append(f"{SEARCH_TABLE} MATCH ?")
+        params.append(match)
+    for term in like_terms:
+        conditions.append("(product_name LIKE ? ESCAPE '\\' OR manager LIKE ? ESCAPE '\\')")
+        params += [_like(term), _like(term)]
+    for term in typo_terms:
+        # 패턴마다 색인으로 찾아 합침 (OR로 묶으면 가상 테이블 전체를 훑음)
+        patterns = _typo_patterns(term)
+        subqueries = [f"SELECT rowid FROM {SEARCH_TABLE} WHERE {column} LIKE ?"
+                      for _ in patterns for column in ('product_name', 'manager')]
+        conditions.append(f"rowid IN ({' UNION '.join(subqueries)})")
+        params += [pattern for pattern in patterns for _ in range(2)]
+    if exclude:
+        conditions.append(f"rowid NOT IN ({','.join(['?'] * len(exclude))})")
+        params += list(exclude)
+    query = f"""
+        SELECT rowid AS product_id, manager, product_name
+        FROM {SEARCH_TABLE}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY {order}
+        LIMIT ?
+    """
+    return execute_sql_query(query, params=params + [limit])
+
+
+def search_products(text, limit=SEARCH_LIMIT):
+    """상품명/운용사명 일부로 상품을 찾는 함수
+
+    반환값: product_id, manager, product_name, match('일치' 또는 '유사') 컬럼의 DataFrame
+            (일치 결과를 FTS5 순위대로 먼저, 모자라면 오타 하나 결과, 나머지 유사 결과를 겹침 비율 순서로 붙임)
+    """
+    terms = text.split()
+    if not terms:
+        return pd.DataFrame(columns=SEARCH_COLUMNS)
+
+    long_terms = [term for term in terms if len(term) >= TRIGRAM]
+    short_terms = [term for term in terms if len(term) < TRIGRAM]
+    match = ' AND '.join(_phrase(term) for term in long_terms)
+    exact = _search(match, short_terms, order='rank' if match else 'product_name', limit=limit)
+    exact['match'] = '일치'
+    if len(exact) >= limit or not long_terms:
+        return exact[SEARCH_COLUMNS]
+
+    term_grams = [trigrams(term) for term in long_terms]
+    found = [exact[SEARCH_COLUMNS]]
+    exclude = exact['product_id'].tolist()
+
+    # 오타 하나: 모든 단어가 한 글자 차이 안으로 들어 있는 상품 (겹침 비율이 낮아도 찾음)
+    if all(_typo_patterns(term) for term in long_terms):
+        typo = _search(None, short_terms, typo_terms=long_terms, exclude=exclude, limit=limit - len(exact))
+        typo['similarity'] = [similarity(term_grams, f"{name} {manager}")
+                              for name, manager in zip(typo['product_name'], typo['manager'])]
+        typo = typo.sort_values('similarity', ascending=False, kind='stable').assign(match='유사')
+        found.append(typo[SEARCH_COLUMNS])
+        exclude += typo['product_id'].tolist()
+    remaining = limit - len(exclude)
+    if remaining <= 0:
+        return pd.concat(found, ignore_index=True)
+
+    # 유사 검색: 검색어의 세 글자 조각 중 하나라도 들어 있는 후보를 모은 뒤 겹침 비율로 거름
+    query_grams = set().union(*term_grams)
+    candidates = _search(' OR '.join(_phrase(gram) for gram in sorted(query_grams)), short_terms,
+                         exclude=exclude, order='rank', limit=limit * FUZZY_CANDIDATE_FACTOR)
+    candidates['similarity'] = [similarity(term_grams, f"{name} {manager}")
+                                for name, manager in zip(candidates['product_name'], candidates['manager'])]
+    fuzzy = candidates[candidates['similarity'] >= FUZZY_MIN_SIMILARITY].sort_values('similarity', ascending=False,
+                                                                                     kind='stable')
+    found.append(fuzzy.head(remaining).assign(match='유사')[SEARCH_COLUMNS])
+    return pd.concat(found, ignore_index=True)
@@ -0,0 +1,245 @@
+# 기준일 x 수익률 기간별 분포 요약(스케치) 모듈
+# 업로드 시점에 기준일마다 각 수익률 컬럼의 요약을 만들어 return_sketches 테이블에 저장합니다.
+#   - 개수/합/제곱합/최솟값/최댓값 : 평균, 표준편차, 범위를 정확히 합칠 수 있음
+#   - 고정 폭 히스토그램           : 구간 경계가 모든 기준일에서 같으므로 개수를 더하면 합쳐짐
+#   - t-digest 중심점(평균, 가중치) : 사분위수 등 분위수를 근사, 중심점을 모아 다시 압축하면 합쳐짐
+# 수익률 분석 페이지는 원본 행 대신 기간 내 스케치 몇 개만 읽어 통계표/히스토그램/박스플롯을 만듭니다.
+import numpy as np
+import pandas as pd
+
+from config import TABLE_NAME, SKETCH_TABLE
+from perf import timed
+
+# 스케치를 만드는 수익률 컬럼
+SKETCH_COLUMNS = ['r_1m', 'r_3m', 'r_6m', 'r_1y', 'r_2y', 'r_3y', 'since_inception']
+
+HISTOGRAM_BIN_WIDTH = 0.1    # 기본 히스토그램 구간 폭 (%p)
+DIGEST_COMPRESSION = 200     # t-digest 압축 계수 (클수록 중심점이 많고 정확)
+
+SKETCH_SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS {SKETCH_TABLE} (
+    asof_date TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    sum REAL,
+    sum_sq REAL,
+    min REAL,
+    max REAL,
+    hist_bins BLOB,
+    hist_counts BLOB,
+    digest_means BLOB,
+    digest_weights BLOB,
+    PRIMARY KEY (asof_date, column_name)
+) WITHOUT ROWID;
+"""
+
+SKETCH_FIELDS = ['count', 'sum', 'sum_sq', 'min', 'max', 'hist_bins', 'hist_counts', 'digest_means', 'digest_weights']
+
+
+def compress_digest(means, weights, compression=DIGEST_COMPRESSION):
+    """정렬된 중심점을 t-digest k1 스케일 구간 단위로 묶어 압축하는 함수
+
+    각 중심점을 누적 분위 위치의 k 값(arcsin 스케일) 정수 구간에 배정하므로
+    꼬리 쪽은 작은 중심점(정확), 가운데는 큰 중심점이 됩니다.
+    """
+    order = np.argsort(means, kind='stable')
+    means = means[order]
+    weights = weights[order]
+    total = weights.sum()
+    if total == 0:
+        return means, weights
+
+    q_center = (np.cumsum(weights) - weights / 2) / total
+    k = compression / (2 * np.pi) * np.arcsin(2 * q_center - 1)
+    cluster = np.floor(k).astype(np.int64)
+    cluster -= cluster.min()
+
+    merged_weights = np.bincount(cluster, weights=weights)
+    merged_sums = np.bincount(cluster, weights=weights * means)
+    nonempty = merged_weights > 0
+    return merged_sums[nonempty] / merged_weights[nonempty], merged_weights[nonempty]
+
+
+def digest_quantiles(means, weights, minimum, maximum, quantiles):
+    """t-digest 중심점으로 분위수를 근사하는 함수
+
+    pandas와 같은 (n-1)*q 위치 규칙을 쓰므로 중심점이 모두 단일 값이면 정확히 일치합니다.
+    """
+    total = weights.sum()
+    if total == 0:
+        return np.full(len(quantiles), np.nan)
+    centers = np.cumsum(weights) - weights / 2 - 0.5
+    xp = np.concatenate([[0.0], centers, [total - 1]])
+    fp = np.concatenate([[minimum], means, [maximum]])
+    return np.interp(np.asarray(quantiles) * (total - 1), xp, fp)
+
+
+def build_sketch(values):
+    """한 기준일, 한 수익률 컬럼의 값 배열로 스케치 딕셔너리를 만드는 함수"""
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {'count': 0, 'sum': 0.0, 'sum_sq': 0.0, 'min': None, 'max': None,
+                'hist_bins': np.empty(0, np.int64), 'hist_counts': np.empty(0, np.int64),
+                'digest_means': np.empty(0), 'digest_weights': np.empty(0)}
+
+    hist_bins, hist_counts = np.unique(np.floor(values / HISTOGRAM_BIN_WIDTH).astype(np.int64), return_counts=True)
+    digest_means, digest_weights = compress_digest(values, np.ones(len(values)))
+    return {
+        'count': int(len(values)),
+        'sum': float(values.sum()),
+        'sum_sq': float((values ** 2).sum()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'hist_bins': hist_bins,
+        'hist_counts': hist_counts.astype(np.int64),
+        'digest_means': digest_means,
+        'digest_weights': digest_weights,
+    }
+
+
+def merge_sketches(sketches):
+    """여러 기준일의 스케치를 하나로 합치는 함수"""
+    sketches = [sketch for sketch in sketches if sketch['count']]
+    if not sketches:
+        return build_sketch([])
+
+    bins = np.concatenate([sketch['hist_bins'] for sketch in sketches])
+    counts = np.concatenate([sketch['hist_counts'] for sketch in sketches])
+    hist_bins, inverse = np.unique(bins, return_inverse=True)
+    hist_counts = np.bincount(inverse, weights=counts).astype(np.int64)
+
+    digest_means, digest_weights = compress_digest(
+        np.concatenate([sketch['digest_means'] for sketch in sketches]),
+        np.concatenate([sketch['digest_weights'] for sketch in sketches]),
+    )
+    return {
+        'count': sum(sketch['count'] for sketch in sketches),
+        'sum': sum(sketch['sum'] for sketch in sketches),
+        'sum_sq': sum(sketch['sum_sq'] for sketch in sketches),
+        'min': min(sketch['min'] for sketch in sketches),
+        'max': max(sketch['max'] for sketch in sketches),
+        'hist_bins': hist_bins,
+        'hist_counts': hist_counts,
+        'digest_means': digest_means,
+        'digest_weights': digest_weights,
+    }
+
+
+def describe_sketch(sketch):
+    """스케치로 DataFrame.describe()와 같은 항목(count, mean, std, min, 25%, 50%, 75%, max)을 계산하는 함수"""
+    count = sketch['count']
+    if count == 0:
+        return pd.Series([0.0] + [np.nan] * 7, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+    mean = sketch['sum'] / count
+    # 표본 분산 (ddof=1), 반올림 오차로 음수가 되는 경우 0으로
+    std = np.sqrt(max(sketch['sum_sq'] - count * mean ** 2, 0.0) / (count - 1)) if count > 1 else np.nan
+    q1, median, q3 = digest_quantiles(sketch['digest_means'], sketch['digest_weights'],
+                                      sketch['min'], sketch['max'], [0.25, 0.5, 0.75])
+    return pd.Series([float(count), mean, std, sketch['min'], q1, median, q3, sketch['max']],
+                     index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+
+
+def histogram_points(sketch):
+    """스케치 히스토그램의 구간 중앙값과 개수를 반환하는 함수 (ax.hist의 weights로 사용)"""
+    centers = (sketch['hist_bins'] + 0.5) * HISTOGRAM_BIN_WIDTH
+    return centers, sketch['hist_counts']
+
+
+def boxplot_stats(sketch, label, whis=1.5):
+    """스케치로 matplotlib ax.bxp용 박스플롯 통계를 만드는 함수
+
+    수염 끝과 이상치는 히스토그램 구간 중앙값으로 근사합니다.
+    """
+    stats = describe_sketch(sketch)
+    q1, median, q3 = stats['25%'], stats['50%'], stats['75%']
+    iqr = q3 - q1
+    low_limit, high_limit = q1 - whis * iqr, q3 + whis * iqr
+
+    centers, _ = histogram_points(sketch)
+    centers = np.clip(centers, sketch['min'], sketch['max']) if len(centers) else centers
+    inside = centers[(centers >= low_limit) & (centers <= high_limit)]
+    whislo = inside.min() if len(inside) else q1
+    whishi = inside.max() if len(inside) else q3
+    if sketch['min'] >= low_limit:
+        whislo = sketch['min']
+    if sketch['max'] <= high_limit:
+        whishi = sketch['max']
+    fliers = centers[(centers < whislo) | (centers > whishi)]
+
+    return {
+        'label': label, 'med': median, 'q1': q1, 'q3': q3,
+        'whislo': min(whislo, q1), 'whishi': max(whishi, q3),
+        'mean': stats['mean'], 'fliers': fliers,
+    }
+
+
+def _encode(sketch):
+    return tuple(
+        sketch[field].tobytes() if isinstance(sketch[field], np.ndarray) else sketch[field]
+        for field in SKETCH_FIELDS
+    )
+
+
+def decode_sketch(row):
+    """테이블 행(SKETCH_FIELDS 순서)을 스케치 딕셔너리로 되돌리는 함수"""
+    count, total, total_sq, minimum, maximum, hist_bins, hist_counts, digest_means, digest_weights = row
+    return {
+        'count': count, 'sum': total, 'sum_sq': total_sq, 'min': minimum, 'max': maximum,
+        'hist_bins': np.frombuffer(hist_bins or b'', dtype=np.int64),
+        'hist_counts': np.frombuffer(hist_counts or b'', dtype=np.int64),
+        'digest_means': np.frombuffer(digest_means or b'', dtype=float),
+        'digest_weights': np.frombuffer(digest_weights or b'', dtype=float),
+    }
+
+
+def refresh_sketches(conn, asof_dates=None):
+    """기준일별 스케치를 다시 만들어 저장하는 함수
+
+    asof_dates가 없으면 모든 기준일을 다시 만듭니다. 호출한 쪽에서 commit 합니다.
+    반환값: 다시 만든 기준일 수
+    """
+    cursor = conn.cursor()
+    query = f"SELECT asof_date, {', '.join(SKETCH_COLUMNS)} FROM {TABLE_NAME}"
+    params = []
+    if asof_dates is None:
+        cursor.execute(f"DELETE FROM {SKETCH_TABLE}")
+    else:
+        asof_dates = list(dict.fromkeys(asof_dates))
+        placeholders = ','.join(['?'] * len(asof_dates))
+        cursor.execute(f"DELETE FROM {SKETCH_TABLE} WHERE asof_date IN ({placeholders})", asof_dates)
+        query += f" WHERE asof_date IN ({placeholders})"
+        params = asof_dates
+
+    df_values = pd.read_sql_query(query, conn, params=params)
+    rows = []
+    for asof_date, df_date in df_values.groupby('asof_date', sort=True):
+        for column in SKETCH_COLUMNS:
+            rows.append((asof_date, column) + _encode(build_sketch(df_date[column].to_numpy(dtype=float))))
+
+    cursor.executemany(
+        f"INSERT INTO {SKETCH_TABLE} (asof_date, column_name, {', '.join(SKETCH_FIELDS)}) "
+        f"VALUES ({', '.join(['?'] * (len(SKETCH_FIELDS) + 2))})",
+        rows
+    )
+    return df_values['asof_date'].nunique()
+
+
+def sketch_query(columns):
+    """기간 내 선택 컬럼의 스케치를 읽는 SQL을 만드는 함수 (파라미터: 컬럼들..., 시작일, 종료일)"""
+    return f"""
+        SELECT column_name, {', '.join(SKETCH_FIELDS)}
+        FROM {SKETCH_TABLE}
+        WHERE column_name IN ({','.join(['?'] * len(columns))})
+        AND asof_date BETWEEN ? AND ?
+    """
+
+
+@timed('pandas')
+def merge_rows(df_sketches, columns):
+    """sketch_query 결과를 컬럼별로 합친 스케치 딕셔너리 {컬럼: 스케치}를 만드는 함수"""
+    grouped = {column: [] for column in columns}
+    for row in df_sketches.itertuples(index=False, name=None):
+        if row[0] in grouped:
+            grouped[row[0]].append(decode_sketch(row[1:]))
+    return {column: merge_sketches(sketches) for column, sketches in grouped.items()}
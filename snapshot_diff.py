@@ -0,0 +1,133 @@
+# 기준일 비교(스냅샷 diff) 엔진
+# 두 기준일의 상품 행을 fund_returns 기본 키(asof_date, product_id) 범위로 한 번에 읽고,
+# 상품(운용사 + 상품명 = product_id) 단위로 맞붙여 배열 연산으로 변화를 계산합니다.
+#   - 상품별: 신규/제외/유지, 수익률 변화, 총액 변화, 전체 상품 중 수익률 순위와 순위 변화
+#   - 운용사별: 상품 수, 신규/제외 상품 수, 총 자산 변화, 평균 수익률 변화
+# 결과는 (이전 기준일, 이후 기준일, 수익률 컬럼)마다 frame_cache에 한 벌만 두고 여러 세션과 JSON API가 함께 씁니다.
+import numpy as np
+import pandas as pd
+
+from archive import catalog
+from config import TABLE_NAME, NAMED_VIEW
+from database import execute_sql_query, get_db_connection
+from frame_cache import cached_result
+from perf import timed
+
+# 상품 상태
+STATUS_NEW = '신규'
+STATUS_REMOVED = '제외'
+STATUS_KEPT = '유지'
+
+FUND_DIFF_COLUMNS = [
+    'product_id', 'manager', 'product_name', 'status',
+    'return_before', 'return_after', 'return_change',
+    'assets_before', 'assets_after', 'assets_change', 'assets_change_pct',
+    'rank_before', 'rank_after', 'rank_change',
+]
+
+MANAGER_DIFF_COLUMNS = [
+    'manager', 'products_before', 'products_after', 'new_products', 'removed_products',
+    'assets_before', 'assets_after', 'assets_change', 'assets_change_pct',
+    'avg_return_before', 'avg_return_after', 'avg_return_change',
+]
+
+
+def snapshot_dates():
+    """비교할 수 있는 기준일 목록(DB + 보관)을 최근 순서로 반환하는 함수"""
+    conn = get_db_connection()
+    try:
+        # 보관 행을 붙이지 않도록 조회 전용 경로(execute_sql_query)를 거치지 않고 목록만 읽음
+        dates = {row[0] for row in conn.execute(f"SELECT DISTINCT asof_date FROM {TABLE_NAME}")}
+        dates.update(entry[0] for entry in catalog(conn))
+    finally:
+        conn.close()
+    return sorted(dates, reverse=True)
+
+
+def load_snapshot_pair(before, after, column):
+    """두 기준일의 상품 행(product_id, manager, product_name, 수익률, 총액)을 조회하는 함수"""
+    query = f"""
+        SELECT asof_date, product_id, manager, product_name, {column} AS return_value, total_amount
+        FROM {NAMED_VIEW}
+        WHERE asof_date IN (?, ?)
+    """
+    return execute_sql_query(query, params=[before, after])
+
+
+@timed('pandas')
+def build_fund_diff(df_pair, before, after):
+    """두 기준일 행을 상품 단위로 맞붙여 상품별 변화를 계산하는 함수 (반환: FUND_DIFF_COLUMNS DataFrame)"""
+    columns = ['product_id', 'manager', 'product_name', 'return_value', 'total_amount']
+    old = df_pair.loc[df_pair['asof_date'] == before, columns].set_index('product_id')
+    new = df_pair.loc[df_pair['asof_date'] == after, columns].set_index('product_id')
+    # 수익률 순위는 그 기준일의 전체 상품 중 순위 (1위 = 가장 높은 수익률)
+    old['rank'] = old['return_value'].rank(ascending=False, method='min')
+    new['rank'] = new['return_value'].rank(ascending=False, method='min')
+
+    df = old.join(new, how='outer', lsuffix='_before', rsuffix='_after')
+    in_before = df['manager_before'].notna()
+    in_after = df['manager_after'].notna()
+    result = pd.DataFrame({
+        'product_id': df.index,
+        'manager': df['manager_after'].fillna(df['manager_before']).to_numpy(),
+        'product_name': df['product_name_after'].fillna(df['product_name_before']).to_numpy(),
+        'status': np.select([~in_before, ~in_after], [STATUS_NEW, STATUS_REMOVED], STATUS_KEPT),
+        'return_before': df['return_value_before'].to_numpy(),
+        'return_after': df['return_value_after'].to_numpy(),
+        'assets_before': df['total_amount_before'].to_numpy(),
+        'assets_after': df['total_amount_after'].to_numpy(),
+        'rank_before': df['rank_before'].to_numpy(),
+        'rank_after': df['rank_after'].to_numpy(),
+    })
+    result['return_change'] = result['return_after'] - result['return_before']
+    # 신규/제외 상품의 총액 변화는 없는 쪽을 0으로 보고 계산
+    result['assets_change'] = result['assets_after'].fillna(0) - result['assets_before'].fillna(0)
+    result['assets_change_pct'] = result['assets_change'] / result['assets_before'].where(result['assets_before'] > 0) * 100
+    # 양수면 순위가 올라감
+    result['rank_change'] = result['rank_before'] - result['rank_after']
+    return result[FUND_DIFF_COLUMNS].sort_values(['manager', 'product_name'], ignore_index=True)
+
+
+@timed('pandas')
+def build_manager_diff(df_fund):
+    """상품별 변화를 운용사별로 묶는 함수 (반환: MANAGER_DIFF_COLUMNS DataFrame, 총 자산 변화 큰 순서)"""
+    in_before = df_fund['status'] != STATUS_NEW
+    in_after = df_fund['status'] != STATUS_REMOVED
+    df = pd.DataFrame({
+        'manager': df_fund['manager'].astype(str),
+        'products_before': in_before.astype(int),
+        'products_after': in_after.astype(int),
+        'new_products': (df_fund['status'] == STATUS_NEW).astype(int),
+        'removed_products': (df_fund['status'] == STATUS_REMOVED).astype(int),
+        'assets_before': df_fund['assets_before'],
+        'assets_after': df_fund['assets_after'],
+        'return_before': df_fund['return_before'],
+        'return_after': df_fund['return_after'],
+    })
+    grouped = df.groupby('manager', sort=False).agg(
+        products_before=('products_before', 'sum'),
+        products_after=('products_after', 'sum'),
+        new_products=('new_products', 'sum'),
+        removed_products=('removed_products', 'sum'),
+        assets_before=('assets_before', 'sum'),
+        assets_after=('assets_after', 'sum'),
+        avg_return_before=('return_before', 'mean'),
+        avg_return_after=('return_after', 'mean'),
+    ).reset_index()
+    grouped['assets_change'] = grouped['assets_after'] - grouped['assets_before']
+    grouped['assets_change_pct'] = (grouped['assets_change']
+                                    / grouped['assets_before'].where(grouped['assets_before'] > 0) * 100)
+    grouped['avg_return_change'] = grouped['avg_return_after'] - grouped['avg_return_before']
+    return grouped[MANAGER_DIFF_COLUMNS].sort_values('assets_change', ascending=False, key=abs, ignore_index=True)
+
+
+def load_fund_diff(before, after, column):
+    """두 기준일의 상품별 변화를 반환하는 함수 (기준일 쌍 x 수익률 컬럼마다 공유 캐시)"""
+    return cached_result('snapshot_diff.fund', (before, after, column),
+                         lambda: build_fund_diff(load_snapshot_pair(before, after, column), before, after))
+
+
+def load_manager_diff(before, after, column):
+    """두 기준일의 운용사별 변화를 반환하는 함수 (기준일 쌍 x 수익률 컬럼마다 공유 캐시)"""
+    return cached_result('snapshot_diff.manager', (before, after, column),
+                         lambda: build_manager_diff(load_fund_diff(before, after, column)))
@@ -0,0 +1,302 @@
+# 앱 시작 경로 관리 모듈
+# Streamlit은 rerun마다 app.py를 처음부터 다시 실행하지만, import된 모듈의 상태는
+# 프로세스가 살아 있는 동안 유지됩니다. 폰트 등록처럼 프로세스 단위로 한 번이면
+# 충분한 작업은 이 모듈에서 캐시하고, 무거운 차트 라이브러리는 필요한 페이지에서만
+# 지연 import 합니다.
+#
+# 실행 예시 (import/rerun 비용 리포트):
+#   python startup.py --runs 5
+import argparse
+import functools
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+
+# 한글 폰트 파일 후보 (앞에 있을수록 우선)
+FONT_FILES = [
+    BASE_DIR / 'fonts' / 'NanumGothic.ttf',
+    BASE_DIR / 'fonts' / 'NanumBarunGothic.ttf',
+]
+
+# 시스템에 설치된 한글 폰트 후보
+SYSTEM_KOREAN_FONTS = ['NanumGothic', 'Malgun Gothic', 'AppleGothic', 'Noto Sans CJK KR', 'Source Han Sans KR', 'Noto Sans KR']
+
+# 웹 폰트 fallback 목록
+FALLBACK_FONT_FAMILY = ['Noto Sans KR', 'DejaVu Sans', 'Arial Unicode MS', 'Liberation Sans', 'sans-serif']
+
+# 지연 import 대상인 무거운 라이브러리
+HEAVY_MODULES = ['matplotlib.pyplot', 'seaborn', 'plotly.express', 'plotly.graph_objects']
+
+# 한글 폰트 지원을 위한 CSS 스타일
+KOREAN_FONT_CSS = """
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
+
+/* 전체 앱에 한글 폰트 적용 */
+.stApp {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+
+/* 모든 Streamlit 컴포넌트에 한글 폰트 적용 */
+.stMarkdown, .stText, .stButton, .stSelectbox, .stMultiselect,
+.stDateInput, .stSlider, .stCheckbox, .stMetric, .stDataFrame,
+.stNumberInput, .stTextArea, .stFileUploader, .stProgress,
+.stExpander, .stTabs, .stSidebar, .stMain {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+
+/* 제목과 헤더에 한글 폰트 적용 */
+h1, h2, h3, h4, h5, h6 {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+
+/* 테이블에 한글 폰트 적용 */
+table, th, td {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+
+/* 버튼과 입력 필드에 한글 폰트 적용 */
+button, input, select, textarea {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+
+/* 사이드바에 한글 폰트 적용 */
+.sidebar .sidebar-content {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+
+/* 메인 컨텐츠에 한글 폰트 적용 */
+.main .block-container {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', 'AppleGothic', sans-serif !important;
+}
+</style>
+"""
+
+# 최초 import에 걸린 시간 기록 (모듈명 -> 초)
+IMPORT_TIMINGS = {}
+
+_import_lock = threading.Lock()
+
+
+def inject_css():
+    """한글 폰트 CSS를 페이지에 출력하는 함수
+
+    Streamlit은 rerun 때 다시 출력되지 않은 요소를 화면에서 제거하므로 CSS 출력
+    자체는 매번 필요합니다. 문자열은 모듈 상수로 한 번만 만들어 둡니다.
+    """
+    import streamlit as st
+    st.markdown(KOREAN_FONT_CSS, unsafe_allow_html=True)
+
+
+def _timed_import(module_name):
+    """모듈을 import하면서 최초 import 소요 시간을 기록하는 함수"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    IMPORT_TIMINGS.setdefault(module_name, time.perf_counter() - start)
+    return module
+
+
+def _apply_font_rc(plt, family):
+    plt.rcParams['font.family'] = family
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.unicode_minus'] = False
+
+
+# Streamlit Cloud 환경에서 한글 폰트 설정 (프로세스당 한 번)
+@functools.lru_cache(maxsize=None)
+def setup_korean_font():
+    """한글 폰트를 matplotlib에 한 번만 등록하고 FontProperties를 반환하는 함수"""
+    import matplotlib.font_manager as fm
+    import matplotlib.pyplot as plt
+
+    try:
+        # 1. 저장소 fonts 디렉토리의 폰트 파일 우선 사용
+        for font_path in FONT_FILES:
+            if font_path.exists():
+                fm.fontManager.addfont(str(font_path))
+                font_prop = fm.FontProperties(fname=str(font_path))
+                _apply_font_rc(plt, font_prop.get_name())
+                return font_prop
+
+        # 2. 시스템에 설치된 한글 폰트 찾기
+        for font_name in SYSTEM_KOREAN_FONTS:
+            try:
+                font_prop = fm.FontProperties(family=font_name)
+                if font_prop.get_name() != 'DejaVu Sans':  # 기본 폰트가 아닌 경우
+                    _apply_font_rc(plt, font_name)
+                    return font_prop
+            except Exception:
+                continue
+
+        # 3. 웹 폰트 사용 (Streamlit Cloud에서 안정적)
+        _apply_font_rc(plt, FALLBACK_FONT_FAMILY)
+        return None
+
+    except Exception as e:
+        # 기본 설정 사용
+        _apply_font_rc(plt, FALLBACK_FONT_FAMILY)
+        return None
+
+
+def get_pyplot():
+    """matplotlib.pyplot을 지연 import하고 한글 폰트 설정을 보장하는 함수"""
+    with _import_lock:
+        plt = _timed_import('matplotlib.pyplot')
+    setup_korean_font()
+    return plt
+
+
+def get_seaborn():
+    """seaborn을 지연 import하는 함수 (pyplot 설정 포함)"""
+    get_pyplot()
+    with _import_lock:
+        return _timed_import('seaborn')
+
+
+def get_plotly_express():
+    """plotly.express를 지연 import하는 함수 (설치되지 않은 경우 ImportError)"""
+    with _import_lock:
+        return _timed_import('plotly.express')
+
+
+def get_plotly_graph_objects():
+    """plotly.graph_objects를 지연 import하는 함수 (설치되지 않은 경우 ImportError)"""
+    with _import_lock:
+        return _timed_import('plotly.graph_objects')
+
+
+# 시각화용 폰트 설정 함수
+def get_plot_font():
+    """시각화에서 사용할 폰트를 반환하는 함수"""
+    get_pyplot()
+    return setup_korean_font()
+
+
+def loaded_heavy_modules():
+    """현재 프로세스에 로드된 무거운 라이브러리 목록을 반환하는 함수"""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+# ---------------------------------------------------------------------------
+# import/rerun 비용 리포트
+# ---------------------------------------------------------------------------
+
+def measure_cold_import(module_name):
+    """새 인터프리터에서 모듈 하나의 import 시간을 측정하는 함수 (초)"""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module_name}; "
+        "print(time.perf_counter() - t)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=BASE_DIR)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_setup_costs(repeat=20):
+    """예전 방식(매 rerun 실행)과 캐시 방식의 초기화 비용을 비교하는 함수 (ms)"""
+    import sqlite3
+    import matplotlib.font_manager as fm
+    import database
+    from config import DB_FILE, TABLE_NAME
+
+    font_path = next((p for p in FONT_FILES if p.exists()), None)
+
+    # 예전 방식: rerun마다 폰트 등록 + sqlite_master 조회
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if font_path is not None:
+            fm.fontManager.addfont(str(font_path))
+            fm.FontProperties(fname=str(font_path)).get_name()
+        conn = sqlite3.connect(DB_FILE)
+        conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (TABLE_NAME,)).fetchone()
+        conn.close()
+    legacy_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    # 캐시 방식: 최초 1회 이후에는 캐시 조회만 수행
+    setup_korean_font()
+    database.bootstrap_database()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        setup_korean_font()
+        database.bootstrap_database()
+    cached_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    return {'legacy_setup_ms': legacy_ms, 'cached_setup_ms': cached_ms}
+
+
+def measure_reruns(runs=5, menu="🏠 메인 화면"):
+    """AppTest로 app.py를 여러 번 실행해 rerun 시간을 측정하는 함수 (ms)"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(BASE_DIR / 'app.py'), default_timeout=120)
+    at.session_state['menu'] = menu
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'menu': menu,
+        'first_run_ms': timings[0],
+        'rerun_ms': sorted(timings[1:])[len(timings[1:]) // 2] if len(timings) > 1 else None,
+        'heavy_modules_loaded': loaded_heavy_modules(),
+    }
+
+
+def startup_report(runs=5):
+    """import 시간과 rerun 시간을 모아 리포트 딕셔너리로 반환하는 함수"""
+    report = {'cold_import_ms': {}}
+    for module_name in HEAVY_MODULES:
+        seconds = measure_cold_import(module_name)
+        report['cold_import_ms'][module_name] = None if seconds is None else seconds * 1000
+    # 라이브러리끼리 의존성이 겹치므로(seaborn -> matplotlib) 합계는 한 번에 측정합니다.
+    seconds = measure_cold_import(', '.join(HEAVY_MODULES))
+    report['cold_import_all_ms'] = None if seconds is None else seconds * 1000
+    # rerun 측정을 먼저 해야 차트 라이브러리가 로드되지 않았는지 확인할 수 있습니다.
+    report['reruns'] = measure_reruns(runs=runs)
+    report['setup'] = measure_setup_costs()
+    return report
+
+
+def print_report(report):
+    """startup_report 결과를 사람이 읽기 쉬운 형태로 출력하는 함수"""
+    print("== 무거운 라이브러리 cold import 시간 ==")
+    for module_name, ms in report['cold_import_ms'].items():
+        if ms is None:
+            print(f"  {module_name:<20} (설치되지 않음)")
+            continue
+        print(f"  {module_name:<20} {ms:8.1f} ms")
+    if report['cold_import_all_ms'] is not None:
+        print(f"  {'(전체)':<20} {report['cold_import_all_ms']:8.1f} ms")
+
+    reruns = report['reruns']
+    print(f"\n== rerun 시간 ({reruns['menu']}) ==")
+    print(f"  첫 실행              {reruns['first_run_ms']:8.1f} ms")
+    if reruns['rerun_ms'] is not None:
+        print(f"  rerun (중앙값)       {reruns['rerun_ms']:8.1f} ms")
+    print(f"  로드된 차트 라이브러리: {', '.join(reruns['heavy_modules_loaded']) or '없음'}")
+    if not reruns['heavy_modules_loaded'] and report['cold_import_all_ms'] is not None:
+        print(f"  차트 없는 페이지에서 절약한 import 시간: 약 {report['cold_import_all_ms']:.1f} ms")
+
+    setup = report['setup']
+    print("\n== rerun당 초기화 비용 ==")
+    print(f"  예전 방식 (폰트 등록 + sqlite_master 조회) {setup['legacy_setup_ms']:8.3f} ms")
+    print(f"  캐시 방식                                  {setup['cached_setup_ms']:8.3f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="앱 시작 경로의 import/rerun 비용 리포트")
+    parser.add_argument('--runs', type=int, default=5, help="측정할 실행 횟수")
+    args = parser.parse_args()
+    os.chdir(BASE_DIR)
+    print_report(startup_report(runs=args.runs))
@@ -0,0 +1,195 @@
+# 벤치마크/부하 테스트용 합성 펀드 수익률 데이터 생성
+# fund_returns와 같은 컬럼(기준일, 운용사, 상품명, 기간 수익률, 총액)을 가진 데이터를
+# 운용사 수 x 운용사당 상품 수 x 기준일 수 크기로 만듭니다.
+#   - 기준일은 월말, 수익률은 시장 공통 요인 + 운용사 요인 + 상품 고유 변동의 합
+#   - 3M~3Y/설정일이후 수익률은 같은 월간 수익률 경로를 누적해 계산하므로 기간끼리 서로 맞음
+#   - 상품마다 설정일이 달라 설정 전 기준일에는 행이 없고, 운용 기간이 짧으면 긴 기간 수익률은 비어 있음
+#   - 같은 seed이면 항상 같은 데이터
+#
+# 사용 예
+#   python synthetic_data.py --managers 20 --products 50 --dates 36 --xlsx-dir synthetic_xlsx
+#   python synthetic_data.py --managers 50 --products 100 --dates 120 --db-dir /tmp/bench_db
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 기간 수익률 컬럼 -> 개월 수
+PERIOD_MONTHS = {'r_1m': 1, 'r_3m': 3, 'r_6m': 6, 'r_1y': 12, 'r_2y': 24, 'r_3y': 36}
+
+# 첫 기준일에도 긴 기간 수익률이 있도록 앞에 더 만들어 두는 개월 수
+HISTORY_PADDING = 36
+
+DEFAULT_END_DATE = '2024-12-31'
+MISSING_RATE = 0.005          # 원본 엑셀처럼 값 일부가 비어 있는 비율
+
+
+def month_end_dates(n_dates, end_date=DEFAULT_END_DATE):
+    """end_date로 끝나는 월말 기준일 n_dates개를 'YYYY-MM-DD' 문자열 배열로 반환하는 함수"""
+    dates = pd.date_range(end=pd.Timestamp(end_date) + pd.offsets.MonthEnd(0), periods=n_dates, freq='ME')
+    return dates.strftime('%Y-%m-%d').to_numpy()
+
+
+def generate_returns(n_managers, n_products, n_dates, end_date=DEFAULT_END_DATE, seed=0,
+                     missing_rate=MISSING_RATE):
+    """합성 수익률 데이터를 database.RECORD_COLUMNS 순서의 DataFrame으로 만드는 함수
+
+    n_products는 운용사당 상품 수입니다. 행은 기준일, 운용사, 상품명 순으로 정렬됩니다.
+    """
+    rng = np.random.default_rng(seed)
+    n_total = n_managers * n_products
+    n_months = n_dates + HISTORY_PADDING
+
+    # 월간 수익률 (%) = 시장 요인 x 베타 + 운용사 요인 + 고유 변동
+    market = rng.normal(0.6, 3.5, n_months)
+    manager_factor = rng.normal(0.0, 0.8, (n_managers, n_months))
+    beta = rng.uniform(0.3, 1.3, n_total)
+    alpha = rng.normal(0.0, 0.25, n_total)
+    idio_vol = rng.uniform(0.3, 2.5, n_total)
+    manager_index = np.repeat(np.arange(n_managers), n_products)
+
+    monthly = (
+        beta[:, None] * market[None, :]
+        + manager_factor[manager_index]
+        + alpha[:, None]
+        + rng.standard_normal((n_total, n_months)) * idio_vol[:, None]
+    )
+    monthly = np.maximum(monthly, -60.0)
+
+    # 설정 시점: 절반은 데이터 시작 전(긴 이력), 나머지는 기간 중 임의 시점
+    inception = np.where(
+        rng.random(n_total) < 0.5,
+        rng.integers(0, HISTORY_PADDING, n_total),
+        rng.integers(HISTORY_PADDING, n_months, n_total),
+    )
+    months = np.arange(n_months)
+    # 설정 월까지는 수익률 0으로 두고 누적 로그 수익률 계산 (설정 시점 = 기준 0)
+    log_growth = np.where(months[None, :] > inception[:, None], np.log1p(monthly / 100), 0.0)
+    cumulative = np.cumsum(log_growth, axis=1)
+
+    window = slice(HISTORY_PADDING, n_months)
+    alive = (months[None, :] > inception[:, None])[:, window]
+
+    values = {}
+    for column, k in PERIOD_MONTHS.items():
+        shifted = np.full_like(cumulative, np.nan)
+        shifted[:, k:] = cumulative[:, :-k]
+        enough_history = (months[None, :] - k) >= inception[:, None]
+        period_return = np.where(enough_history, np.expm1(cumulative - shifted) * 100, np.nan)
+        values[column] = period_return[:, window]
+    values['since_inception'] = (np.expm1(cumulative) * 100)[:, window]
+
+    # 총액: 설정액(로그정규) x 누적 성과 x 자금 유출입(랜덤 워크)
+    initial = rng.lognormal(mean=23.0, sigma=1.2, size=n_total)
+    flows = np.cumsum(rng.normal(0.0, 0.03, (n_total, n_months)), axis=1)
+    amount = initial[:, None] * np.exp(cumulative + np.where(months[None, :] > inception[:, None], flows, 0.0))
+    values['total_amount'] = np.round(amount[:, window], -3)
+
+    # (상품, 기준일) 중 운용 중인 칸만 행으로
+    product_idx, date_idx = np.nonzero(alive)
+    order = np.lexsort((product_idx, date_idx))
+    product_idx, date_idx = product_idx[order], date_idx[order]
+
+    manager_names = np.array([f"운용사{m + 1:03d}" for m in range(n_managers)])
+    product_names = np.array([
+        f"{manager_names[m]} 펀드{p + 1:04d}" for m in range(n_managers) for p in range(n_products)
+    ])
+
+    df = pd.DataFrame({
+        'asof_date': month_end_dates(n_dates, end_date)[date_idx],
+        'manager': manager_names[manager_index[product_idx]],
+        'product_name': product_names[product_idx],
+    })
+    for column, matrix in values.items():
+        column_values = matrix[product_idx, date_idx]
+        if column != 'total_amount':
+            column_values = np.round(column_values, 2)
+        if missing_rate:
+            column_values = np.where(rng.random(len(column_values)) < missing_rate, np.nan, column_values)
+        df[column] = column_values
+    return df
+
+
+def to_excel_frame(df_snapshot):
+    """기준일 하나의 데이터를 업로드 엑셀과 같은 한글 컬럼 형식으로 바꾸는 함수"""
+    from views.upload import EXCEL_COLUMN_MAPPING
+
+    return df_snapshot[list(EXCEL_COLUMN_MAPPING.values())].rename(
+        columns={db_col: excel_col for excel_col, db_col in EXCEL_COLUMN_MAPPING.items()}
+    )
+
+
+def write_excel_files(df, directory):
+    """기준일마다 업로드용 엑셀 파일 하나씩 쓰고 {기준일: 파일 경로}를 반환하는 함수"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for asof_date, df_snapshot in df.groupby('asof_date', sort=True):
+        path = directory / f"fund_returns_{asof_date}.xlsx"
+        to_excel_frame(df_snapshot).to_excel(path, index=False)
+        paths[asof_date] = path
+    return paths
+
+
+def to_records(df):
+    """DataFrame을 적재용 레코드 튜플 목록으로 바꾸는 함수 (NaN -> None)"""
+    from database import RECORD_COLUMNS
+
+    df_records = df[RECORD_COLUMNS].astype(object).where(df[RECORD_COLUMNS].notna(), None)
+    return list(df_records.itertuples(index=False, name=None))
+
+
+def load_database(df, conn=None):
+    """합성 데이터를 현재 DB에 적재하고 지표/분포 요약까지 계산하는 함수 (적재 건수 반환)
+
+    conn을 주지 않으면 config.DB_FILE에 연결해 커밋까지 합니다.
+    """
+    from database import bootstrap_database, get_db_connection, ingest_records
+    from metrics import refresh_metrics
+    from sketches import refresh_sketches
+
+    own_connection = conn is None
+    if own_connection:
+        bootstrap_database()
+        conn = get_db_connection()
+    try:
+        saved = 0
+        for _, df_snapshot in df.groupby('asof_date', sort=True):
+            saved += ingest_records(conn, to_records(df_snapshot))[0]
+        refresh_metrics(conn)
+        refresh_sketches(conn)
+        if own_connection:
+            conn.commit()
+        return saved
+    finally:
+        if own_connection:
+            conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="합성 펀드 수익률 데이터 생성")
+    parser.add_argument('--managers', type=int, default=10, help="운용사 수")
+    parser.add_argument('--products', type=int, default=50, help="운용사당 상품 수")
+    parser.add_argument('--dates', type=int, default=36, help="기준일(월말) 수")
+    parser.add_argument('--end-date', default=DEFAULT_END_DATE, help="마지막 기준일")
+    parser.add_argument('--seed', type=int, default=0, help="난수 seed")
+    parser.add_argument('--xlsx-dir', help="기준일별 업로드용 엑셀 파일을 쓸 디렉토리")
+    parser.add_argument('--db-dir', help="이 디렉토리의 DB 파일에 적재 (앱 DB와 섞이지 않게 별도 디렉토리 권장)")
+    args = parser.parse_args()
+
+    if not args.xlsx_dir and not args.db_dir:
+        parser.error("--xlsx-dir 또는 --db-dir 중 하나 이상을 지정하세요.")
+
+    df = generate_returns(args.managers, args.products, args.dates, args.end_date, args.seed)
+    print(f"생성: {len(df):,}행 (운용사 {args.managers}개 x 상품 {args.products}개 x 기준일 {args.dates}개)")
+
+    if args.xlsx_dir:
+        paths = write_excel_files(df, args.xlsx_dir)
+        print(f"엑셀 파일 {len(paths)}개 -> {Path(args.xlsx_dir).resolve()}")
+    if args.db_dir:
+        # DB_FILE은 작업 디렉토리 기준 상대 경로이므로 대상 디렉토리로 이동해서 적재
+        Path(args.db_dir).mkdir(parents=True, exist_ok=True)
+        os.chdir(args.db_dir)
+        print(f"DB 적재: {load_database(df):,}행 -> {Path.cwd()}")
@@ -0,0 +1,174 @@
+# 업로드 데이터 검증/숫자 정규화 모듈
+# 엑셀에서 읽은 DataFrame(DB 컬럼 이름)을 컬럼 단위 벡터 연산으로 검사해 적재 가능한 형태로 바꿉니다.
+#   - "12.3%", "1,234,567,890", "(1.2)", "−0.5" 같은 텍스트 숫자를 숫자로 변환 (수익률은 % 단위 그대로)
+#   - "-", "N/A", 빈 칸 등은 빈 값(NULL)으로 처리
+#   - 숫자로 읽을 수 없는 값과 범위를 벗어난 값(-100% 미만 수익률, 음수 총액)은 빈 값으로 바꾸고 거부 건수로 집계
+#   - 수익률은 중앙값/MAD 기반 robust z-score로 이상치를 표시 (값은 그대로 저장)
+#   - 운용사/상품명이 없는 행은 제외하고, 같은 상품이 여러 번 나오면 마지막 행만 남김
+# 모든 검사는 SQLite에 쓰기 전에 끝나며, 결과 보고서는 컬럼별 건수와 예시 값을 담습니다.
+import numpy as np
+import pandas as pd
+
+from config import UPLOAD_MIN_RETURN, UPLOAD_ROBUST_Z_LIMIT
+
+KEY_COLUMNS = ['manager', 'product_name']
+RETURN_VALUE_COLUMNS = ['r_1m', 'r_3m', 'r_6m', 'r_1y', 'r_2y', 'r_3y', 'since_inception']
+AMOUNT_COLUMN = 'total_amount'
+NUMERIC_COLUMNS = RETURN_VALUE_COLUMNS + [AMOUNT_COLUMN]
+
+# 빈 값으로 보는 표기
+MISSING_TOKENS = {'', '-', '--', '–', '—', 'n/a', 'na', 'nan', 'none', 'null', '#n/a', '#value!', '#div/0!'}
+
+MAD_SCALE = 0.6745           # MAD를 정규분포 표준편차 단위로 맞추는 계수
+EXAMPLE_LIMIT = 3            # 보고서에 남기는 거부 값 예시 수
+OUTLIER_LIMIT = 20           # 보고서에 남기는 이상치 행 수
+
+
+# 숫자 문자열에서 지울 문자(천 단위 구분, %, 괄호, 통화 표기)와 유니코드 마이너스 변환
+_NUMBER_TRANSLATION = str.maketrans({',': None, '%': None, ' ': None, '(': None, ')': None,
+                                     '₩': None, '원': None, '\u2212': '-'})
+
+
+def _is_missing_text(text):
+    """문자열 Series에서 빈 값 표기인 위치를 반환하는 함수"""
+    return text.isna() | text.str.lower().isin(MISSING_TOKENS)
+
+
+def _parse_text_numbers(text):
+    """숫자 문자열 Series를 정리해 숫자로 바꾸는 함수 (반환값: float 배열, 빈 값 표기 위치 배열)"""
+    text = text.astype(str).str.strip()
+    negative = text.str.match(r'\(.*\)$').to_numpy(dtype=bool)
+    cleaned = text.str.translate(_NUMBER_TRANSLATION)
+    missing = _is_missing_text(cleaned).to_numpy(dtype=bool)
+    parsed = pd.to_numeric(cleaned.where(~missing), errors='coerce').to_numpy(dtype=float)
+    return np.where(negative, -parsed, parsed), missing
+
+
+def _expand(codes, unique_values, fill):
+    """factorize 코드로 고유값 결과를 원래 위치로 펼치는 함수 (코드 -1은 fill)"""
+    if not len(unique_values):
+        return np.full(len(codes), fill)
+    return np.where(codes >= 0, unique_values[np.maximum(codes, 0)], fill)
+
+
+def parse_numeric(series):
+    """텍스트가 섞인 컬럼을 숫자로 일괄 변환하는 함수
+
+    같은 값이 여러 번 나오는 엑셀 컬럼 특성상 고유값만 변환한 뒤 위치별로 펼칩니다.
+    반환값: (float Series, 텍스트 형식을 변환한 위치, 숫자로 읽지 못한 위치)
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        no_flags = pd.Series(False, index=series.index)
+        return series.astype(float), no_flags, no_flags
+
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Series(uniques, dtype=object)
+    # 숫자와 일반 숫자 문자열은 바로 변환하고, 실패한 값만 텍스트 정리 후 다시 변환
+    values = pd.to_numeric(uniques, errors='coerce').to_numpy(dtype=float)
+    converted = np.zeros(len(uniques), dtype=bool)
+    invalid = np.zeros(len(uniques), dtype=bool)
+    retry = np.isnan(values)
+    if retry.any():
+        parsed, missing = _parse_text_numbers(uniques[retry])
+        values[retry] = parsed
+        converted[retry] = ~np.isnan(parsed)
+        invalid[retry] = np.isnan(parsed) & ~missing
+
+    return (
+        pd.Series(_expand(codes, values, np.nan), index=series.index),
+        pd.Series(_expand(codes, converted, False), index=series.index),
+        pd.Series(_expand(codes, invalid, False), index=series.index),
+    )
+
+
+def clean_text(series):
+    """운용사/상품명 컬럼의 앞뒤 공백을 지우고 빈 값 표기를 None으로 바꾸는 함수 (고유값 단위)"""
+    codes, uniques = pd.factorize(series.astype(str).where(series.notna()))
+    uniques = pd.Series(uniques, dtype=object).str.strip()
+    uniques = uniques.where(~_is_missing_text(uniques)).to_numpy(dtype=object)
+    return pd.Series(_expand(codes, uniques, None), index=series.index, dtype=object)
+
+
+def robust_z(values):
+    """중앙값과 MAD로 계산한 robust z-score를 반환하는 함수 (MAD가 0이면 모두 0)"""
+    observed = values.dropna()
+    if observed.empty:
+        return pd.Series(0.0, index=values.index)
+    median = observed.median()
+    mad = (observed - median).abs().median()
+    if not mad:
+        return pd.Series(0.0, index=values.index)
+    return (MAD_SCALE * (values - median) / mad).fillna(0.0)
+
+
+def _examples(series, mask):
+    return [str(value) for value in series[mask].head(EXAMPLE_LIMIT)]
+
+
+def validate_frame(df):
+    """업로드 DataFrame(DB 컬럼 이름)을 검사/정규화하고 (정리된 DataFrame, 보고서)를 반환하는 함수
+
+    없는 컬럼은 빈 값으로 채웁니다. 보고서:
+      rows / accepted / missing_keys / duplicates : 행 단위 건수
+      columns  : 컬럼별 {column, present, converted, missing, invalid, out_of_range, outliers, examples}
+      outliers : 이상치 행 목록 {manager, product_name, column, value, z} (|z|가 큰 순서, OUTLIER_LIMIT개)
+    """
+    clean = pd.DataFrame(index=df.index)
+    for column in KEY_COLUMNS:
+        clean[column] = clean_text(df[column]) if column in df else None
+
+    columns = []
+    outliers = []
+    for column in NUMERIC_COLUMNS:
+        raw = df[column] if column in df else pd.Series(np.nan, index=df.index)
+        values, converted, invalid = parse_numeric(raw)
+
+        if column == AMOUNT_COLUMN:
+            out_of_range = values < 0
+        else:
+            out_of_range = values < UPLOAD_MIN_RETURN
+        values = values.mask(out_of_range)
+
+        outlier_count = 0
+        if column != AMOUNT_COLUMN:
+            z = robust_z(values)
+            flagged = z.abs() > UPLOAD_ROBUST_Z_LIMIT
+            outlier_count = int(flagged.sum())
+            outliers.extend(
+                {'manager': clean.at[idx, 'manager'], 'product_name': clean.at[idx, 'product_name'],
+                 'column': column, 'value': float(values.at[idx]), 'z': float(z.at[idx])}
+                for idx in z[flagged].abs().nlargest(OUTLIER_LIMIT).index
+            )
+
+        clean[column] = values
+        columns.append({
+            'column': column,
+            'present': column in df,
+            'converted': int(converted.sum()),
+            'missing': int(values.isna().sum() - invalid.sum() - out_of_range.sum()),
+            'invalid': int(invalid.sum()),
+            'out_of_range': int(out_of_range.sum()),
+            'outliers': outlier_count,
+            'examples': _examples(raw, invalid | out_of_range),
+        })
+
+    has_keys = clean['manager'].notna() & clean['product_name'].notna()
+    duplicated = clean.duplicated(KEY_COLUMNS, keep='last') & has_keys
+    accepted = clean[has_keys & ~duplicated]
+
+    report = {
+        'rows': len(df),
+        'accepted': len(accepted),
+        'missing_keys': int((~has_keys).sum()),
+        'duplicates': int(duplicated.sum()),
+        'columns': columns,
+        'outliers': sorted(outliers, key=lambda item: abs(item['z']), reverse=True)[:OUTLIER_LIMIT],
+    }
+    return accepted.reset_index(drop=True), report
+
+
+def to_records(clean, asof_date_str):
+    """정리된 DataFrame을 적재용 레코드 튜플 목록(database.RECORD_COLUMNS 순서)으로 바꾸는 함수"""
+    frame = clean[KEY_COLUMNS + NUMERIC_COLUMNS].astype(object)
+    frame = frame.where(clean[KEY_COLUMNS + NUMERIC_COLUMNS].notna(), None)
+    return [(asof_date_str,) + row for row in frame.itertuples(index=False, name=None)]
@@ -0,0 +1,41 @@
+# 페이지 라우터
+# 각 페이지는 views 패키지의 개별 모듈로 분리되어 있으며, 선택된 페이지의 모듈만
+# 처음 선택될 때 import 한 뒤 캐시해 둡니다. 페이지 모듈은 render() 함수를 제공합니다.
+import importlib
+import sys
+import threading
+
+# 메뉴 이름 -> 페이지 모듈 이름
+PAGES = {
+    "🏠 메인 화면": "home",
+    "📤 데이터 업로드": "upload",
+    "📈 수익률 분석": "returns",
+    "🏢 운용사별 분석": "managers",
+    "📊 상품별 분석": "products",
+    "🗑️ 데이터 초기화": "reset",
+    "📅 기간별 분석": "periods",
+    "📈 시계열 수익률": "timeseries",
+    "🔀 기준일 비교": "diff",
+}
+
+DEFAULT_PAGE = "🏠 메인 화면"
+
+_loaded_pages = {}
+_load_lock = threading.Lock()
+
+
+def load_page(menu):
+    """메뉴에 해당하는 페이지 모듈을 지연 import하고 캐시하는 함수"""
+    module_name = f"{__name__}.{PAGES.get(menu, PAGES[DEFAULT_PAGE])}"
+    module = _loaded_pages.get(module_name)
+    # 개발 중 파일이 수정되면 Streamlit이 sys.modules에서 모듈을 내리므로 다시 import 합니다.
+    if module is None or sys.modules.get(module_name) is not module:
+        with _load_lock:
+            module = importlib.import_module(module_name)
+            _loaded_pages[module_name] = module
+    return module
+
+
+def render_page(menu):
+    """선택된 메뉴의 페이지를 그리는 함수"""
+    load_page(menu).render()
@@ -0,0 +1,145 @@
+# 여러 페이지에서 함께 쓰는 상수와 차트 도우미
+import functools
+
+import streamlit as st
+
+from downsample import downsample_line
+from perf import begin_rerun, end_rerun, recording, span
+from startup import get_pyplot, get_plot_font
+from views import DEFAULT_PAGE, PAGES
+from views.perf_panel import remember_rerun
+
+# 화면에 표시하는 수익률 기간 -> DB 컬럼 매핑
+PERIOD_MAPPING = {
+    "1M": "r_1m",
+    "3M": "r_3m",
+    "6M": "r_6m",
+    "1Y": "r_1y",
+    "2Y": "r_2y",
+    "3Y": "r_3y",
+    "설정일이후": "since_inception"
+}
+
+RETURN_PERIODS = list(PERIOD_MAPPING.keys())
+
+RETURN_COLUMNS = list(PERIOD_MAPPING.values())
+
+
+# DB 컬럼 -> 한글 기간명 (히트맵 축 이름)
+RETURN_COLUMN_LABELS = {
+    'r_1m': '1개월',
+    'r_3m': '3개월',
+    'r_6m': '6개월',
+    'r_1y': '1년',
+    'r_2y': '2년',
+    'r_3y': '3년',
+    'since_inception': '설정일이후'
+}
+
+
+def selected_columns(periods):
+    """선택된 기간 목록을 DB 컬럼 목록으로 변환하는 함수"""
+    return [PERIOD_MAPPING[period] for period in periods if period in PERIOD_MAPPING]
+
+
+def fragment(func):
+    """st.fragment로 해당 부분만 다시 실행되도록 감싸는 데코레이터 (Streamlit 1.37 이상)
+
+    fragment만 다시 실행될 때는 app.py를 거치지 않으므로 여기서 rerun 기록을 따로 남깁니다.
+    기록의 페이지 이름은 '페이지 모듈#함수 이름'입니다.
+    """
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        if recording():
+            # 페이지 전체 rerun 중에는 그 기록에 포함
+            return func(*args, **kwargs)
+        page = PAGES.get(st.session_state.get('menu'), PAGES[DEFAULT_PAGE])
+        begin_rerun(f"{page}#{func.__name__}")
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record = end_rerun()
+            if record:
+                remember_rerun(record)
+
+    return st.fragment(run)
+
+
+def polling_fragment(run_every):
+    """run_every초마다 해당 부분만 다시 실행되도록 감싸는 데코레이터를 만드는 함수
+
+    run_every가 None이면 주기 실행 없이 감쌉니다.
+    """
+    if run_every is None:
+        return fragment
+    return st.fragment(run_every=run_every)
+
+
+def new_figure(figsize):
+    """한글 폰트가 설정된 matplotlib Figure/Axes를 만드는 함수"""
+    plt = get_pyplot()
+    return plt.subplots(figsize=figsize)
+
+
+def figure_title(fig):
+    """Figure 첫 번째 Axes의 제목을 반환하는 함수 (성능 계측 구간 이름용)"""
+    return fig.axes[0].get_title() if fig.axes and fig.axes[0].get_title() else 'figure'
+
+
+def show_figure(fig, close=True):
+    """matplotlib Figure를 화면에 출력하고 메모리에서 해제하는 함수"""
+    with span('chart', f"render: {figure_title(fig)}"):
+        st.pyplot(fig)
+    if close:
+        get_pyplot().close(fig)
+
+
+def show_plotly(fig):
+    """plotly Figure를 화면 너비에 맞춰 출력하는 함수"""
+    title = fig.layout.title.text if fig.layout.title and fig.layout.title.text else 'plotly'
+    with span('chart', f"render: {title}"):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def set_axis_labels(ax, xlabel=None, ylabel=None, title=None):
+    """축 이름과 제목을 한글 폰트로 설정하는 함수"""
+    font_prop = get_plot_font()
+    font_kwargs = {'fontproperties': font_prop} if font_prop else {}
+    if xlabel is not None:
+        ax.set_xlabel(xlabel, fontsize=12, **font_kwargs)
+    if ylabel is not None:
+        ax.set_ylabel(ylabel, fontsize=12, **font_kwargs)
+    if title is not None:
+        ax.set_title(title, fontsize=14, fontweight='bold', **font_kwargs)
+
+
+def set_legend(ax, *args, **kwargs):
+    """범례를 한글 폰트로 표시하는 함수"""
+    font_prop = get_plot_font()
+    if font_prop:
+        kwargs['prop'] = font_prop
+    ax.legend(*args, fontsize=10, **kwargs)
+
+
+def plot_line(ax, x, y, max_points=None, **kwargs):
+    """라인을 그리되 점이 max_points보다 많으면 LTTB로 줄여서 그리는 함수
+
+    줄인 라인은 마커를 생략합니다(남은 점만 찍히면 실제 관측 지점처럼 보이므로).
+    반환값: 줄였는지 여부
+    """
+    downsampled = False
+    if max_points:
+        x, y, downsampled = downsample_line(x, y, max_points)
+    if downsampled:
+        kwargs.pop('marker', None)
+        kwargs.pop('markersize', None)
+    ax.plot(x, y, **kwargs)
+    return downsampled
+
+
+def show_ai_hint(ai_analysis_enabled):
+    """AI 분석이 비활성화된 경우 안내 문구를 표시하는 함수"""
+    if ai_analysis_enabled:
+        st.info("💡 AI 분석을 사용하려면 올바른 패스워드를 입력해주세요.")
+    else:
+        st.info("💡 AI 분석을 사용하려면 사이드바에서 'AI분석 포함'을 체크하고 패스워드를 입력해주세요.")
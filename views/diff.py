@@ -0,0 +1,130 @@
+# 🔀 기준일 비교
+# 두 기준일 사이에 새로 들어오거나 빠진 상품, 총액 변화, 수익률 순위 변화를 운용사별/상품별로 보여 줍니다.
+# 계산은 snapshot_diff.py가 하고 결과는 기준일 쌍마다 공유 캐시에 있으므로, 표시 조건만 바꾸면 다시 계산하지 않습니다.
+import streamlit as st
+
+from perf import timed
+from snapshot_diff import (
+    STATUS_NEW, STATUS_REMOVED, STATUS_KEPT, load_fund_diff, load_manager_diff, snapshot_dates,
+)
+from views.common import PERIOD_MAPPING, RETURN_PERIODS
+
+# 표시용 컬럼 이름
+DIFF_LABELS = {
+    'manager': '운용사',
+    'product_name': '상품명',
+    'status': '상태',
+    'return_before': '이전 수익률',
+    'return_after': '이후 수익률',
+    'return_change': '수익률 변화',
+    'assets_before': '이전 총액',
+    'assets_after': '이후 총액',
+    'assets_change': '총액 변화',
+    'assets_change_pct': '총액 변화율(%)',
+    'rank_before': '이전 순위',
+    'rank_after': '이후 순위',
+    'rank_change': '순위 변화',
+    'products_before': '이전 상품 수',
+    'products_after': '이후 상품 수',
+    'new_products': '신규 상품',
+    'removed_products': '제외 상품',
+    'avg_return_before': '이전 평균 수익률',
+    'avg_return_after': '이후 평균 수익률',
+    'avg_return_change': '평균 수익률 변화',
+}
+
+# 상품별 변화 보기 -> (상태 조건, 정렬 컬럼, 오름차순 여부, 절댓값 정렬 여부)
+FUND_VIEWS = {
+    "총액 변화 큰 순": (None, 'assets_change', False, True),
+    "순위 상승": (STATUS_KEPT, 'rank_change', False, False),
+    "순위 하락": (STATUS_KEPT, 'rank_change', True, False),
+    "신규 상품": (STATUS_NEW, 'assets_after', False, False),
+    "제외 상품": (STATUS_REMOVED, 'assets_before', False, False),
+}
+
+
+@timed('pandas')
+def select_funds(df_fund, view, manager=None, limit=50):
+    """상품별 변화에서 보기 조건에 맞는 상품을 골라 정렬하는 함수 (공유 캐시 결과는 고치지 않음)"""
+    status, sort_column, ascending, by_abs = FUND_VIEWS[view]
+    df = df_fund
+    if status is not None:
+        df = df[df['status'] == status]
+    if manager is not None:
+        df = df[df['manager'] == manager]
+    if status == STATUS_KEPT:
+        # 순위 상승/하락은 실제로 순위가 바뀐 상품만
+        df = df[df['rank_change'] > 0] if not ascending else df[df['rank_change'] < 0]
+    df = df.sort_values(sort_column, ascending=ascending, key=abs if by_abs else None, na_position='last')
+    return df.head(limit)
+
+
+def format_diff(df):
+    """변화 DataFrame을 표시용 컬럼 이름/자릿수로 바꾸는 함수"""
+    return df.drop(columns=['product_id'], errors='ignore').round(2).rename(columns=DIFF_LABELS)
+
+
+def render():
+    """기준일 비교 페이지를 그리는 함수"""
+    st.title("🔀 기준일 비교 (SQLite)")
+
+    dates = snapshot_dates()
+    if len(dates) < 2:
+        st.warning("비교하려면 기준일이 두 개 이상 필요합니다. 먼저 데이터를 업로드해주세요.")
+        return
+
+    # 비교 옵션 (기본: 최근 기준일과 바로 앞 기준일)
+    st.subheader("🔧 비교 옵션 설정")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        before = st.selectbox("이전 기준일", dates, index=1, key="diff_before")
+    with col2:
+        after = st.selectbox("이후 기준일", dates, index=0, key="diff_after")
+    with col3:
+        period = st.selectbox("순위/수익률 기준 기간", RETURN_PERIODS, index=RETURN_PERIODS.index("1Y"),
+                              key="diff_period")
+    if before == after:
+        st.warning("서로 다른 기준일을 선택해주세요.")
+        return
+
+    try:
+        df_fund = load_fund_diff(before, after, PERIOD_MAPPING[period])
+        df_manager = load_manager_diff(before, after, PERIOD_MAPPING[period])
+    except Exception as e:
+        st.error(f"비교 중 오류 발생: {e}")
+        return
+
+    # 요약
+    status_counts = df_fund['status'].value_counts()
+    assets_before = df_manager['assets_before'].sum()
+    assets_after = df_manager['assets_after'].sum()
+    st.subheader(f"📊 {before} → {after} 요약")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("상품 수", f"{int(status_counts.get(STATUS_NEW, 0) + status_counts.get(STATUS_KEPT, 0)):,}개",
+                  f"{int(status_counts.get(STATUS_NEW, 0) - status_counts.get(STATUS_REMOVED, 0)):+,}")
+    with col2:
+        st.metric("신규 상품", f"{int(status_counts.get(STATUS_NEW, 0)):,}개")
+    with col3:
+        st.metric("제외 상품", f"{int(status_counts.get(STATUS_REMOVED, 0)):,}개")
+    with col4:
+        st.metric("전체 총 자산", f"{assets_after:,.0f}원", f"{assets_after - assets_before:+,.0f}원")
+
+    # 운용사별 변화
+    st.subheader("🏢 운용사별 변화")
+    st.dataframe(format_diff(df_manager), use_container_width=True, hide_index=True)
+
+    # 상품별 변화
+    st.subheader("📋 상품별 변화")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        view = st.selectbox("보기", list(FUND_VIEWS), key="diff_fund_view")
+    with col2:
+        manager = st.selectbox("운용사", ["전체"] + df_manager['manager'].tolist(), key="diff_fund_manager")
+    with col3:
+        limit = st.number_input("표시 개수", min_value=10, max_value=1000, value=50, step=10, key="diff_fund_limit")
+    df_view = select_funds(df_fund, view, None if manager == "전체" else manager, limit)
+    if df_view.empty:
+        st.info("조건에 맞는 상품이 없습니다.")
+    else:
+        st.dataframe(format_diff(df_view), use_container_width=True, hide_index=True)
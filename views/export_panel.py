@@ -0,0 +1,59 @@
+# ⬇️ 분석 결과 내보내기 (각 분석 페이지 하단에서 사용)
+# 화면의 표를 긁어 가지 않아도 되도록, 해당 페이지의 원본 조회 결과를
+# export.py로 묶음 단위로 파일에 쓴 뒤 다운로드 버튼으로 내려줍니다.
+# 파일을 만드는 동안은 한 묶음만 메모리에 올라가지만, st.download_button은 파일 전체를 서버 메모리에
+# 올려 두고 내려주므로 다운로드 한 번에 파일 크기만큼(최대 EXPORT_DOWNLOAD_MAX_MB) 메모리를 씁니다.
+import os
+
+import streamlit as st
+
+from config import EXPORT_DOWNLOAD_MAX_MB
+from export import EXPORT_FORMATS, export_to_file
+from views.common import fragment
+
+
+@fragment
+def render_export_panel(key, query, params, file_stem, title="⬇️ 결과 내보내기"):
+    """조회 SQL 결과를 CSV/Excel 파일로 내보내는 영역을 그리는 함수
+
+    파일은 '내보내기 파일 만들기'를 누를 때만 만들고, 다운로드 버튼은 그 직후에만 표시합니다.
+    파일이 EXPORT_DOWNLOAD_MAX_MB보다 크면 메모리에 올리지 않고 조회 범위를 줄이도록 안내합니다.
+    """
+    st.subheader(title)
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        export_format = st.radio("파일 형식", list(EXPORT_FORMATS.keys()), horizontal=True, key=f"{key}_export_format")
+    with col2:
+        prepare = st.button("내보내기 파일 만들기", key=f"{key}_export_prepare")
+
+    if not prepare:
+        return
+
+    extension, mime = EXPORT_FORMATS[export_format]
+    path = None
+    try:
+        with st.spinner("내보내기 파일을 만드는 중입니다..."):
+            path, row_count = export_to_file(query, params, export_format)
+
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        if size_mb > EXPORT_DOWNLOAD_MAX_MB:
+            st.warning(f"내보내기 파일이 {size_mb:,.1f}MB로 다운로드 한도({EXPORT_DOWNLOAD_MAX_MB:,}MB)보다 큽니다. "
+                       f"기간을 줄여 다시 만들어주세요.")
+            return
+        st.caption(f"파일 크기 {size_mb:,.1f}MB (다운로드 동안 서버 메모리에 파일 전체가 올라갑니다, 한도 "
+                   f"{EXPORT_DOWNLOAD_MAX_MB:,}MB)")
+        with open(path, 'rb') as fileobj:
+            st.download_button(
+                f"⬇️ {file_stem}.{extension} 다운로드 ({row_count:,}행)",
+                fileobj,
+                file_name=f"{file_stem}.{extension}",
+                mime=mime,
+                key=f"{key}_export_download"
+            )
+    except Exception as e:
+        st.error(f"내보내기 중 오류 발생: {e}")
+    finally:
+        # 다운로드 버튼이 내용을 넘겨받았으므로 임시 파일은 바로 정리
+        if path and os.path.exists(path):
+            os.remove(path)
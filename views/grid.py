@@ -0,0 +1,171 @@
+# 페이지 단위 데이터 표 (SQL keyset 페이지네이션)
+# 결과 전체를 st.dataframe으로 보내는 대신, 정렬/필터를 SQL에서 처리하고
+# 현재 페이지의 행만 조회해서 표시합니다. 다음 페이지는 OFFSET 대신 직전 페이지 마지막 행의
+# (정렬값, 키) 뒤부터 읽으므로 페이지가 뒤로 가도 조회 비용이 늘지 않습니다.
+# 정렬은 컬럼 그대로 하므로(SQLite는 NULL을 가장 작은 값으로 정렬) 원본이 테이블/단순 뷰면 인덱스로 읽을 수 있고,
+# 정렬값이 NULL인 행은 keyset 조건을 (IS NULL, 값)으로 나눠 비교합니다.
+# 전체 행 수는 (원본, 파라미터, 필터, data_version)마다 공유 캐시에 두어 페이지를 넘길 때 다시 세지 않습니다.
+import pandas as pd
+import streamlit as st
+
+from database import execute_sql_query
+from frame_cache import cached_result
+from views.common import fragment
+
+PAGE_SIZE_OPTIONS = [25, 50, 100]
+
+
+def _keyset_clause(sort_column, key_columns, descending, after):
+    """직전 페이지 마지막 행 after = (정렬값, 키...) 뒤의 행을 고르는 조건과 파라미터를 만드는 함수"""
+    op = '<' if descending else '>'
+    sort_value, keys = after[0], list(after[1:])
+    if sort_column in key_columns:
+        # 키 컬럼은 NULL이 아니므로 ORDER BY와 같은 순서(정렬 컬럼, 나머지 키)로 바로 비교
+        rest = [(column, value) for column, value in zip(key_columns, keys) if column != sort_column]
+        columns = [sort_column] + [column for column, _ in rest]
+        return (f"({', '.join(columns)}) {op} ({', '.join(['?'] * len(columns))})",
+                [sort_value] + [value for _, value in rest])
+
+    key_terms = ', '.join(key_columns)
+    key_marks = ', '.join(['?'] * len(keys))
+    if sort_value is None:
+        # NULL 구간 안에서는 키로만 비교, 오름차순이면 NULL 구간 뒤에 값이 있는 행들이 이어짐
+        clause = f"({sort_column} IS NULL AND ({key_terms}) {op} ({key_marks}))"
+        if not descending:
+            clause = f"({clause} OR {sort_column} IS NOT NULL)"
+        return clause, keys
+
+    clause = f"({sort_column}, {key_terms}) {op} (?, {key_marks})"
+    if descending:
+        # 내림차순이면 값이 있는 행 다음에 NULL 행들이 이어짐
+        clause = f"({clause} OR {sort_column} IS NULL)"
+    return clause, [sort_value] + keys
+
+
+def build_page_query(source_sql, columns, key_columns, sort_column, descending,
+                     filter_column=None, filter_text=None, after=None, limit=50):
+    """한 페이지 조회 SQL과 파라미터 목록(원본 파라미터 뒤에 붙일 것)을 만드는 함수
+
+    after는 직전 페이지 마지막 행의 (정렬값, 키...) 튜플입니다 (정렬값이 NULL이면 None).
+    limit보다 한 행 더 읽어 다음 페이지가 있는지 판단합니다.
+    """
+    order_columns = list(dict.fromkeys([sort_column] + list(key_columns)))
+    direction = 'DESC' if descending else 'ASC'
+
+    where, params = _filter_clause(filter_column, filter_text)
+    if after is not None:
+        clause, keyset_params = _keyset_clause(sort_column, key_columns, descending, after)
+        where.append(clause)
+        params.extend(keyset_params)
+
+    select_columns = list(dict.fromkeys(list(columns) + order_columns))
+    query = f"""
+        SELECT {', '.join(select_columns)}
+        FROM ({source_sql}) src
+        {'WHERE ' + ' AND '.join(where) if where else ''}
+        ORDER BY {', '.join(f'{column} {direction}' for column in order_columns)}
+        LIMIT ?
+    """
+    params.append(limit + 1)
+    return query, params
+
+
+def build_count_query(source_sql, filter_column=None, filter_text=None):
+    """필터 조건에 맞는 전체 행 수를 세는 SQL과 추가 파라미터를 만드는 함수"""
+    where, params = _filter_clause(filter_column, filter_text)
+    query = f"SELECT COUNT(*) as count FROM ({source_sql}) src {'WHERE ' + ' AND '.join(where) if where else ''}"
+    return query, params
+
+
+def count_rows(source_sql, params, filter_column=None, filter_text=None):
+    """필터 조건에 맞는 전체 행 수를 반환하는 함수 (데이터가 그대로면 공유 캐시에서)"""
+    count_query, count_params = build_count_query(source_sql, filter_column, filter_text)
+    df_count = cached_result('grid.count', (source_sql, tuple(params or ()), filter_column, filter_text),
+                             lambda: execute_sql_query(count_query, params=list(params or ()) + count_params))
+    return int(df_count['count'].iloc[0])
+
+
+def _filter_clause(filter_column, filter_text):
+    if filter_column and filter_text:
+        return [f"{filter_column} LIKE ?"], [f"%{filter_text}%"]
+    return [], []
+
+
+def _reset_pages(state_key):
+    st.session_state[state_key] = {'cursors': [None], 'page': 0}
+
+
+def _move_page(state_key, step):
+    state = st.session_state[state_key]
+    state['page'] = max(0, state['page'] + step)
+
+
+# fragment: 표 조작(정렬, 페이지 이동)은 페이지 전체가 아닌 표만 다시 그립니다.
+@fragment
+def render_grid(key, source_sql, params, columns, key_columns, sort_options, default_sort,
+                descending=True, filter_column=None, filter_label=None, labels=None):
+    """SQL 결과를 페이지 단위로 보여주는 표를 그리는 함수
+
+    key          : 위젯/상태 이름 접두어 (페이지마다 다르게)
+    source_sql   : 원본 조회 SQL (ORDER BY/LIMIT 없이), params는 그 파라미터
+    columns      : 표에 표시할 컬럼
+    key_columns  : 행을 유일하게 구분하는 컬럼 (keyset 기준, 인덱스 컬럼 권장)
+    sort_options : {표시 이름: 정렬 컬럼}
+    labels       : {컬럼: 표시 이름} (없으면 컬럼 이름 그대로)
+    """
+    sort_labels = list(sort_options.keys())
+    default_label = next((label for label, col in sort_options.items() if col == default_sort), sort_labels[0])
+
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+    with col1:
+        sort_label = st.selectbox("정렬 기준", sort_labels, index=sort_labels.index(default_label), key=f"{key}_grid_sort")
+    with col2:
+        descending = st.checkbox("내림차순", value=descending, key=f"{key}_grid_desc")
+    with col3:
+        filter_text = st.text_input(filter_label or "검색", key=f"{key}_grid_filter").strip() if filter_column else None
+    with col4:
+        page_size = st.selectbox("행 수", PAGE_SIZE_OPTIONS, index=1, key=f"{key}_grid_page_size")
+    sort_column = sort_options[sort_label]
+
+    # 조회 조건이 바뀌면 첫 페이지부터
+    state_key = f"{key}_grid_state"
+    signature = (source_sql, tuple(params or ()), sort_column, descending, filter_text, page_size)
+    if st.session_state.get(f"{key}_grid_signature") != signature:
+        st.session_state[f"{key}_grid_signature"] = signature
+        _reset_pages(state_key)
+    state = st.session_state[state_key]
+    page = state['page'] = min(state['page'], len(state['cursors']) - 1)
+
+    total = count_rows(source_sql, params, filter_column, filter_text)
+
+    page_query, page_params = build_page_query(
+        source_sql, columns, key_columns, sort_column, descending,
+        filter_column, filter_text, state['cursors'][page], page_size
+    )
+    df_page = execute_sql_query(page_query, params=list(params or ()) + page_params)
+
+    has_next = len(df_page) > page_size
+    df_page = df_page.head(page_size)
+    if has_next:
+        # 다음 페이지 시작점 = 이번 페이지 마지막 행의 (정렬값, 키...)
+        last = df_page.iloc[-1]
+        cursor = tuple(None if pd.isna(value) else value.item() if hasattr(value, 'item') else value
+                       for value in last[[sort_column] + list(key_columns)])
+        del state['cursors'][page + 1:]
+        state['cursors'].append(cursor)
+
+    df_display = df_page[list(columns)]
+    if labels:
+        df_display = df_display.rename(columns=labels)
+    st.dataframe(df_display, use_container_width=True, hide_index=True)
+
+    first_row = page * page_size + 1 if total else 0
+    nav1, nav2, nav3 = st.columns([1, 3, 1])
+    with nav1:
+        st.button("◀ 이전", key=f"{key}_grid_prev", disabled=page == 0,
+                  on_click=_move_page, args=(state_key, -1))
+    with nav2:
+        st.caption(f"{first_row:,}~{page * page_size + len(df_page):,} / 총 {total:,}행")
+    with nav3:
+        st.button("다음 ▶", key=f"{key}_grid_next", disabled=not has_next,
+                  on_click=_move_page, args=(state_key, 1))
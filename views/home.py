@@ -0,0 +1,133 @@
+# 🏠 메인 화면
+import time
+from pathlib import Path
+
+import streamlit as st
+
+# 앱 파일 기준 디렉토리 (views 패키지의 상위)
+BASE_DIR = Path(__file__).parent.parent
+
+
+def render():
+    """메인 화면을 그리는 함수"""
+    st.title("📊 과학기술공제회 펀드상품 AI분석")
+    
+    # 메인 소개 섹션
+    st.markdown("---")
+    
+    # 첫 번째 소개 문단
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 15px; color: white; margin-bottom: 2rem;">
+        <h2 style="color: white; margin-bottom: 1rem;">🎯 펀드 선택, 더 이상 복잡하게 고민하지 마세요</h2>
+        <p style="font-size: 1.1rem; line-height: 1.6;">
+            AI가 과거 데이터부터 최신 추세까지 정밀 분석해, 과학기술공제회 펀드 상품의 장점과 리스크를 한눈에 보여드립니다. 
+            투자자는 중요한 판단에만 집중할 수 있습니다.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 두 번째 소개 문단
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 2rem; border-radius: 15px; color: white; margin-bottom: 2rem;">
+        <h2 style="color: white; margin-bottom: 1rem;">💡 실제 투자자를 위한 맞춤형 분석</h2>
+        <p style="font-size: 1.1rem; line-height: 1.6;">
+            우리의 AI 분석 서비스는 단순한 수치 나열을 넘어, 실제 투자자가 이해하기 쉽게 핵심 포인트를 정리해 드립니다. 
+            안정성과 성장성을 함께 확인하며, 더 똑똑하고 더 자신 있는 투자를 경험해 보세요.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 서비스 특징
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 2rem; border-radius: 15px; color: white; margin-bottom: 2rem;">
+        <h2 style="color: white; margin-bottom: 1.5rem;">🚀 우리 서비스의 특징</h2>
+        <div style="display: flex; flex-direction: column; gap: 1rem;">
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 1.5rem;">🤖</span>
+                <div>
+                    <strong>AI 기반 분석</strong><br>
+                    <span style="font-size: 0.95rem;">펀드 성과·위험·추세를 데이터로 파악</span>
+                </div>
+            </div>
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 1.5rem;">🎯</span>
+                <div>
+                    <strong>맞춤형 인사이트</strong><br>
+                    <span style="font-size: 0.95rem;">이용자 관심사에 맞춘 핵심 정보 제공</span>
+                </div>
+            </div>
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 1.5rem;">🛡️</span>
+                <div>
+                    <strong>신뢰와 혁신</strong><br>
+                    <span style="font-size: 0.95rem;">과학기술공제회와 AI의 결합으로 더 안전한 투자 지원</span>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # 사용 안내
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); padding: 2rem; border-radius: 15px; margin-bottom: 2rem;">
+        <h3 style="color: #2c3e50; margin-bottom: 1rem;">📋 데이터 분석 메뉴 안내</h3>
+        <div style="color: #34495e; line-height: 1.8;">
+            <p><strong>📈 수익률 분석:</strong> 기간을 선택하여 전체 펀드의 수익률 분포, 통계, 순위를 분석합니다.</p>
+            <p><strong>🏢 운용사별 분석:</strong> 운용사별 상품 수, 평균 수익률, 총 자산을 비교 분석합니다.</p>
+            <p><strong>📈 시계열 수익률:</strong> 특정 운용사의 상품들을 선택하여 시간에 따른 수익률 변화를 분석합니다. AI 분석 기능을 사용할 수 있습니다.</p>
+            <p><strong>📊 상품별 분석:</strong> 선택한 운용사의 모든 상품을 수익률 히트맵과 자산 규모로 분석합니다.</p>
+            <p><strong>📅 기간별 분석:</strong> 시간에 따른 상품 수, 평균 수익률, 총 자산의 변화 추이를 분석합니다.</p>
+            <p><strong>🔀 기준일 비교:</strong> 두 기준일 사이에 새로 들어오거나 빠진 상품, 총액 변화, 수익률 순위 변화를 운용사별/상품별로 비교합니다.</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 이미지 슬라이드쇼 (Streamlit Cloud 호환: 1초 자동 교체)
+    # streamlit_autorefresh 모듈이 없을 경우를 대비한 fallback
+    try:
+        from streamlit_autorefresh import st_autorefresh
+        AUTOREFRESH_AVAILABLE = True
+    except ImportError:
+        AUTOREFRESH_AVAILABLE = False
+        def st_autorefresh(interval=1000, limit=None, key=None):
+            return int(time.time())
+
+    # 1초마다 앱을 rerun (JS 금지, 공식 autorefresh 사용)
+    # limit=None 이면 무제한 반복
+    tick = st_autorefresh(interval=1000, limit=None, key="image_slideshow_auto")
+
+    # 앱 파일 기준으로 images 디렉토리 안전하게 찾기 (경로 문제 예방)
+    IMAGES_DIR = (BASE_DIR / "images").resolve()
+
+    # 지원 확장자
+    EXTS = {".png", ".jpg", ".jpeg"}
+
+    # 이미지 목록 수집
+    image_files = sorted([p for p in IMAGES_DIR.glob("*") if p.suffix.lower() in EXTS])
+
+    placeholder = st.empty()  # 렌더 스킵 방지용 슬롯
+
+    if image_files:
+        # st_autorefresh가 돌 때마다 tick 이 1씩 증가 → 이걸로 인덱스 계산
+        idx = (tick if tick is not None else int(time.time())) % len(image_files)
+        current_image = image_files[idx]
+
+        # 파일 수정시간 (디버깅 및 caption 변화로 렌더 최적화 무력화)
+        try:
+            mtime = int(current_image.stat().st_mtime)
+        except FileNotFoundError:
+            mtime = 0
+
+        # 바이트로 읽어 캐시 완전 우회 (URL 캐시 안 씀)
+        with open(current_image, "rb") as f:
+            img_bytes = f.read()
+
+        # 매번 새로 그리기: placeholder 사용 + caption에 tick/mtime 섞어서
+        caption = f"이미지 {idx + 1}/{len(image_files)} • {current_image.name} • tick={tick} • mtime={mtime}"
+        placeholder.image(img_bytes, use_container_width=True, caption=caption)
+
+    else:
+        st.warning("⚠️ images 폴더에 이미지 파일이 없습니다.")
+        st.info("💡 PNG, JPG, JPEG 형식의 이미지를 images 폴더에 추가하세요.")
@@ -0,0 +1,69 @@
+# 쓰기 작업(write_queue) 진행 상황 표시
+# 페이지는 submit_job()이 돌려준 작업 id를 session_state에 두고 show_job()으로 상태를 그립니다.
+# 작업이 끝나지 않았으면 JOB_POLL_SECONDS마다 이 부분만 다시 그리고, 끝나면 페이지 전체를 한 번 다시 그립니다.
+from datetime import datetime
+
+import streamlit as st
+
+from config import JOB_POLL_SECONDS
+from views.common import polling_fragment
+from write_queue import DONE, FAILED, FINISHED_STATES, QUEUED, STATE_LABELS, get_job
+
+
+def job_running(session_key):
+    """세션에 등록된 작업이 아직 끝나지 않았는지 반환하는 함수"""
+    job_id = st.session_state.get(session_key)
+    job = get_job(job_id) if job_id else None
+    return job is not None and job['state'] not in FINISHED_STATES
+
+
+def _show_job(session_key, render_result, render_failure=None, polling=False):
+    job = get_job(st.session_state.get(session_key))
+    if job is None:
+        st.info("작업 기록이 없습니다. (앱이 다시 시작되었을 수 있습니다)")
+        return
+
+    finished = job['state'] in FINISHED_STATES
+    if polling and finished:
+        # 작업이 끝나면 페이지 전체를 다시 그려 주기 조회를 멈춤
+        st.rerun()
+
+    st.markdown(f"**{job['title']}** · {STATE_LABELS[job['state']]}")
+    if job['state'] == QUEUED:
+        st.info(f"⏳ 앞선 쓰기 작업 {job['position']}개가 끝나면 시작합니다.")
+    elif not finished:
+        elapsed = (datetime.now() - job['started_at']).total_seconds()
+        total = job['total'] or 0
+        if total:
+            st.progress(min(job['done'] / total, 1.0),
+                        text=f"{job['stage']} · {job['done']:,} / {total:,}행 · {elapsed:,.0f}초")
+        else:
+            st.progress(0.0, text=f"{job['stage'] or '준비 중'} · {elapsed:,.0f}초")
+    elif job['state'] == DONE:
+        render_result(job)
+    elif job['state'] == FAILED:
+        st.error(f"작업 오류: {job['error']}")
+        if render_failure:
+            render_failure(job)
+        st.code(job['traceback'])
+
+    for message in job['warnings']:
+        st.warning(message)
+
+    if finished:
+        st.button("확인", key=f"{session_key}_dismiss", on_click=st.session_state.pop, args=(session_key, None))
+
+
+# 작업이 진행 중일 때만 쓰는 주기 조회 fragment (진행 상황만 다시 그림)
+_poll_job = polling_fragment(JOB_POLL_SECONDS)(_show_job)
+
+
+def show_job(session_key, render_result, render_failure=None):
+    """session_state[session_key]에 등록된 쓰기 작업의 상태를 그리는 함수
+
+    render_result(job)는 작업이 끝났을 때, render_failure(job)는 실패했을 때 결과를 그립니다.
+    """
+    if job_running(session_key):
+        _poll_job(session_key, render_result, render_failure, polling=True)
+    else:
+        _show_job(session_key, render_result, render_failure)
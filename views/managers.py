@@ -0,0 +1,195 @@
+# 🏢 운용사별 분석
+import streamlit as st
+
+from config import TABLE_NAME, MANAGER_TABLE, PRODUCT_TABLE
+from frame_cache import frame_key, load_frame
+from perf import timed
+from views.common import new_figure, set_axis_labels, set_legend, show_figure
+from views.export_panel import render_export_panel
+from views.grid import render_grid
+
+# 분석 기준 -> (정렬 컬럼, 표시 이름)
+MANAGER_SORT_CRITERIA = {
+    "총 자산": ('total_assets', '총 자산'),
+    "상품 수": ('product_count', '상품 수'),
+    "평균 수익률": ('avg_1y_return', '평균 1년 수익률'),
+}
+
+
+# 운용사별 상품 수, 평균 수익률, 총 자산 집계 SQL
+MANAGER_SUMMARY_SQL = f"""
+    SELECT m.name as manager,
+           agg.product_count,
+           agg.avg_1y_return,
+           agg.avg_3y_return,
+           agg.total_assets
+    FROM (
+        SELECT p.manager_id,
+               COUNT(*) as product_count,
+               AVG(f.r_1y) as avg_1y_return,
+               AVG(f.r_3y) as avg_3y_return,
+               SUM(f.total_amount) as total_assets
+        FROM {TABLE_NAME} f
+        JOIN {PRODUCT_TABLE} p ON p.product_id = f.product_id
+        GROUP BY p.manager_id
+    ) agg
+    JOIN {MANAGER_TABLE} m ON m.manager_id = agg.manager_id
+"""
+
+# 상세 데이터 표 정렬 기준 -> 컬럼
+MANAGER_GRID_SORT = {
+    "총 자산": 'total_assets',
+    "상품 수": 'product_count',
+    "평균 1년 수익률": 'avg_1y_return',
+    "평균 3년 수익률": 'avg_3y_return',
+    "운용사명": 'manager',
+}
+
+
+# 운용사 요약 캐시 키 (총 자산 순서)
+MANAGER_SUMMARY_KEY = frame_key(MANAGER_SUMMARY_SQL + " ORDER BY agg.total_assets DESC")
+
+
+def default_keys():
+    """운용사별 분석이 읽는 캐시 키 목록을 반환하는 함수 (캐시 예열용)"""
+    return [MANAGER_SUMMARY_KEY]
+
+
+def load_manager_summary():
+    """운용사별 상품 수, 평균 수익률, 총 자산을 조회하는 함수 (세션 간 공유 캐시)"""
+    return load_frame(MANAGER_SUMMARY_KEY)
+
+
+@timed('pandas')
+def sort_managers(df_manager, analysis_criteria):
+    """분석 기준에 따라 운용사를 정렬하는 함수"""
+    sort_col, sort_title = MANAGER_SORT_CRITERIA.get(analysis_criteria, MANAGER_SORT_CRITERIA["평균 수익률"])
+    return df_manager.sort_values(sort_col, ascending=False), sort_col, sort_title
+
+
+def summarize_managers(df_manager):
+    """분석 요약 지표(운용사 수, 평균 상품 수, 전체 총 자산)를 계산하는 함수"""
+    return {
+        'manager_count': len(df_manager),
+        'avg_products': df_manager['product_count'].mean(),
+        'total_assets': df_manager['total_assets'].sum(),
+    }
+
+
+@timed('chart')
+def build_product_count_figure(df_top, top_n):
+    """운용사별 상품 수 막대 차트를 그리는 함수"""
+    fig, ax = new_figure((12, 6))
+    df_top.plot(x='manager', y='product_count', kind='bar', ax=ax, color='skyblue')
+    set_axis_labels(ax, '운용사', '상품 수', f'운용사별 상품 수 (상위 {top_n}개)')
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+@timed('chart')
+def build_returns_figure(df_top, top_n):
+    """운용사별 평균 1년/3년 수익률 막대 차트를 그리는 함수"""
+    fig, ax = new_figure((12, 6))
+    df_top.plot(x='manager', y=['avg_1y_return', 'avg_3y_return'], kind='bar', ax=ax)
+    set_axis_labels(ax, '운용사', '평균 수익률 (%)', f'운용사별 평균 수익률 (상위 {top_n}개)')
+    set_legend(ax, ['1년 수익률', '3년 수익률'])
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+@timed('chart')
+def build_assets_figure(df_top, top_n):
+    """운용사별 총 자산 막대 차트를 그리는 함수"""
+    fig, ax = new_figure((12, 6))
+    df_top.plot(x='manager', y='total_assets', kind='bar', ax=ax, color='green')
+    set_axis_labels(ax, '운용사', '총 자산 (원)', f'운용사별 총 자산 (상위 {top_n}개)')
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+def render():
+    """운용사별 분석 페이지를 그리는 함수"""
+    st.title("🏢 운용사별 분석 (SQLite)")
+
+    # 분석 옵션 설정
+    st.subheader("🔧 분석 옵션 설정")
+
+    # 분석 기준 선택
+    analysis_criteria = st.selectbox(
+        "분석 기준 선택",
+        ["총 자산", "상품 수", "평균 수익률"],
+        help="어떤 기준으로 운용사를 분석할지 선택하세요"
+    )
+
+    # 상위 N개 운용사 선택
+    top_n = st.slider("상위 N개 운용사", min_value=5, max_value=20, value=10)
+
+    # 시각화 옵션
+    st.subheader("📊 시각화 옵션")
+    show_product_count = st.checkbox("상품 수 차트", value=True)
+    show_returns = st.checkbox("수익률 차트", value=True)
+    show_assets = st.checkbox("자산 규모 차트", value=True)
+    show_details = st.checkbox("상세 데이터 테이블", value=True)
+
+    if st.button("🏢 운용사별 분석 실행", type="primary"):
+        try:
+            # SQLite DB에서 데이터 조회
+            df_manager = load_manager_summary()
+
+            if not df_manager.empty:
+                st.success(f"✅ 운용사별 분석 완료: {len(df_manager)}개 운용사")
+
+                # 분석 기준에 따른 정렬
+                df_manager_sorted, sort_col, sort_title = sort_managers(df_manager, analysis_criteria)
+                df_top = df_manager_sorted.head(top_n)
+
+                # 운용사별 상품 수
+                if show_product_count:
+                    st.subheader("📊 운용사별 상품 수")
+                    show_figure(build_product_count_figure(df_top, top_n))
+
+                # 운용사별 평균 수익률
+                if show_returns:
+                    st.subheader("📈 운용사별 평균 수익률")
+                    show_figure(build_returns_figure(df_top, top_n))
+
+                # 운용사별 총 자산
+                if show_assets:
+                    st.subheader("💰 운용사별 총 자산")
+                    show_figure(build_assets_figure(df_top, top_n))
+
+                # 상세 데이터 테이블
+                if show_details:
+                    st.subheader("📋 운용사별 상세 데이터")
+                    render_grid(
+                        "managers", MANAGER_SUMMARY_SQL, [],
+                        columns=list(df_manager.columns), key_columns=['manager'],
+                        sort_options=MANAGER_GRID_SORT, default_sort=sort_col,
+                        filter_column='manager', filter_label="운용사 검색"
+                    )
+
+                # 요약 정보
+                summary = summarize_managers(df_manager)
+                st.subheader("📊 분석 요약")
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.metric("총 운용사 수", summary['manager_count'])
+
+                with col2:
+                    st.metric("평균 상품 수", f"{summary['avg_products']:.1f}개")
+
+                with col3:
+                    st.metric("전체 총 자산", f"{summary['total_assets']:,.0f}원")
+
+            else:
+                st.warning("운용사별 데이터가 없습니다.")
+
+        except Exception as e:
+            st.error(f"분석 중 오류 발생: {e}")
+
+    # 운용사별 집계 결과 내보내기
+    render_export_panel("managers", MANAGER_SUMMARY_SQL + " ORDER BY agg.total_assets DESC", [], "manager_summary")
@@ -0,0 +1,62 @@
+# 📐 위험/성과 지표 표 (수익률 분석, 상품별 분석 페이지에서 함께 사용)
+# 지표는 업로드 시점에 product_metrics 테이블에 미리 계산되어 있으므로
+# 여기서는 인덱스 컬럼 기준 정렬/필터 조회만 합니다.
+import streamlit as st
+
+from database import execute_sql_query
+from metrics import METRIC_LABELS, SORTABLE_METRICS, metrics_query
+from perf import timed
+
+# 정렬 기준 표시 이름 -> 컬럼
+METRIC_SORT_OPTIONS = {METRIC_LABELS[col]: col for col in SORTABLE_METRICS}
+
+# 낮을수록 좋은 지표 (기본 정렬을 오름차순으로)
+LOWER_IS_BETTER = {'volatility'}
+
+DISPLAY_LABELS = {'manager': '운용사', 'product_name': '상품명', 'last_date': '최근 기준일', **METRIC_LABELS}
+
+
+def load_metrics(sort_by='sharpe', ascending=False, manager=None, limit=None):
+    """정렬/필터 조건에 맞는 상품별 지표를 조회하는 함수"""
+    query, params = metrics_query(sort_by, ascending, manager, limit)
+    return execute_sql_query(query, params=params)
+
+
+@timed('pandas')
+def format_metrics(df_metrics, include_manager=True):
+    """지표 DataFrame을 표시용 컬럼 이름/자릿수로 바꾸는 함수"""
+    df_display = df_metrics if include_manager else df_metrics.drop(columns=['manager'])
+    df_display = df_display.round(2).rename(columns=DISPLAY_LABELS)
+    return df_display
+
+
+def render_metrics_panel(key_prefix, manager=None):
+    """정렬 기준/순서/개수를 고르는 위험·성과 지표 표를 그리는 함수
+
+    manager가 주어지면 해당 운용사 상품만 표시합니다.
+    """
+    st.subheader("📐 위험/성과 지표")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        sort_label = st.selectbox("정렬 기준", list(METRIC_SORT_OPTIONS.keys()),
+                                  index=SORTABLE_METRICS.index('sharpe'), key=f"{key_prefix}_metric_sort")
+    sort_by = METRIC_SORT_OPTIONS[sort_label]
+    with col2:
+        ascending = st.checkbox("오름차순", value=sort_by in LOWER_IS_BETTER, key=f"{key_prefix}_metric_ascending")
+    with col3:
+        limit = st.number_input("표시 개수", min_value=5, max_value=500, value=20, step=5, key=f"{key_prefix}_metric_limit")
+
+    try:
+        df_metrics = load_metrics(sort_by, ascending, manager, limit)
+    except Exception as e:
+        st.error(f"지표 조회 중 오류 발생: {e}")
+        return
+
+    if df_metrics.empty:
+        st.info("계산된 지표가 없습니다. 데이터를 업로드하면 자동으로 계산됩니다.")
+        return
+
+    st.dataframe(format_metrics(df_metrics, include_manager=manager is None), use_container_width=True)
+    st.caption("지표는 1개월 수익률 이력으로 계산하며 데이터 업로드 시 갱신됩니다. "
+               "변동성/하방편차/샤프/소르티노는 연환산 기준입니다.")
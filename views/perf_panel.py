@@ -0,0 +1,111 @@
+# ⏱️ 성능 계측 패널 (관리자 로그인 시 사이드바에 표시)
+# perf.py가 모은 rerun 기록을 세션에 최근 PERF_HISTORY_SIZE개까지 보관하고
+# 마지막 rerun의 분류별 시간, 페이지별 평균, 느린 구간과 공유 조회 결과 캐시/예열 상태를 보여줍니다.
+import pandas as pd
+import streamlit as st
+
+from config import PERF_HISTORY_SIZE, PERF_METRICS_JSONL, PERF_METRICS_PROM
+from frame_cache import cache_stats
+from perf import CATEGORIES, CATEGORY_LABELS, OTHER_CATEGORY
+from views import PAGES
+from warmer import warm_status
+
+SLOW_SPAN_LIMIT = 10
+
+_PAGE_LABELS = {module: menu for menu, module in PAGES.items()}
+
+
+def remember_rerun(record):
+    """rerun 기록을 세션 기록 목록에 추가하는 함수 (오래된 기록부터 버림)"""
+    history = st.session_state.setdefault('perf_history', [])
+    history.append(record)
+    del history[:-PERF_HISTORY_SIZE]
+
+
+def page_label(page):
+    """페이지 모듈 이름을 메뉴 이름으로 바꾸는 함수 (fragment만 다시 실행한 기록은 '메뉴 · 함수 이름')"""
+    if page and '#' in page:
+        page, fragment_name = page.split('#', 1)
+        return f"{_PAGE_LABELS.get(page, page)} · {fragment_name}"
+    return _PAGE_LABELS.get(page, page)
+
+
+def category_breakdown(record):
+    """rerun 기록 하나의 분류별 시간 표를 만드는 함수"""
+    total = record['total_ms'] or 1.0
+    rows = [
+        {'구분': CATEGORY_LABELS[category], 'ms': record['categories'].get(category, 0.0),
+         '비율(%)': record['categories'].get(category, 0.0) / total * 100}
+        for category in CATEGORIES + [OTHER_CATEGORY]
+    ]
+    return pd.DataFrame(rows).round(1)
+
+
+def page_breakdown(history):
+    """페이지별 rerun 수, 전체 시간 중앙값, 분류별 평균 시간 표를 만드는 함수 (ms)"""
+    df = pd.DataFrame([
+        {'페이지': page_label(record['page']), 'total_ms': record['total_ms'], **record['categories']}
+        for record in history
+    ])
+    grouped = df.groupby('페이지')
+    table = pd.DataFrame({'rerun 수': grouped.size(), '전체(중앙값)': grouped['total_ms'].median()})
+    for category in CATEGORIES + [OTHER_CATEGORY]:
+        table[CATEGORY_LABELS[category]] = grouped[category].mean()
+    return table.sort_values('전체(중앙값)', ascending=False).round(1)
+
+
+def slow_spans(record, limit=SLOW_SPAN_LIMIT):
+    """rerun 기록에서 오래 걸린 구간 limit개를 표로 만드는 함수"""
+    spans = sorted(record['spans'], key=lambda item: item['ms'], reverse=True)[:limit]
+    return pd.DataFrame([
+        {'구분': CATEGORY_LABELS.get(item['category'], item['category']), '구간': item['name'],
+         'ms': round(item['ms'], 1), '행 수': item.get('rows')}
+        for item in spans
+    ])
+
+
+def cache_caption():
+    """공유 조회 결과 캐시 상태를 한 줄로 만드는 함수"""
+    stats = cache_stats()
+    lookups = stats['hits'] + stats['misses']
+    hit_rate = stats['hits'] / lookups * 100 if lookups else 0.0
+    return (f"공유 캐시: {stats['entries']}개 결과 · {stats['bytes'] / (1024 * 1024):,.1f}"
+            f" / {stats['budget_bytes'] / (1024 * 1024):,.0f}MB · 적중률 {hit_rate:.0f}% · 버림 {stats['evictions']}회")
+
+
+def warm_caption():
+    """캐시 예열 상태를 한 줄로 만드는 함수"""
+    status = warm_status()
+    if not status['runs']:
+        return "캐시 예열: 아직 실행되지 않았습니다."
+    caption = (f"캐시 예열: {status['runs']}회 · 미리 조회 {status['loaded']}건 · 마지막 "
+               f"{status['finished_at']:%H:%M:%S} ({status['ms']:,.0f} ms, 데이터 버전 {status['version']})"
+               f" · 변경 없어 건너뜀 {status['skipped']}회 · 쓰기 작업 대기 {status['deferred']}회")
+    return caption + " · ⚠️ 오류" if status['error'] else caption
+
+
+def render_perf_panel():
+    """사이드바에 성능 계측 패널을 그리는 함수"""
+    history = st.session_state.get('perf_history', [])
+    with st.sidebar.expander("⏱️ 성능 계측", expanded=False):
+        if not history:
+            st.caption("아직 기록된 rerun이 없습니다.")
+            return
+
+        last = history[-1]
+        st.caption(f"마지막 rerun: {page_label(last['page'])} · {last['total_ms']:,.0f} ms · {last['ts']}")
+        st.dataframe(category_breakdown(last), use_container_width=True, hide_index=True)
+
+        st.markdown(f"**페이지별 평균 (최근 {len(history)}회, ms)**")
+        st.dataframe(page_breakdown(history), use_container_width=True)
+
+        if last['spans']:
+            st.markdown("**느린 구간 (마지막 rerun)**")
+            st.dataframe(slow_spans(last), use_container_width=True, hide_index=True)
+
+        st.caption(cache_caption())
+        st.caption(warm_caption())
+
+        exports = [path for path in (PERF_METRICS_JSONL, PERF_METRICS_PROM) if path]
+        if exports:
+            st.caption(f"내보내기 파일: {', '.join(exports)}")
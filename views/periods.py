@@ -0,0 +1,180 @@
+# 📅 기간별 분석
+import pandas as pd
+import streamlit as st
+
+from config import TABLE_NAME
+from downsample import POINT_BUDGET, points_per_line, to_plot_dates
+from frame_cache import cached_query
+from perf import timed
+from views.common import new_figure, set_axis_labels, set_legend, show_figure, plot_line
+from views.export_panel import render_export_panel
+
+# 평균 수익률 추이에 표시할 컬럼 -> (라벨, 마커)
+RETURN_TREND_LINES = [
+    ('avg_1m_return', '1개월', 'o'),
+    ('avg_3m_return', '3개월', 's'),
+    ('avg_6m_return', '6개월', '^'),
+    ('avg_1y_return', '1년', 'd'),
+]
+
+
+# 기준일별 상품 수, 평균 수익률, 총 자산 집계 SQL (파라미터: 시작일, 종료일)
+TIMELINE_SQL = f"""
+    SELECT asof_date,
+           COUNT(*) as product_count,
+           AVG(r_1m) as avg_1m_return,
+           AVG(r_3m) as avg_3m_return,
+           AVG(r_6m) as avg_6m_return,
+           AVG(r_1y) as avg_1y_return,
+           SUM(total_amount) as total_assets
+    FROM {TABLE_NAME}
+    WHERE asof_date BETWEEN ? AND ?
+    GROUP BY asof_date
+    ORDER BY asof_date
+"""
+
+
+def load_timeline(analysis_start, analysis_end):
+    """기준일별 상품 수, 평균 수익률, 총 자산을 조회하는 함수 (세션 간 공유 캐시)"""
+    return cached_query(TIMELINE_SQL, params=[analysis_start, analysis_end])
+
+
+def summarize_timeline(df_timeline):
+    """기간별 분석 요약 지표를 계산하는 함수"""
+    return {
+        'total_periods': len(df_timeline),
+        'avg_products': df_timeline['product_count'].mean(),
+        'total_assets': df_timeline['total_assets'].sum(),
+    }
+
+
+@timed('chart')
+def build_product_trend_figure(df_timeline, point_budget=POINT_BUDGET):
+    """기간별 상품 수 변화 라인 차트를 그리는 함수 (point_budget=None이면 전체 해상도)"""
+    fig, ax = new_figure((12, 6))
+    plot_line(ax, to_plot_dates(df_timeline['asof_date']), df_timeline['product_count'], point_budget,
+              marker='o', linewidth=2, markersize=6, color='blue')
+    set_axis_labels(ax, '날짜', '상품 수', '기간별 상품 수 변화')
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+@timed('chart')
+def build_return_trend_figure(df_timeline, point_budget=POINT_BUDGET):
+    """기간별 평균 수익률 변화 라인 차트를 그리는 함수 (point_budget=None이면 전체 해상도)"""
+    fig, ax = new_figure((12, 6))
+    dates = to_plot_dates(df_timeline['asof_date'])
+    max_points = points_per_line(len(RETURN_TREND_LINES), point_budget) if point_budget else None
+    for col_name, label, marker in RETURN_TREND_LINES:
+        plot_line(ax, dates, df_timeline[col_name], max_points, label=label, marker=marker, linewidth=2)
+    set_axis_labels(ax, '날짜', '평균 수익률 (%)', '기간별 평균 수익률 변화')
+    set_legend(ax)
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+@timed('chart')
+def build_asset_trend_figure(df_timeline, point_budget=POINT_BUDGET):
+    """기간별 총 자산 변화 라인 차트를 그리는 함수 (point_budget=None이면 전체 해상도)"""
+    fig, ax = new_figure((12, 6))
+    plot_line(ax, to_plot_dates(df_timeline['asof_date']), df_timeline['total_assets'], point_budget,
+              marker='o', color='green', linewidth=2, markersize=6)
+    set_axis_labels(ax, '날짜', '총 자산 (원)', '기간별 총 자산 변화')
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+def render():
+    """기간별 분석 페이지를 그리는 함수"""
+    st.title("📅 기간별 분석 (SQLite)")
+
+    # 분석 옵션 설정
+    st.subheader("🔧 분석 옵션 설정")
+
+    # 분석 기간 선택
+    col1, col2 = st.columns(2)
+    with col1:
+        analysis_start = st.date_input("분석 시작일", value=pd.Timestamp.now() - pd.Timedelta(days=365))
+    with col2:
+        analysis_end = st.date_input("분석 종료일", value=pd.Timestamp.now())
+
+    # 분석 지표 선택
+    analysis_metrics = st.multiselect(
+        "분석할 지표 선택",
+        ["상품 수", "평균 수익률", "총 자산"],
+        default=["상품 수", "평균 수익률", "총 자산"]
+    )
+
+    # 시각화 옵션
+    st.subheader("📊 시각화 옵션")
+    show_product_trend = st.checkbox("상품 수 변화 추이", value=True)
+    show_return_trend = st.checkbox("수익률 변화 추이", value=True)
+    show_asset_trend = st.checkbox("자산 변화 추이", value=True)
+    show_timeline_details = st.checkbox("기간별 상세 데이터", value=True)
+    full_resolution = st.checkbox(
+        "전체 해상도로 그리기", value=False,
+        help=f"기준일이 {POINT_BUDGET}개를 넘으면 모양을 유지하며 점 수를 줄여 그립니다. "
+             "기간을 좁히면 해당 구간은 원본 그대로 표시됩니다."
+    )
+    point_budget = None if full_resolution else POINT_BUDGET
+
+    if st.button("📅 기간별 분석 실행", type="primary"):
+        try:
+            # DB에서 데이터 조회
+            df_timeline = load_timeline(analysis_start, analysis_end)
+
+            if not df_timeline.empty:
+                st.success(f"✅ 기간별 분석 완료: {len(df_timeline)}개 기간")
+                if point_budget and len(df_timeline) > point_budget:
+                    st.caption(f"차트는 {len(df_timeline)}개 기준일 중 최대 {point_budget}개 지점으로 요약해 그렸습니다. "
+                               "분석 기간을 좁히거나 '전체 해상도로 그리기'를 선택하면 모든 지점을 볼 수 있습니다.")
+
+                # 기간별 상품 수 변화
+                if show_product_trend and "상품 수" in analysis_metrics:
+                    st.subheader("📈 기간별 상품 수 변화")
+                    show_figure(build_product_trend_figure(df_timeline, point_budget))
+
+                # 기간별 평균 수익률 변화
+                if show_return_trend and "평균 수익률" in analysis_metrics:
+                    st.subheader("📊 기간별 평균 수익률 변화")
+                    show_figure(build_return_trend_figure(df_timeline, point_budget))
+
+                # 기간별 총 자산 변화
+                if show_asset_trend and "총 자산" in analysis_metrics:
+                    st.subheader("💰 기간별 총 자산 변화")
+                    show_figure(build_asset_trend_figure(df_timeline, point_budget))
+
+                # 상세 데이터 테이블
+                if show_timeline_details:
+                    st.subheader("📋 기간별 상세 데이터")
+                    st.dataframe(df_timeline, use_container_width=True)
+
+                # 요약 정보
+                summary = summarize_timeline(df_timeline)
+                st.subheader("📊 기간별 분석 요약")
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.metric("분석 기간 수", f"{summary['total_periods']}개")
+
+                with col2:
+                    st.metric("평균 상품 수", f"{summary['avg_products']:.1f}개")
+
+                with col3:
+                    st.metric("전체 총 자산", f"{summary['total_assets']:,.0f}원")
+
+            else:
+                st.warning("선택한 기간에 데이터가 없습니다.")
+
+        except Exception as e:
+            st.error(f"분석 중 오류 발생: {e}")
+
+    # 기간별 집계 결과 내보내기
+    render_export_panel("periods", TIMELINE_SQL, [analysis_start, analysis_end],
+                        f"timeline_{analysis_start}_{analysis_end}")
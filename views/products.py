@@ -0,0 +1,400 @@
+# 📊 상품별 분석
+import numpy as np
+import streamlit as st
+
+from config import NAMED_VIEW, MANAGER_TABLE
+from database import execute_sql_query
+from frame_cache import frame_key, load_frame
+from perf import timed
+from startup import get_seaborn, get_plotly_express, get_plotly_graph_objects
+from views.common import RETURN_COLUMNS, RETURN_COLUMN_LABELS, fragment, new_figure, set_axis_labels, show_figure, show_plotly
+from views.export_panel import render_export_panel
+from views.grid import render_grid
+from views.metrics_panel import render_metrics_panel
+
+# 분석 기준 -> (정렬 컬럼, 오름차순 여부)
+PRODUCT_SORT_CRITERIA = {
+    "자산 규모": ('total_amount', False),
+    "수익률": ('r_1y', False),
+    "상품명": ('product_name', True),
+}
+
+# 상품 수가 이보다 많으면 대용량 모드: 전체는 WebGL 개요 차트로, 상세 차트는 구간 단위로 그립니다.
+LARGE_PRODUCT_THRESHOLD = 60
+PRODUCT_WINDOW_SIZE = 50
+
+# seaborn 히트맵 셀 값 표시/막대 값 표시를 하는 최대 상품 수
+ANNOTATION_LIMIT = 30
+
+
+def load_managers():
+    """운용사 목록을 조회하는 함수"""
+    manager_query = f"SELECT name as manager FROM {MANAGER_TABLE} ORDER BY name"
+    return execute_sql_query(manager_query)
+
+
+# 선택된 운용사의 상품 데이터 SQL (파라미터: 운용사명)
+PRODUCTS_SQL = f"""
+    SELECT asof_date, product_id, product_name, r_1m, r_3m, r_6m, r_1y, r_2y, r_3y, since_inception, total_amount
+    FROM {NAMED_VIEW}
+    WHERE manager = ?
+"""
+
+PRODUCT_GRID_COLUMNS = ['product_name', 'asof_date'] + RETURN_COLUMNS + ['total_amount']
+
+# 상세 데이터 표 정렬 기준 -> 컬럼
+PRODUCT_GRID_SORT = {
+    "자산 규모": 'total_amount',
+    "1년 수익률": 'r_1y',
+    "3년 수익률": 'r_3y',
+    "상품명": 'product_name',
+    "기준일": 'asof_date',
+}
+
+
+def products_key(selected_manager):
+    """선택된 운용사의 상품 데이터 캐시 키를 만드는 함수"""
+    return frame_key(PRODUCTS_SQL + " ORDER BY total_amount DESC", [selected_manager])
+
+
+def default_keys(managers):
+    """운용사들의 상품별 분석(히트맵/자산 규모 차트)이 읽는 캐시 키 목록을 반환하는 함수 (캐시 예열용)"""
+    return [products_key(manager) for manager in managers]
+
+
+def load_products(selected_manager):
+    """선택된 운용사의 상품 데이터를 조회하는 함수 (세션 간 공유 캐시)"""
+    return load_frame(products_key(selected_manager))
+
+
+@timed('pandas')
+def sort_products(df_products, product_analysis_criteria):
+    """분석 기준에 따라 상품을 정렬하는 함수"""
+    sort_col, ascending = PRODUCT_SORT_CRITERIA.get(product_analysis_criteria, PRODUCT_SORT_CRITERIA["상품명"])
+    return df_products.sort_values(sort_col, ascending=ascending)
+
+
+def summarize_products(df_products):
+    """상품 분석 요약 지표를 계산하는 함수"""
+    return {
+        'product_count': len(df_products),
+        'avg_1y_return': df_products['r_1y'].mean(),
+        'total_assets': df_products['total_amount'].sum(),
+    }
+
+
+def product_window(df_products_sorted, start, size=PRODUCT_WINDOW_SIZE):
+    """정렬된 상품 중 start번째부터 size개 구간만 잘라내는 함수 (브라우저로 보내는 데이터 크기 제한)"""
+    return df_products_sorted.iloc[start:start + size]
+
+
+def window_label(start, total, size=PRODUCT_WINDOW_SIZE):
+    """구간 선택 슬라이더에 표시할 순위 범위 문자열을 만드는 함수"""
+    return f"{start + 1}~{min(start + size, total)}위"
+
+
+@timed('chart')
+def build_overview_plotly(df_products_sorted, column, value_label, title, start, size=PRODUCT_WINDOW_SIZE, scale=1.0):
+    """전체 상품을 WebGL 점 차트(Scattergl)로 보여주고 현재 구간을 표시하는 함수
+
+    상품명 대신 순위와 float32 값 배열만 보내므로 상품 수가 많아도 데이터가 작습니다.
+    """
+    go = get_plotly_graph_objects()
+    values = (df_products_sorted[column].to_numpy(dtype=float) / scale).astype(np.float32)
+    fig = go.Figure(go.Scattergl(
+        x=np.arange(1, len(values) + 1, dtype=np.int32),
+        y=values,
+        mode='markers',
+        marker=dict(size=5, color=values, colorscale='RdYlGn' if scale == 1.0 else 'Oranges'),
+        hovertemplate=f"순위: %{{x}}<br>{value_label}: %{{y:.2f}}<extra></extra>"
+    ))
+    fig.add_vrect(x0=start + 0.5, x1=min(start + size, len(values)) + 0.5,
+                  fillcolor='#2E86AB', opacity=0.15, line_width=0)
+    fig.update_layout(
+        title=title,
+        title_font_size=16,
+        title_font_color='#2E86AB',
+        xaxis_title='순위 (정렬 기준)',
+        yaxis_title=value_label,
+        height=300,
+        showlegend=False
+    )
+    return fig
+
+
+@timed('chart')
+def build_heatmap_plotly(df_products_sorted, selected_manager):
+    """plotly로 상품별 수익률 히트맵을 만드는 함수"""
+    px = get_plotly_express()
+
+    # 수익률 데이터 준비 (컬럼명을 한글로 변경)
+    df_heatmap = df_products_sorted[RETURN_COLUMNS].copy()
+    df_heatmap.columns = [RETURN_COLUMN_LABELS[col] for col in df_heatmap.columns]
+
+    # 히트맵 생성 (데이터 전치하여 올바른 방향으로 표시)
+    fig = px.imshow(
+        df_heatmap.values.T,  # 전치하여 올바른 방향으로 표시
+        x=df_products_sorted['product_name'],
+        y=list(RETURN_COLUMN_LABELS.values()),
+        color_continuous_scale='RdYlGn',
+        aspect='auto',
+        title=f'{selected_manager} 상품별 수익률 히트맵'
+    )
+
+    # 차트 스타일링
+    fig.update_layout(
+        title_font_size=16,
+        title_font_color='#2E86AB',
+        xaxis_title='상품명',
+        yaxis_title='수익률 기간',
+        height=500,
+        xaxis_tickangle=-45
+    )
+
+    # 호버 템플릿 설정
+    fig.update_traces(
+        hovertemplate="<b>%{y}</b><br>" +
+                    "상품: %{x}<br>" +
+                    "수익률: %{z:.2f}%<extra></extra>"
+    )
+    return fig
+
+
+@timed('chart')
+def build_heatmap_figure(df_products_sorted, selected_manager):
+    """seaborn으로 상품별 수익률 히트맵을 그리는 함수 (plotly가 없는 경우)"""
+    sns = get_seaborn()
+    fig, ax = new_figure((14, 8))
+    sns.heatmap(df_products_sorted[RETURN_COLUMNS].T,
+                annot=len(df_products_sorted) <= ANNOTATION_LIMIT, fmt='.2f', cmap='RdYlGn', ax=ax,
+                xticklabels=df_products_sorted['product_name'],
+                yticklabels=RETURN_COLUMNS)
+    set_axis_labels(ax, title=f'{selected_manager} 상품별 수익률 히트맵')
+    ax.tick_params(axis='x', rotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+    fig.tight_layout()
+    return fig
+
+
+@timed('chart')
+def build_assets_plotly(df_products_sorted, selected_manager):
+    """plotly로 상품별 자산 규모 막대 차트를 만드는 함수"""
+    px = get_plotly_express()
+
+    # 자산 규모를 억원 단위로 변환
+    df_chart = df_products_sorted.copy()
+    df_chart['자산규모_억원'] = df_chart['total_amount'] / 100000000
+
+    fig = px.bar(
+        df_chart,
+        x='product_name',
+        y='자산규모_억원',
+        title=f'{selected_manager} 상품별 자산 규모',
+        labels={'product_name': '상품명', '자산규모_억원': '자산 규모 (억원)'},
+        color='자산규모_억원',
+        color_continuous_scale='Oranges',
+        hover_data={'total_amount': True, '자산규모_억원': False}
+    )
+
+    # 차트 스타일링
+    fig.update_layout(
+        title_font_size=16,
+        title_font_color='#2E86AB',
+        xaxis_title_font_size=12,
+        yaxis_title_font_size=12,
+        xaxis_tickangle=-45,
+        height=500,
+        showlegend=False
+    )
+
+    # 호버 템플릿 설정
+    fig.update_traces(
+        hovertemplate="<b>%{x}</b><br>" +
+                    "자산 규모: %{y:.1f}억원<br>" +
+                    "총액: %{customdata[0]:,}원<extra></extra>"
+    )
+    return fig
+
+
+@timed('chart')
+def build_assets_figure(df_products_sorted, selected_manager):
+    """matplotlib으로 상품별 자산 규모 막대 차트를 그리는 함수 (plotly가 없는 경우)"""
+    fig, ax = new_figure((14, 8))
+    bars = ax.bar(range(len(df_products_sorted)), df_products_sorted['total_amount'], color='orange', alpha=0.7)
+    set_axis_labels(ax, '상품명', '자산 규모 (원)', f'{selected_manager} 상품별 자산 규모')
+
+    # x축 레이블 설정
+    ax.set_xticks(range(len(df_products_sorted)))
+    ax.set_xticklabels(df_products_sorted['product_name'], rotation=45, ha='right')
+
+    # 그리드 추가
+    ax.grid(True, alpha=0.3, axis='y')
+
+    # 값 표시 (상품이 많으면 생략)
+    for i, bar in enumerate(bars if len(df_products_sorted) <= ANNOTATION_LIMIT else []):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
+                f'{height:,.0f}', ha='center', va='bottom', fontsize=9)
+
+    fig.tight_layout()
+    return fig
+
+
+def render():
+    """상품별 분석 페이지를 그리는 함수"""
+    st.title("📊 상품별 분석 (SQLite)")
+
+    # 분석 옵션 설정
+    st.subheader("🔧 분석 옵션 설정")
+
+    # 운용사 선택
+    try:
+        # 운용사 목록 조회
+        df_managers = load_managers()
+
+        if not df_managers.empty:
+            selected_manager = st.selectbox("운용사 선택", df_managers['manager'].tolist())
+
+            # 분석 기준 선택
+            product_analysis_criteria = st.selectbox(
+                "분석 기준 선택",
+                ["자산 규모", "수익률", "상품명"],
+                help="어떤 기준으로 상품을 정렬할지 선택하세요"
+            )
+
+            # 시각화 옵션
+            st.subheader("📊 시각화 옵션")
+            show_heatmap = st.checkbox("수익률 히트맵", value=True)
+            show_assets_chart = st.checkbox("자산 규모 차트", value=True)
+            show_product_details = st.checkbox("상품별 상세 데이터", value=True)
+
+            if st.button("📊 상품별 분석 실행", type="primary"):
+                try:
+                    # 선택된 운용사의 상품 데이터 조회
+                    df_products = load_products(selected_manager)
+
+                    if not df_products.empty:
+                        st.success(f"✅ {selected_manager} 상품 분석 완료: {len(df_products)}개 상품")
+
+                        # 구간 이동 시에도 결과를 유지하도록 캐시 키만 session_state에 저장
+                        st.session_state.product_analysis = {'manager': selected_manager,
+                                                             'frame_key': products_key(selected_manager)}
+                    else:
+                        st.session_state.pop('product_analysis', None)
+                        st.warning(f"{selected_manager}의 상품 데이터가 없습니다.")
+
+                except Exception as e:
+                    st.error(f"분석 중 오류 발생: {e}")
+
+            # 분석 결과가 있으면 표시 (운용사를 바꾸면 다시 실행해야 함)
+            product_analysis = st.session_state.get('product_analysis')
+            if product_analysis and product_analysis['manager'] == selected_manager:
+                try:
+                    render_results(
+                        product_analysis['frame_key'], selected_manager, product_analysis_criteria,
+                        show_heatmap, show_assets_chart, show_product_details
+                    )
+                except Exception as e:
+                    st.error(f"분석 중 오류 발생: {e}")
+
+            # 선택된 운용사 상품의 위험/성과 지표 (미리 계산된 값)
+            render_metrics_panel("products", manager=selected_manager)
+
+            # 선택된 운용사 상품 데이터 내보내기
+            render_export_panel(
+                "products", PRODUCTS_SQL + " ORDER BY asof_date, product_name", [selected_manager],
+                f"products_{selected_manager}"
+            )
+        else:
+            st.error("운용사 데이터가 없습니다.")
+
+    except Exception as e:
+        st.error(f"운용사 목록 조회 중 오류 발생: {e}")
+
+
+def render_results(frame_key, selected_manager, product_analysis_criteria,
+                   show_heatmap, show_assets_chart, show_product_details):
+    """상품별 분석 결과(히트맵, 자산 규모, 상세 데이터, 요약)를 표시하는 함수"""
+    if show_heatmap or show_assets_chart:
+        render_charts(frame_key, selected_manager, product_analysis_criteria, show_heatmap, show_assets_chart)
+
+    # 상세 데이터 테이블 (현재 페이지 행만 SQL로 조회)
+    if show_product_details:
+        st.subheader("📋 상품별 상세 데이터")
+        sort_col, ascending = PRODUCT_SORT_CRITERIA.get(product_analysis_criteria, PRODUCT_SORT_CRITERIA["상품명"])
+        render_grid(
+            "products", PRODUCTS_SQL, [selected_manager],
+            columns=PRODUCT_GRID_COLUMNS, key_columns=['asof_date', 'product_id'],
+            sort_options=PRODUCT_GRID_SORT, default_sort=sort_col, descending=not ascending,
+            filter_column='product_name', filter_label="상품명 검색"
+        )
+
+    # 요약 정보
+    summary = summarize_products(load_frame(frame_key))
+    st.subheader("📊 상품 분석 요약")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("총 상품 수", summary['product_count'])
+
+    with col2:
+        st.metric("평균 1년 수익률", f"{summary['avg_1y_return']:.2f}%")
+
+    with col3:
+        st.metric("총 자산", f"{summary['total_assets']:,.0f}원")
+
+
+# fragment: 상품 구간을 옮기면 페이지 전체 대신 히트맵/자산 규모 차트만 다시 그림
+# (상품 데이터는 공유 캐시에서 캐시 키로 다시 꺼냄)
+@fragment
+def render_charts(frame_key, selected_manager, product_analysis_criteria, show_heatmap, show_assets_chart):
+    """상품별 수익률 히트맵과 자산 규모 차트를 표시하는 함수"""
+    # 분석 기준에 따른 정렬
+    df_products_sorted = sort_products(load_frame(frame_key), product_analysis_criteria)
+    total = len(df_products_sorted)
+
+    # 대용량 모드: 구간을 골라 그 구간만 상세 차트로 그림
+    large_mode = total > LARGE_PRODUCT_THRESHOLD
+    window_start = 0
+    if large_mode:
+        st.info(f"상품이 {total}개로 많아 {PRODUCT_WINDOW_SIZE}개씩 나누어 표시합니다. "
+                "전체 분포는 개요 차트에서 확인하세요.")
+        window_start = st.select_slider(
+            "표시할 상품 구간",
+            options=list(range(0, total, PRODUCT_WINDOW_SIZE)),
+            format_func=lambda start: window_label(start, total),
+            key=f"product_window_start_{selected_manager}"
+        )
+    df_window = product_window(df_products_sorted, window_start) if large_mode else df_products_sorted
+
+    # 상품별 수익률 히트맵
+    if show_heatmap:
+        st.subheader("🔥 상품별 수익률 히트맵")
+
+        try:
+            if large_mode:
+                show_plotly(build_overview_plotly(
+                    df_products_sorted, 'r_1y', '1년 수익률 (%)',
+                    f'{selected_manager} 전체 상품 1년 수익률 개요', window_start
+                ))
+            show_plotly(build_heatmap_plotly(df_window, selected_manager))
+        except ImportError:
+            # Plotly가 없는 경우 seaborn 사용
+            show_figure(build_heatmap_figure(df_window, selected_manager))
+
+    # 상품별 자산 규모
+    if show_assets_chart:
+        st.subheader("💰 상품별 자산 규모")
+
+        # Plotly를 사용한 인터랙티브 차트
+        try:
+            if large_mode:
+                show_plotly(build_overview_plotly(
+                    df_products_sorted, 'total_amount', '자산 규모 (억원)',
+                    f'{selected_manager} 전체 상품 자산 규모 개요', window_start, scale=100000000
+                ))
+            show_plotly(build_assets_plotly(df_window, selected_manager))
+        except ImportError:
+            # Plotly가 없는 경우 matplotlib 사용
+            show_figure(build_assets_figure(df_window, selected_manager))
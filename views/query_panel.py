@@ -0,0 +1,58 @@
+# 🐢 쿼리 통계 패널 (관리자 로그인 시 사이드바에 표시)
+# query_log.py가 프로세스 단위로 모은 쿼리 지문별 통계를 보여줍니다.
+# 모든 세션의 실제 조회가 합쳐지므로, 자주 호출되거나 느린 쿼리와 전체 테이블 스캔이 있는 쿼리를 찾는 데 씁니다.
+import pandas as pd
+import streamlit as st
+
+from config import SLOW_QUERY_LOG, SLOW_QUERY_MS
+from query_log import query_stats, reset_query_stats
+
+SQL_PREVIEW_LENGTH = 60
+
+
+def stats_table(entries):
+    """지문별 통계를 표로 만드는 함수"""
+    return pd.DataFrame([
+        {
+            '지문': entry['fingerprint'],
+            '호출': entry['count'],
+            '합계(ms)': round(entry['total_ms'], 1),
+            '평균(ms)': round(entry['total_ms'] / entry['count'], 1),
+            '최대(ms)': round(entry['max_ms'], 1),
+            '평균 행 수': round(entry['rows'] / entry['count'], 1),
+            '느림': entry['slow_count'],
+            '전체 스캔': '⚠️' if entry['full_scans'] else '',
+            'SQL': entry['sql'][:SQL_PREVIEW_LENGTH],
+        }
+        for entry in entries
+    ])
+
+
+def render_query_panel():
+    """사이드바에 쿼리 지문별 통계와 실행 계획을 보여주는 패널을 그리는 함수"""
+    with st.sidebar.expander("🐢 쿼리 통계", expanded=False):
+        entries = query_stats()
+        if not entries:
+            st.caption("아직 기록된 쿼리가 없습니다.")
+            return
+
+        st.caption(f"느린 쿼리 기준: {SLOW_QUERY_MS} ms 이상" + (f" · 로그: {SLOW_QUERY_LOG}" if SLOW_QUERY_LOG else ""))
+        st.dataframe(stats_table(entries), use_container_width=True, hide_index=True)
+
+        # 지문 하나를 골라 정규화 SQL, 실행 계획, 마지막 느린 실행의 파라미터를 확인
+        by_fingerprint = {entry['fingerprint']: entry for entry in entries}
+        selected = st.selectbox("지문 상세", list(by_fingerprint), key="query_panel_fingerprint")
+        entry = by_fingerprint[selected]
+        st.code(entry['sql'], language='sql')
+        if entry['plan']:
+            st.code('\n'.join(entry['plan']), language='text')
+        if entry['full_scans']:
+            st.warning("인덱스 없이 전체를 읽는 단계: " + ', '.join(entry['full_scans']))
+        if entry['last_slow']:
+            last_slow = entry['last_slow']
+            st.caption(f"마지막 느린 실행: {last_slow['ts']} · {last_slow['ms']:,.1f} ms · {last_slow['rows']:,}행")
+            st.json(last_slow['params'], expanded=False)
+
+        if st.button("통계 초기화", key="query_panel_reset"):
+            reset_query_stats()
+            st.rerun()
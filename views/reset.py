@@ -0,0 +1,251 @@
+# 🗑️ 데이터 초기화
+# 기준일 단위 삭제와 전체 초기화는 업로드와 같은 단일 쓰기 스레드(write_queue)에서 실행되고,
+# 끝나면 비워진 페이지를 DB 파일에서 돌려줍니다(reclaim_space).
+# 오래된 기준일은 같은 쓰기 스레드에서 Parquet 파일로 보관하거나(archive.py) 다시 DB로 되돌릴 수 있습니다.
+import os
+import sqlite3
+
+import pandas as pd
+import streamlit as st
+
+from archive import archive_cutoff, catalog, remove_unlisted_files
+from config import ARCHIVE_AFTER_MONTHS, ARCHIVE_DIR, DB_FILE, TABLE_NAME
+from database import (
+    archive_snapshots, delete_snapshots, get_db_connection, reclaim_space, restore_snapshots, truncate_all,
+)
+from views.jobs import job_running, show_job
+from write_queue import submit_job
+
+
+def load_data_status():
+    """DB에 있는 전체 레코드 수, 기준일별 레코드 수와 보관된 기준일 목록을 조회하는 함수"""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+
+        # 전체 레코드 수 확인
+        cursor.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}")
+        total_records = cursor.fetchone()[0]
+
+        # 기준일별 데이터 수 확인
+        cursor.execute(f"SELECT asof_date, COUNT(*) as count FROM {TABLE_NAME} GROUP BY asof_date ORDER BY asof_date DESC")
+        date_counts = cursor.fetchall()
+
+        archived = [(asof_date, row_count) for asof_date, _, row_count, _ in catalog(conn)]
+    finally:
+        conn.close()
+    return total_records, date_counts, archived
+
+
+def archive_size():
+    """보관 파일 전체 크기(바이트)를 반환하는 함수"""
+    if not os.path.isdir(ARCHIVE_DIR):
+        return 0
+    return sum(entry.stat().st_size for entry in os.scandir(ARCHIVE_DIR) if entry.is_file())
+
+
+def _reclaim(job, conn):
+    """삭제 후 목록에서 빠진 보관 파일을 지우고 빈 페이지를 돌려주는 함수
+
+    다른 세션이 읽는 중이라 실패하면 다음 삭제 때 다시 시도합니다.
+    """
+    job.update(stage="빈 공간 정리 중")
+    remove_unlisted_files(conn)
+    try:
+        return reclaim_space(conn)
+    except sqlite3.OperationalError as e:
+        job.warn(f"빈 공간 정리는 다음 삭제 때 다시 시도합니다: {e}")
+        return 0
+
+
+def delete_snapshots_work(asof_dates):
+    """선택한 기준일 데이터를 삭제하는 쓰기 작업 함수를 만드는 함수"""
+    def work(job, conn):
+        job.update(stage="기준일 데이터 삭제 중")
+        deleted_count = delete_snapshots(conn, asof_dates)
+        conn.commit()
+        return {'deleted': deleted_count, 'dates': list(asof_dates), 'freed_bytes': _reclaim(job, conn)}
+    return work
+
+
+def truncate_work(job, conn):
+    """모든 데이터를 지우는 쓰기 작업 함수 (테이블을 다시 만든 뒤 빈 공간 정리)"""
+    job.update(stage="모든 데이터 삭제 중")
+    deleted_count = truncate_all(conn)
+    return {'deleted': deleted_count, 'dates': None, 'freed_bytes': _reclaim(job, conn)}
+
+
+def archive_work(asof_dates):
+    """선택한 기준일을 Parquet 파일로 보관하는 쓰기 작업 함수를 만드는 함수"""
+    def work(job, conn):
+        job.update(stage="기준일 보관 중", total=len(asof_dates))
+        archived_count = archive_snapshots(conn, asof_dates, on_progress=lambda done, total: job.update(done=done))
+        return {'archived': archived_count, 'dates': list(asof_dates), 'freed_bytes': _reclaim(job, conn)}
+    return work
+
+
+def restore_work(asof_dates):
+    """보관된 기준일을 DB로 되돌리는 쓰기 작업 함수를 만드는 함수"""
+    def work(job, conn):
+        job.update(stage="보관된 기준일 되돌리는 중")
+        restored_count = restore_snapshots(conn, asof_dates)
+        conn.commit()
+        remove_unlisted_files(conn)
+        return {'restored': restored_count, 'dates': list(asof_dates)}
+    return work
+
+
+def show_delete_result(job):
+    """끝난 삭제/초기화 작업의 결과를 그리는 함수"""
+    result = job['result']
+    freed_mb = result['freed_bytes'] / (1024 * 1024)
+    if result['dates'] is None:
+        st.success(f"✅ 데이터 초기화 완료! (삭제된 레코드: {result['deleted']:,}개, 정리된 공간: {freed_mb:,.1f}MB)")
+        st.info("이제 새로운 데이터를 업로드할 수 있습니다.")
+    else:
+        st.success(f"✅ 기준일 {', '.join(result['dates'])} 삭제 완료! "
+                   f"(삭제된 레코드: {result['deleted']:,}개, 정리된 공간: {freed_mb:,.1f}MB)")
+
+
+def show_archive_result(job):
+    """끝난 보관/되돌리기 작업의 결과를 그리는 함수"""
+    result = job['result']
+    if 'archived' in result:
+        st.success(f"✅ 기준일 {len(result['dates'])}개 보관 완료! (옮긴 레코드: {result['archived']:,}개, "
+                   f"정리된 공간: {result['freed_bytes'] / (1024 * 1024):,.1f}MB)")
+    else:
+        st.success(f"✅ 기준일 {', '.join(result['dates'])} 되돌리기 완료! (레코드: {result['restored']:,}개)")
+
+
+def _submit_snapshot_delete():
+    """선택한 기준일 삭제 작업을 큐에 넣고 선택을 비우는 함수 (버튼 on_click)"""
+    asof_dates = st.session_state.reset_snapshot_dates
+    job = submit_job(f"기준일 삭제 ({', '.join(asof_dates)})", delete_snapshots_work(asof_dates))
+    st.session_state.reset_job_id = job.id
+    st.session_state.reset_snapshot_dates = []
+    st.session_state.reset_snapshot_confirm = False
+
+
+def show_job_result(job):
+    """끝난 작업 종류에 맞게 결과를 그리는 함수"""
+    if 'deleted' in job['result']:
+        show_delete_result(job)
+    else:
+        show_archive_result(job)
+
+
+def _submit_archive(asof_dates):
+    """보관 작업을 큐에 넣는 함수 (버튼 on_click)"""
+    job = submit_job(f"기준일 보관 ({len(asof_dates)}개)", archive_work(asof_dates))
+    st.session_state.reset_job_id = job.id
+
+
+def _submit_restore():
+    """선택한 보관 기준일 되돌리기 작업을 큐에 넣고 선택을 비우는 함수 (버튼 on_click)"""
+    asof_dates = st.session_state.reset_restore_dates
+    job = submit_job(f"보관 기준일 되돌리기 ({', '.join(asof_dates)})", restore_work(asof_dates))
+    st.session_state.reset_job_id = job.id
+    st.session_state.reset_restore_dates = []
+
+
+def render():
+    """데이터 초기화 페이지를 그리는 함수"""
+    st.title("🗑️ 데이터 초기화")
+
+    # 경고 메시지
+    st.warning("⚠️ **주의**: 이 작업은 되돌릴 수 없습니다!")
+    st.info("데이터 초기화를 하면 모든 기존 데이터가 영구적으로 삭제됩니다.")
+
+    # 현재 데이터 현황 표시
+    try:
+        total_records, date_counts, archived = load_data_status()
+
+        st.subheader("📊 현재 데이터 현황")
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("총 레코드 수", f"{total_records + sum(count for _, count in archived):,}개")
+
+        with col2:
+            st.metric("기준일 수", f"{len(date_counts) + len(archived)}개")
+
+        with col3:
+            st.metric("DB 파일 크기", f"{os.path.getsize(DB_FILE) / (1024 * 1024):,.1f}MB")
+
+        with col4:
+            st.metric("보관 파일 크기", f"{archive_size() / (1024 * 1024):,.1f}MB")
+
+        # 기준일별 데이터 현황
+        if date_counts or archived:
+            st.write("**기준일별 데이터 현황:**")
+            date_df = pd.DataFrame(
+                [(asof_date, count, "DB") for asof_date, count in date_counts]
+                + [(asof_date, count, "보관 (Parquet)") for asof_date, count in reversed(archived)],
+                columns=['기준일', '레코드 수', '위치']
+            )
+            st.dataframe(date_df, use_container_width=True)
+
+    except Exception as e:
+        st.error(f"데이터 현황 조회 중 오류: {e}")
+        date_counts, archived = [], []
+
+    # 삭제/초기화 작업 진행 상황 (진행 중에는 새 작업을 받지 않음)
+    busy = job_running('reset_job_id')
+    if st.session_state.get('reset_job_id'):
+        st.subheader("💾 데이터 작업")
+        show_job('reset_job_id', show_job_result)
+
+    # 기준일 단위 삭제
+    st.subheader("📅 기준일 삭제")
+    all_counts = date_counts + archived[::-1]
+    selected_dates = st.multiselect("삭제할 기준일", [asof_date for asof_date, _ in all_counts],
+                                    key="reset_snapshot_dates")
+    if selected_dates:
+        selected_count = sum(count for asof_date, count in all_counts if asof_date in selected_dates)
+        confirm_snapshot = st.checkbox(f"선택한 기준일 {len(selected_dates)}개의 레코드 {selected_count:,}개를 삭제합니다",
+                                       key="reset_snapshot_confirm")
+        st.button("📅 선택한 기준일 삭제", disabled=busy or not confirm_snapshot, key="reset_snapshot_delete",
+                  on_click=_submit_snapshot_delete)
+
+    # 오래된 기준일 보관 / 되돌리기
+    st.subheader("🧊 오래된 기준일 보관")
+    st.caption(f"최근 기준일보다 {ARCHIVE_AFTER_MONTHS}개월 넘게 오래된 기준일을 압축 Parquet 파일로 옮겨 DB를 작게 유지합니다. "
+               "보관된 기준일도 분석 화면에서 그대로 조회됩니다 (조회 기간이 보관 기준일에 걸치면 파일에서 읽음).")
+    if date_counts:
+        cutoff = archive_cutoff(date_counts[0][0], ARCHIVE_AFTER_MONTHS)
+        candidates = [asof_date for asof_date, _ in date_counts if asof_date < cutoff]
+        if candidates:
+            candidate_count = sum(count for asof_date, count in date_counts if asof_date in candidates)
+            st.write(f"{cutoff} 이전 기준일 {len(candidates)}개 (레코드 {candidate_count:,}개)")
+            st.button(f"🧊 {len(candidates)}개 기준일 보관", disabled=busy, key="reset_archive",
+                      on_click=_submit_archive, args=(candidates,))
+        else:
+            st.info(f"{cutoff} 이전 기준일이 없어 보관할 데이터가 없습니다.")
+    if archived:
+        restore_dates = st.multiselect("DB로 되돌릴 보관 기준일", [asof_date for asof_date, _ in reversed(archived)],
+                                       key="reset_restore_dates")
+        st.button("↩️ 선택한 기준일 되돌리기", disabled=busy or not restore_dates, key="reset_restore",
+                  on_click=_submit_restore)
+
+    # 확인 절차
+    st.subheader("🔐 초기화 확인")
+
+    # 1단계: 확인 체크박스
+    confirm_checkbox = st.checkbox("모든 데이터가 삭제됨을 이해합니다")
+
+    # 2단계: 확인 텍스트 입력
+    confirm_text = st.text_input(
+        "초기화를 확인하려면 '초기화'를 입력하세요:",
+        placeholder="초기화"
+    )
+
+    # 3단계: 초기화 버튼
+    if confirm_checkbox and confirm_text == "초기화":
+        if st.button("🗑️ 데이터 초기화 실행", type="primary", use_container_width=True, disabled=busy):
+            job = submit_job("전체 데이터 초기화", truncate_work)
+            st.session_state.reset_job_id = job.id
+            st.rerun()
+    elif confirm_checkbox and confirm_text != "초기화":
+        st.error("❌ 정확히 '초기화'를 입력해주세요.")
+    elif not confirm_checkbox:
+        st.info("💡 초기화를 진행하려면 위의 확인 체크박스를 선택하고 정확한 텍스트를 입력해주세요.")
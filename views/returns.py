@@ -0,0 +1,291 @@
+# 📈 수익률 분석
+import pandas as pd
+import streamlit as st
+
+from config import TABLE_NAME, NAMED_VIEW
+from frame_cache import frame_key, load_frame
+from perf import timed
+from sketches import sketch_query, merge_rows, describe_sketch, histogram_points, boxplot_stats
+from views.common import PERIOD_MAPPING, RETURN_PERIODS, fragment, selected_columns, new_figure, set_axis_labels, show_figure
+from views.export_panel import render_export_panel
+from views.metrics_panel import render_metrics_panel
+
+
+# 처음 열었을 때 선택되어 있는 분석 기간
+DEFAULT_ANALYSIS_PERIODS = ["1Y", "3Y"]
+
+# 내보내기용 원본 수익률 조회 SQL (기간 조건은 export_query에서 추가)
+RETURNS_EXPORT_SQL = f"""
+    SELECT asof_date, manager, product_name,
+           r_1m, r_3m, r_6m, r_1y, r_2y, r_3y, since_inception, total_amount
+    FROM {NAMED_VIEW}
+"""
+
+
+def export_query(start_date=None, end_date=None):
+    """기간(없으면 전체 이력) 수익률 원본 내보내기 SQL과 파라미터를 만드는 함수"""
+    if start_date is None:
+        return RETURNS_EXPORT_SQL + " ORDER BY asof_date, manager, product_name", []
+    return (RETURNS_EXPORT_SQL + " WHERE asof_date BETWEEN ? AND ? ORDER BY asof_date, manager, product_name",
+            [start_date, end_date])
+
+
+def default_range():
+    """처음 열었을 때의 분석 기간(1년 전 ~ 오늘)을 반환하는 함수"""
+    today = pd.Timestamp.now()
+    return today - pd.Timedelta(days=365), today
+
+
+def count_key(start_date, end_date):
+    """기간 내 레코드 수 조회의 캐시 키를 만드는 함수"""
+    return frame_key(f"SELECT COUNT(*) as count FROM {TABLE_NAME} WHERE asof_date BETWEEN ? AND ?",
+                     [start_date, end_date])
+
+
+def sketches_key(start_date, end_date, selected_cols):
+    """기간 내 기준일별 분포 요약 조회의 캐시 키를 만드는 함수"""
+    return frame_key(sketch_query(selected_cols), list(selected_cols) + [start_date, end_date])
+
+
+def rank_keys(start_date, end_date, rank_col, n=10):
+    """수익률 상위/하위 n개 상품 조회의 캐시 키 (상위, 하위)를 만드는 함수"""
+    query = f"""
+        SELECT manager, product_name, {rank_col}
+        FROM {NAMED_VIEW}
+        WHERE asof_date BETWEEN ? AND ?
+        AND {rank_col} IS NOT NULL
+        ORDER BY {rank_col} {{order}}
+        LIMIT ?
+    """
+    params = [start_date, end_date, n]
+    return frame_key(query.format(order='DESC'), params), frame_key(query.format(order='ASC'), params)
+
+
+def default_keys():
+    """처음 열었을 때의 기본 분석(최근 1년, 1Y/3Y)이 읽는 캐시 키 목록을 반환하는 함수 (캐시 예열용)"""
+    start_date, end_date = (value.date() for value in default_range())
+    selected_cols = selected_columns(DEFAULT_ANALYSIS_PERIODS)
+    return [count_key(start_date, end_date), sketches_key(start_date, end_date, selected_cols),
+            *rank_keys(start_date, end_date, selected_cols[0])]
+
+
+def count_returns(start_date, end_date):
+    """기간 내 레코드 수를 조회하는 함수 (세션 간 공유 캐시)"""
+    return int(load_frame(count_key(start_date, end_date))['count'].iloc[0])
+
+
+def load_sketches(start_date, end_date, selected_cols):
+    """기간 내 기준일별 분포 요약을 읽어 컬럼별로 합친 스케치를 반환하는 함수
+
+    원본 행 대신 (기준일 수 x 컬럼 수)개의 작은 요약만 읽습니다 (세션 간 공유 캐시).
+    """
+    df_sketches = load_frame(sketches_key(start_date, end_date, selected_cols))
+    return merge_rows(df_sketches, selected_cols)
+
+
+@timed('pandas')
+def compute_statistics(sketches, selected_cols):
+    """선택된 수익률 컬럼의 기술 통계(describe와 같은 형식)를 스케치로 계산하는 함수"""
+    return pd.DataFrame({col: describe_sketch(sketches[col]) for col in selected_cols})
+
+
+def rank_products(start_date, end_date, rank_col, n=10):
+    """수익률 기준 상위/하위 n개 상품을 조회하는 함수 (세션 간 공유 캐시)"""
+    top_key, bottom_key = rank_keys(start_date, end_date, rank_col, n)
+    return load_frame(top_key), load_frame(bottom_key)
+
+
+@timed('chart')
+def build_histogram_figure(sketches, selected_period):
+    """선택 기간 수익률의 히스토그램을 그리는 함수 (미리 집계된 구간 개수 사용)"""
+    sketch = sketches[PERIOD_MAPPING[selected_period]]
+    centers, counts = histogram_points(sketch)
+    fig, ax = new_figure((10, 6))
+    if sketch['count']:
+        ax.hist(centers, bins=30, range=(sketch['min'], sketch['max']), weights=counts,
+                alpha=0.7, edgecolor='black', color='skyblue')
+    set_axis_labels(ax, f'{selected_period} 수익률 (%)', '빈도', f'{selected_period} 수익률 분포')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+
+@timed('chart')
+def build_boxplot_figure(sketches, selected_cols):
+    """기간별 수익률 박스플롯을 그리는 함수 (분위수 스케치로 상자/수염 계산)"""
+    fig, ax = new_figure((12, 6))
+    stats = [boxplot_stats(sketches[col], col) for col in selected_cols if sketches[col]['count']]
+    if stats:
+        ax.bxp(stats)
+    ax.grid(True)
+    set_axis_labels(ax, ylabel='수익률 (%)', title='기간별 수익률 분포')
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+def render():
+    """수익률 분석 페이지를 그리는 함수"""
+    st.title("📈 수익률 분석 (SQLite)")
+
+    # 분석 옵션 설정
+    st.subheader("🔧 분석 옵션 설정")
+
+    # 날짜 선택 (session_state로 상태 유지)
+    if 'start_date' not in st.session_state:
+        st.session_state.start_date = default_range()[0]
+    if 'end_date' not in st.session_state:
+        st.session_state.end_date = default_range()[1]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        start_date = st.date_input("시작일 선택", value=st.session_state.start_date, key="start_date_input")
+        st.session_state.start_date = start_date
+    with col2:
+        end_date = st.date_input("종료일 선택", value=st.session_state.end_date, key="end_date_input")
+        st.session_state.end_date = end_date
+
+    # 분석 기간 선택 (session_state로 상태 유지)
+    if 'analysis_periods' not in st.session_state:
+        st.session_state.analysis_periods = list(DEFAULT_ANALYSIS_PERIODS)
+
+    analysis_periods = st.multiselect(
+        "분석할 수익률 기간 선택",
+        RETURN_PERIODS,
+        default=st.session_state.analysis_periods,
+        key="analysis_periods_select"
+    )
+    st.session_state.analysis_periods = analysis_periods
+
+    # 시각화 옵션 (session_state로 상태 유지)
+    st.subheader("📊 시각화 옵션")
+
+    if 'show_histogram' not in st.session_state:
+        st.session_state.show_histogram = True
+    if 'show_boxplot' not in st.session_state:
+        st.session_state.show_boxplot = True
+    if 'show_statistics' not in st.session_state:
+        st.session_state.show_statistics = True
+
+    show_histogram = st.checkbox("히스토그램 표시", value=st.session_state.show_histogram, key="show_histogram_check")
+    st.session_state.show_histogram = show_histogram
+
+    show_boxplot = st.checkbox("박스플롯 표시", value=st.session_state.show_boxplot, key="show_boxplot_check")
+    st.session_state.show_boxplot = show_boxplot
+
+    show_statistics = st.checkbox("통계 테이블 표시", value=st.session_state.show_statistics, key="show_statistics_check")
+    st.session_state.show_statistics = show_statistics
+
+    if st.button("📈 수익률 분석 실행", type="primary"):
+        try:
+            # 기간 내 레코드 수 확인 (원본 행은 읽지 않음)
+            record_count = count_returns(start_date, end_date)
+
+            if record_count:
+                # 분석 조건을 session_state에 저장
+                st.session_state.analysis_range = (start_date, end_date)
+                st.session_state.analysis_completed = True
+                st.session_state.analysis_periods = analysis_periods
+                st.session_state.show_histogram = show_histogram
+                st.session_state.show_boxplot = show_boxplot
+                st.session_state.show_statistics = show_statistics
+
+                st.success(f"✅ 분석 데이터 로드 완료: {record_count}개 레코드")
+
+            else:
+                st.warning("선택한 기간에 데이터가 없습니다.")
+
+        except Exception as e:
+            st.error(f"분석 중 오류 발생: {e}")
+
+    # 분석 결과가 있으면 표시
+    if 'analysis_completed' in st.session_state and st.session_state.analysis_completed:
+        render_results()
+
+    # 미리 계산된 위험/성과 지표 (실행 버튼 없이 바로 조회)
+    render_metrics_panel("returns")
+
+    # 원본 수익률 내보내기 (선택 기간 또는 전체 이력)
+    export_scope = st.radio("내보내기 범위", ["선택 기간", "전체 이력"], horizontal=True, key="returns_export_scope")
+    if export_scope == "전체 이력":
+        query, params = export_query()
+        file_stem = "fund_returns_all"
+    else:
+        query, params = export_query(start_date, end_date)
+        file_stem = f"fund_returns_{start_date}_{end_date}"
+    render_export_panel("returns", query, params, file_stem)
+
+
+def render_results():
+    """session_state에 저장된 수익률 분석 결과를 표시하는 함수
+
+    히스토그램과 순위 표는 각자의 기간 선택만 바뀌면 그 부분만 다시 그리도록 fragment로 나눕니다.
+    """
+    start_date, end_date = st.session_state.analysis_range
+    analysis_periods = st.session_state.analysis_periods
+    show_histogram = st.session_state.show_histogram
+    show_boxplot = st.session_state.show_boxplot
+    show_statistics = st.session_state.show_statistics
+
+    # 선택된 기간의 컬럼만 필터링
+    selected_cols = selected_columns(analysis_periods)
+
+    # 기준일별 분포 요약을 합쳐 통계/히스토그램/박스플롯에 사용
+    sketches = load_sketches(start_date, end_date, selected_cols)
+
+    # 통계 테이블
+    if show_statistics:
+        st.subheader("📊 수익률 통계")
+        stats_df = compute_statistics(sketches, selected_cols)
+        st.dataframe(stats_df, use_container_width=True)
+
+    # 수익률 분포 히스토그램
+    if show_histogram:
+        render_histogram(sketches, analysis_periods)
+
+    # 박스플롯
+    if show_boxplot:
+        st.subheader("📦 수익률 박스플롯")
+        show_figure(build_boxplot_figure(sketches, selected_cols))
+
+    # 추가 분석: 상위/하위 수익률 상품
+    render_ranking(start_date, end_date, analysis_periods)
+
+
+# fragment: 기간을 바꾸면 페이지 전체 대신 이 히스토그램만 다시 그림
+# (스케치는 마지막 페이지 실행에서 받은 것을 그대로 사용)
+@fragment
+def render_histogram(sketches, analysis_periods):
+    """기간을 골라 수익률 분포 히스토그램을 그리는 함수"""
+    st.subheader("📈 수익률 분포 히스토그램")
+
+    # 히스토그램 분석 기간 선택 (session_state로 상태 유지)
+    if 'histogram_period' not in st.session_state:
+        st.session_state.histogram_period = analysis_periods[0] if analysis_periods else "1Y"
+
+    selected_period = st.selectbox("히스토그램 분석 기간 선택", analysis_periods, key="histogram_period_select_2")
+    st.session_state.histogram_period = selected_period
+    show_figure(build_histogram_figure(sketches, selected_period))
+
+
+# fragment: 기간을 바꾸면 순위 표만 다시 조회해 그림
+@fragment
+def render_ranking(start_date, end_date, analysis_periods):
+    """기간을 골라 상위/하위 수익률 상품 표를 그리는 함수"""
+    st.subheader("🏆 수익률 순위")
+
+    # 순위 분석 기간 선택 (session_state로 상태 유지)
+    if 'rank_period' not in st.session_state:
+        st.session_state.rank_period = analysis_periods[0] if analysis_periods else "1Y"
+
+    rank_period = st.selectbox("순위 분석 기간 선택", analysis_periods, key="rank_period_select_2")
+    st.session_state.rank_period = rank_period
+    rank_col = PERIOD_MAPPING[rank_period]
+
+    top_products, bottom_products = rank_products(start_date, end_date, rank_col)
+
+    st.write("**상위 10개 상품**")
+    st.dataframe(top_products, use_container_width=True)
+
+    st.write("**하위 10개 상품**")
+    st.dataframe(bottom_products, use_container_width=True)
@@ -0,0 +1,384 @@
+# 📈 시계열 수익률
+import time
+
+import pandas as pd
+import streamlit as st
+
+from ai_analysis import analyze_with_openai, save_plot_as_base64
+from config import TABLE_NAME, NAMED_VIEW, MANAGER_TABLE, PRODUCT_TABLE
+from database import execute_sql_query
+from downsample import POINT_BUDGET, points_per_line, to_plot_dates
+from frame_cache import cached_query
+from perf import timed
+from search import search_products
+from startup import get_pyplot
+from timeseries_engine import build_cube, summary_statistics, average_lines, period_lines
+from views.common import (
+    PERIOD_MAPPING, RETURN_PERIODS, fragment, selected_columns,
+    new_figure, set_axis_labels, set_legend, show_figure, show_ai_hint, plot_line,
+)
+from views.export_panel import render_export_panel
+from views.grid import render_grid
+
+def load_managers(timeline_start, timeline_end):
+    """기간 내 데이터가 있는 운용사 목록을 조회하는 함수"""
+    manager_query = f"""
+        SELECT m.name as manager
+        FROM {MANAGER_TABLE} m
+        WHERE EXISTS (
+            SELECT 1
+            FROM {PRODUCT_TABLE} p
+            JOIN {TABLE_NAME} f ON f.product_id = p.product_id
+            WHERE p.manager_id = m.manager_id
+            AND f.asof_date BETWEEN ? AND ?
+        )
+        ORDER BY m.name
+    """
+    return execute_sql_query(manager_query, params=[timeline_start, timeline_end])
+
+
+def load_products(selected_manager, timeline_start, timeline_end):
+    """선택된 운용사의 기간 내 상품 목록을 조회하는 함수"""
+    product_query = f"""
+        SELECT p.name as product_name
+        FROM {PRODUCT_TABLE} p
+        JOIN {MANAGER_TABLE} m ON m.manager_id = p.manager_id
+        WHERE m.name = ?
+        AND EXISTS (
+            SELECT 1 FROM {TABLE_NAME} f
+            WHERE f.product_id = p.product_id
+            AND f.asof_date BETWEEN ? AND ?
+        )
+        ORDER BY p.name
+    """
+    return execute_sql_query(product_query, params=[selected_manager, timeline_start, timeline_end])
+
+
+def timeseries_source(selected_manager, selected_products, return_periods, timeline_start, timeline_end):
+    """선택된 상품들의 시계열 조회 SQL(정렬 없음)과 파라미터를 만드는 함수"""
+    selected_cols = selected_columns(return_periods)
+    query = f"""
+        SELECT asof_date, product_id, product_name, {', '.join(selected_cols)}
+        FROM {NAMED_VIEW}
+        WHERE manager = ?
+        AND product_name IN ({','.join(['?'] * len(selected_products))})
+        AND asof_date BETWEEN ? AND ?
+    """
+    params = [selected_manager] + list(selected_products) + [timeline_start, timeline_end]
+    return query, params
+
+
+def load_timeseries(selected_manager, selected_products, return_periods, timeline_start, timeline_end):
+    """선택된 상품들의 시계열 수익률 데이터를 조회하는 함수 (세션 간 공유 캐시)"""
+    query, params = timeseries_source(selected_manager, selected_products, return_periods, timeline_start, timeline_end)
+    df_timeline = cached_query(query + " ORDER BY asof_date, product_name", params=params)
+    return df_timeline.drop(columns=['product_id'])
+
+
+def build_timeseries_cube(df_timeline, selected_products, return_periods):
+    """조회 결과를 (기준일 x 상품 x 기간) 배열로 한 번 피벗하는 함수"""
+    return build_cube(df_timeline, PERIOD_MAPPING, return_periods, products=selected_products)
+
+
+def summarize_timeseries(cube):
+    """상품 x 수익률 기간별 평균/최고/최저/표준편차 요약표를 만드는 함수"""
+    return summary_statistics(cube)
+
+
+@timed('chart')
+def build_timeseries_figure(cube, selected_manager, period, average=None,
+                            show_individual_lines=True, show_average_line=True, show_legend=True,
+                            point_budget=POINT_BUDGET):
+    """한 수익률 기간의 상품별/평균 시계열 라인 차트를 그리는 함수
+
+    average는 average_lines(cube) 결과로, 여러 기간을 그릴 때 한 번만 계산해 넘깁니다.
+    라인 전체 점 수가 point_budget을 넘으면 라인마다 LTTB로 줄여 그립니다 (None이면 전체 해상도).
+    """
+    fig, ax = new_figure((14, 8))
+    n_lines = (len(cube['products']) if show_individual_lines else 0) + (1 if show_average_line else 0)
+    max_points = points_per_line(n_lines, point_budget) if point_budget else None
+
+    # 개별 상품 라인
+    if show_individual_lines:
+        for product, x, y in period_lines(cube, period):
+            plot_line(ax, to_plot_dates(x), y, max_points,
+                      marker='o', linewidth=2, markersize=4, label=f'{product}', alpha=0.8)
+
+    # 평균 라인
+    if show_average_line:
+        if average is None:
+            average = average_lines(cube)
+        plot_line(ax, to_plot_dates(cube['dates']), average[:, cube['periods'].index(period)], max_points,
+                  marker='s', linewidth=3, markersize=6,
+                  label='평균', color='red', linestyle='--')
+
+    set_axis_labels(ax, '날짜', f'{period} 수익률 (%)', f'{selected_manager} - {period} 수익률 시계열')
+    if show_legend:
+        set_legend(ax, bbox_to_anchor=(1.05, 1), loc='upper left')
+
+    ax.grid(True, alpha=0.3)
+    ax.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+    return fig
+
+
+def build_placeholder_figure(text):
+    """표 분석용 더미 이미지를 만드는 함수"""
+    fig, ax = new_figure((1, 1))
+    ax.text(0.5, 0.5, text, ha='center', va='center', transform=ax.transAxes)
+    ax.axis('off')
+    return fig
+
+
+# fragment: 검색어를 입력하거나 결과를 고르는 동안에는 검색창만 다시 그림
+# (고른 상품을 적용할 때만 페이지 전체를 다시 실행)
+@fragment
+def render_product_search():
+    """상품명/운용사명으로 상품을 찾아 운용사/상품 선택에 넣는 검색창을 그리는 함수"""
+    search_text = st.text_input("🔎 상품 검색 (상품명/운용사명 일부, 오타 허용)", key="timeseries_search")
+    if not search_text.strip():
+        return
+
+    started = time.perf_counter()
+    df_found = search_products(search_text)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    fuzzy_count = int((df_found['match'] == '유사').sum())
+    st.caption(f"검색 결과 {len(df_found):,}건" + (f" (유사 {fuzzy_count}건 포함)" if fuzzy_count else "")
+               + f" · {elapsed_ms:.1f} ms")
+    if df_found.empty:
+        return
+
+    labels = {
+        row.product_id: f"{row.product_name} ({row.manager})" + (" ~" if row.match == '유사' else "")
+        for row in df_found.itertuples()
+    }
+    picked = st.multiselect("검색 결과에서 상품 선택", list(labels), format_func=labels.get,
+                            key="timeseries_search_pick")
+    if st.button("선택한 상품으로 보기", disabled=not picked):
+        df_picked = df_found.set_index('product_id').loc[picked]
+        manager = df_picked['manager'].iloc[0]
+        st.session_state.timeseries_search_selection = {
+            'manager': manager,
+            'products': df_picked.loc[df_picked['manager'] == manager, 'product_name'].tolist(),
+            'skipped': int((df_picked['manager'] != manager).sum()),
+        }
+        st.rerun()
+
+
+def show_ai_analysis(fig, analysis_type, result_title, spinner_text, table_data=None):
+    """그래프(와 표)를 AI로 분석하고 결과를 표시하는 함수"""
+    with st.spinner(spinner_text):
+        try:
+            # 그래프를 base64로 변환
+            image_base64 = save_plot_as_base64(fig)
+            if image_base64:
+                # OpenAI API 호출
+                analysis_result = analyze_with_openai(
+                    image_base64,
+                    table_data=table_data,
+                    analysis_type=analysis_type
+                )
+
+                # 분석 결과 표시
+                st.subheader(result_title)
+                st.markdown(analysis_result)
+        except Exception as e:
+            st.error(f"AI 분석 중 오류: {e}")
+
+
+def render():
+    """시계열 수익률 페이지를 그리는 함수"""
+    st.title("📈 시계열 수익률 분석 (SQLite)")
+
+    # AI 분석 상태 가져오기 (사이드바에서 설정됨)
+    ai_analysis_enabled = st.session_state.get('ai_analysis_checkbox', False)
+    ai_analysis_verified = st.session_state.get('ai_analysis_verified', False)
+
+    # 분석 옵션 설정
+    st.subheader("🔧 분석 옵션 설정")
+
+    # 패스워드 확인 상태에 따른 메시지 표시
+    if ai_analysis_enabled and not ai_analysis_verified:
+        st.warning("🔒 AI 분석을 사용하려면 올바른 패스워드를 입력해주세요.")
+
+    # 분석 기간 선택
+    col1, col2 = st.columns(2)
+    with col1:
+        timeline_start = st.date_input("분석 시작일", value=pd.Timestamp.now() - pd.Timedelta(days=365))
+    with col2:
+        timeline_end = st.date_input("분석 종료일", value=pd.Timestamp.now())
+
+    # 상품 검색 (고른 상품은 아래 운용사/상품 선택의 기본값이 됨)
+    render_product_search()
+    search_selection = st.session_state.get('timeseries_search_selection')
+    if search_selection and search_selection['skipped']:
+        st.warning(f"한 번에 한 운용사만 볼 수 있어 {search_selection['manager']} 외 운용사의 상품 "
+                   f"{search_selection['skipped']}개는 제외했습니다.")
+
+    # 운용사 선택
+    try:
+        # 운용사 목록 조회
+        df_managers = load_managers(timeline_start, timeline_end)
+
+        if not df_managers.empty:
+            manager_options = df_managers['manager'].tolist()
+            manager_index = 0
+            if search_selection and search_selection['manager'] in manager_options:
+                manager_index = manager_options.index(search_selection['manager'])
+            elif search_selection:
+                st.info(f"검색에서 고른 운용사({search_selection['manager']})는 분석 기간에 데이터가 없습니다.")
+            selected_manager = st.selectbox("운용사 선택", manager_options, index=manager_index)
+
+            # 상품 선택
+            try:
+                # 선택된 운용사의 상품 목록 조회
+                df_products = load_products(selected_manager, timeline_start, timeline_end)
+
+                if not df_products.empty:
+                    product_options = df_products['product_name'].tolist()
+                    default_products = product_options[:3]  # 기본값으로 처음 3개
+                    if search_selection and search_selection['manager'] == selected_manager:
+                        # 검색에서 고른 상품 중 분석 기간에 데이터가 있는 상품
+                        found = [name for name in search_selection['products'] if name in product_options]
+                        if len(found) < len(search_selection['products']):
+                            st.info("검색에서 고른 상품 중 분석 기간에 데이터가 없는 상품은 제외했습니다.")
+                        default_products = found or default_products
+                    selected_products = st.multiselect(
+                        "상품 선택 (여러 개 선택 가능)",
+                        product_options,
+                        default=default_products
+                    )
+
+                    # 수익률 기간 선택
+                    return_periods = st.multiselect(
+                        "수익률 기간 선택",
+                        RETURN_PERIODS,
+                        default=["1Y", "3Y"]
+                    )
+
+                    # 시각화 옵션
+                    st.subheader("📊 시각화 옵션")
+                    show_individual_lines = st.checkbox("개별 상품 라인 표시", value=True)
+                    show_average_line = st.checkbox("평균 라인 표시", value=True)
+                    show_legend = st.checkbox("범례 표시", value=True)
+                    full_resolution = st.checkbox(
+                        "전체 해상도로 그리기", value=False,
+                        help=f"차트 하나의 점이 {POINT_BUDGET}개를 넘으면 모양을 유지하며 점 수를 줄여 그립니다. "
+                             "기간을 좁히면 해당 구간은 원본 그대로 표시됩니다."
+                    )
+                    point_budget = None if full_resolution else POINT_BUDGET
+
+                    if st.button("📈 시계열 수익률 분석 실행", type="primary"):
+                        try:
+                            if not selected_products:
+                                st.warning("분석할 상품을 선택해주세요.")
+                                st.stop()
+
+                            if not return_periods:
+                                st.warning("분석할 수익률 기간을 선택해주세요.")
+                                st.stop()
+
+                            # 선택된 상품들의 시계열 데이터 조회
+                            df_timeline = load_timeseries(selected_manager, selected_products, return_periods, timeline_start, timeline_end)
+
+                            if not df_timeline.empty:
+                                st.success(f"✅ 시계열 분석 완료: {len(df_timeline)}개 데이터 포인트")
+                                plt = get_pyplot()
+
+                                # 조회 결과를 한 번만 피벗하고 평균 라인은 모든 기간에 대해 한 번에 계산
+                                cube = build_timeseries_cube(df_timeline, selected_products, return_periods)
+                                average = average_lines(cube) if show_average_line else None
+
+                                # 각 수익률 기간별로 시계열 그래프 생성
+                                for period in cube['periods']:
+                                    st.subheader(f"📈 {period} 수익률 시계열")
+
+                                    fig = build_timeseries_figure(
+                                        cube, selected_manager, period, average,
+                                        show_individual_lines, show_average_line, show_legend,
+                                        point_budget
+                                    )
+                                    show_figure(fig, close=False)
+
+                                    # OpenAI API로 그래프 분석 (패스워드 확인 후)
+                                    if ai_analysis_verified:
+                                        show_ai_analysis(
+                                            fig, f"{period} 수익률 시계열",
+                                            "🤖 AI 분석 결과", "🤖 AI가 그래프를 분석하고 있습니다..."
+                                        )
+                                    else:
+                                        show_ai_hint(ai_analysis_enabled)
+                                    plt.close(fig)
+
+                                # 요약 통계 테이블
+                                st.subheader("📊 시계열 요약 통계")
+
+                                summary_df = summarize_timeseries(cube)
+
+                                if not summary_df.empty:
+                                    st.dataframe(summary_df, use_container_width=True)
+
+                                    # OpenAI API로 표 분석 (패스워드 확인 후)
+                                    if ai_analysis_verified:
+                                        fig_dummy = build_placeholder_figure('통계 분석')
+                                        show_ai_analysis(
+                                            fig_dummy, "시계열 수익률 통계",
+                                            "🤖 AI 통계 분석 결과", "🤖 AI가 통계 표를 분석하고 있습니다...",
+                                            table_data=summary_df.to_string(index=False)
+                                        )
+                                        plt.close(fig_dummy)
+                                    else:
+                                        show_ai_hint(ai_analysis_enabled)
+
+                                # 상세 데이터 테이블
+                                st.subheader("📋 상세 시계열 데이터")
+                                source_sql, source_params = timeseries_source(
+                                    selected_manager, selected_products, return_periods, timeline_start, timeline_end
+                                )
+                                render_grid(
+                                    "timeseries", source_sql, source_params,
+                                    columns=list(df_timeline.columns), key_columns=['asof_date', 'product_id'],
+                                    sort_options={"기준일": 'asof_date', "상품명": 'product_name',
+                                                  **{f"{period} 수익률": PERIOD_MAPPING[period] for period in cube['periods']}},
+                                    default_sort='asof_date', descending=False,
+                                    filter_column='product_name', filter_label="상품명 검색"
+                                )
+
+                                # OpenAI API로 상세 데이터 분석 (패스워드 확인 후)
+                                if ai_analysis_verified:
+                                    # 상세 데이터를 문자열로 변환 (처음 10행만)
+                                    fig_dummy2 = build_placeholder_figure('데이터 분석')
+                                    show_ai_analysis(
+                                        fig_dummy2, "시계열 상세 데이터",
+                                        "🤖 AI 상세 데이터 분석 결과", "🤖 AI가 상세 데이터를 분석하고 있습니다...",
+                                        table_data=df_timeline.head(10).to_string(index=False)
+                                    )
+                                    plt.close(fig_dummy2)
+                                else:
+                                    show_ai_hint(ai_analysis_enabled)
+
+                            else:
+                                st.warning("선택한 조건에 해당하는 데이터가 없습니다.")
+
+                        except Exception as e:
+                            st.error(f"시계열 분석 중 오류 발생: {e}")
+
+                    # 선택된 상품의 시계열 데이터 내보내기
+                    if selected_products and return_periods:
+                        export_sql, export_params = timeseries_source(
+                            selected_manager, selected_products, return_periods, timeline_start, timeline_end
+                        )
+                        render_export_panel(
+                            "timeseries", export_sql + " ORDER BY asof_date, product_name", export_params,
+                            f"timeseries_{selected_manager}_{timeline_start}_{timeline_end}"
+                        )
+                else:
+                    st.warning(f"{selected_manager}의 상품 데이터가 없습니다.")
+
+            except Exception as e:
+                st.error(f"상품 목록 조회 중 오류 발생: {e}")
+        else:
+            st.warning("선택한 기간에 운용사 데이터가 없습니다.")
+
+    except Exception as e:
+        st.error(f"운용사 목록 조회 중 오류 발생: {e}")
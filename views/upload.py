@@ -0,0 +1,210 @@
+# 📤 데이터 업로드
+# 엑셀을 읽으면 validation.py로 컬럼 단위 검증/숫자 정규화를 먼저 하고 결과 보고서를 보여줍니다.
+# 저장은 write_queue의 단일 쓰기 스레드에서 실행되고, 페이지는 작업 id로 진행 상황(처리 행 수)을 주기적으로 조회합니다.
+import pandas as pd
+import streamlit as st
+
+from archive import remove_unlisted_files
+from config import TABLE_NAME, UPLOAD_CHUNK_ROWS, UPLOAD_ROBUST_Z_LIMIT
+from database import delete_snapshots, ingest_in_chunks, prune_dimensions, restore_snapshots
+from metrics import refresh_metrics
+from perf import timed
+from sketches import refresh_sketches
+from validation import to_records, validate_frame
+from views.jobs import job_running, show_job
+from warmer import request_warm
+from write_queue import submit_job
+
+# 엑셀 컬럼 -> DB 컬럼
+EXCEL_COLUMN_MAPPING = {
+    "운용사": "manager",
+    "상품명": "product_name",
+    "1M": "r_1m",
+    "3M": "r_3m",
+    "6M": "r_6m",
+    "1Y": "r_1y",
+    "2Y": "r_2y",
+    "3Y": "r_3y",
+    "설정일이후": "since_inception",
+    "총액": "total_amount",
+}
+
+# DB 컬럼 -> 엑셀 컬럼 (검증 보고서 표시용)
+DB_COLUMN_LABELS = {db_col: excel_col for excel_col, db_col in EXCEL_COLUMN_MAPPING.items()}
+
+
+@timed('pandas')
+def validate_upload(df):
+    """엑셀 DataFrame을 DB 컬럼 이름으로 바꿔 검증/정규화하고 (정리된 DataFrame, 보고서)를 반환하는 함수"""
+    renamed = df.rename(columns=EXCEL_COLUMN_MAPPING)
+    return validate_frame(renamed[[col for col in EXCEL_COLUMN_MAPPING.values() if col in renamed]])
+
+
+def build_records(df, asof_date_str):
+    """엑셀 DataFrame을 검증 후 적재용 튜플 목록(database.RECORD_COLUMNS 순서)으로 변환하는 함수"""
+    clean, _ = validate_upload(df)
+    return to_records(clean, asof_date_str)
+
+
+def validation_table(report):
+    """검증 보고서의 컬럼별 건수를 표로 만드는 함수"""
+    return pd.DataFrame([
+        {
+            '컬럼': DB_COLUMN_LABELS.get(item['column'], item['column']) + ('' if item['present'] else ' (없음)'),
+            '형식 변환': item['converted'],
+            '빈 값': item['missing'],
+            '숫자 아님': item['invalid'],
+            '범위 벗어남': item['out_of_range'],
+            '이상치': item['outliers'],
+            '거부된 값 예시': ', '.join(item['examples']),
+        }
+        for item in report['columns']
+    ])
+
+
+def show_validation(report):
+    """업로드 검증 결과를 그리는 함수"""
+    st.subheader("🔎 데이터 검증")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("전체 행", f"{report['rows']:,}")
+    col2.metric("저장 대상", f"{report['accepted']:,}")
+    col3.metric("운용사/상품명 없음", f"{report['missing_keys']:,}")
+    col4.metric("중복 상품 (마지막 행 사용)", f"{report['duplicates']:,}")
+
+    table = validation_table(report)
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    rejected = sum(item['invalid'] + item['out_of_range'] for item in report['columns'])
+    if rejected:
+        st.warning(f"숫자로 읽을 수 없거나 범위를 벗어난 값 {rejected:,}개는 빈 값으로 저장됩니다.")
+    if report['outliers']:
+        st.info(f"다른 상품과 크게 다른 수익률(|robust z| > {UPLOAD_ROBUST_Z_LIMIT:g})은 그대로 저장되며 확인용으로 표시합니다.")
+        outliers = pd.DataFrame(report['outliers']).rename(columns={
+            'manager': '운용사', 'product_name': '상품명', 'column': '컬럼', 'value': '값', 'z': 'robust z'
+        })
+        outliers['컬럼'] = outliers['컬럼'].map(DB_COLUMN_LABELS)
+        st.dataframe(outliers.round(2), use_container_width=True, hide_index=True)
+
+
+def count_snapshot_rows(cursor, asof_date_str):
+    """기준일의 저장된 레코드 수를 반환하는 함수"""
+    cursor.execute(f"SELECT COUNT(*) FROM {TABLE_NAME} WHERE asof_date = ?", (asof_date_str,))
+    return cursor.fetchone()[0]
+
+
+def upload_work(clean, asof_date_str, replace=False):
+    """검증을 마친 DataFrame을 기준일 데이터로 저장하는 쓰기 작업 함수를 만드는 함수 (쓰기 스레드에서 실행)
+
+    replace=True면 같은 기준일의 기존 데이터를 지우고 저장합니다 (삭제는 첫 묶음과 함께 커밋).
+    보관된 기준일이면 교체하지 않을 때 보관 행을 먼저 되돌린 뒤 덮어씁니다.
+    """
+    def work(job, conn):
+        job.update(stage="데이터 변환 중", total=len(clean))
+        values_list = to_records(clean, asof_date_str)
+        if not values_list:
+            raise ValueError("변환된 데이터가 없습니다.")
+
+        replaced_count = 0
+        if replace:
+            job.update(stage="기존 기준일 데이터 삭제 중")
+            replaced_count = delete_snapshots(conn, [asof_date_str], refresh=False)
+        else:
+            job.update(stage="보관된 기준일 데이터 확인 중")
+            restore_snapshots(conn, [asof_date_str])
+
+        # UPLOAD_CHUNK_ROWS개씩 적재/커밋 (운용사/상품명은 차원 테이블 id로 일괄 변환)
+        job.update(stage="데이터 저장 중", total=len(values_list))
+        saved_count, skipped_count = ingest_in_chunks(
+            conn, values_list, on_progress=lambda done, total: job.update(done=done)
+        )
+
+        # 위험/성과 지표와 기준일 분포 요약 재계산 (한 트랜잭션에서 교체)
+        job.update(stage="위험/성과 지표 계산 중")
+        if replace:
+            prune_dimensions(conn.cursor())
+        metrics_count = refresh_metrics(conn)
+        refresh_sketches(conn, [asof_date_str])
+        conn.commit()
+        remove_unlisted_files(conn)
+        # 바뀐 데이터로 기본 화면 조회 결과를 미리 캐시에 넣음 (백그라운드)
+        request_warm()
+
+        return {
+            'asof_date': asof_date_str,
+            'saved': saved_count,
+            'skipped': skipped_count,
+            'metrics': metrics_count,
+            'replaced': replaced_count,
+            'snapshot_rows': count_snapshot_rows(conn.cursor(), asof_date_str),
+        }
+    return work
+
+
+def show_upload_result(job):
+    """끝난 업로드 작업의 결과를 그리는 함수"""
+    result = job['result']
+    elapsed = (job['finished_at'] - job['started_at']).total_seconds()
+    st.success(f"✅ 데이터 저장 완료! (처리 건수: {result['saved']}, {elapsed:,.1f}초)")
+    if result['replaced']:
+        st.info(f"기존 {result['asof_date']} 데이터 {result['replaced']:,}건을 교체했습니다.")
+    st.info(f"위험/성과 지표 갱신: {result['metrics']}개 상품")
+    if result['skipped']:
+        st.warning(f"운용사 또는 상품명이 비어 있는 {result['skipped']}개 행은 저장하지 않았습니다.")
+    st.info(f"현재 기준일({result['asof_date']})의 총 레코드 수: {result['snapshot_rows']}")
+
+
+def show_upload_failure(job):
+    """실패한 업로드 작업에서 이미 커밋된 부분을 알려주는 함수"""
+    if job['done']:
+        st.warning(f"{job['done']:,}행은 이미 저장되었습니다. 같은 파일을 다시 저장하면 덮어씁니다.")
+
+
+def render():
+    """데이터 업로드 페이지를 그리는 함수"""
+    st.title("📤 데이터 업로드")
+
+    # 데이터 업로드 섹션
+    st.subheader("📤 데이터 업로드")
+
+    # 날짜 선택
+    asof_date = st.date_input("업로드 기준일 (asof_date)을 선택하세요:")
+
+    # 파일 업로드
+    uploaded_file = st.file_uploader("엑셀 파일 업로드", type=["xlsx"])
+
+    saving = job_running('upload_job_id')
+
+    if uploaded_file:
+        try:
+            # 엑셀 로드
+            df = pd.read_excel(uploaded_file, sheet_name=0)
+
+            st.subheader("데이터 미리보기")
+            st.dataframe(df.head())
+
+            # 엑셀 컬럼 확인
+            st.info(f"엑셀 컬럼: {list(df.columns)}")
+
+            # 컬럼 단위 검증/숫자 정규화 (DB에 쓰기 전)
+            clean, report = validate_upload(df)
+
+        except Exception as e:
+            st.error(f"엑셀 파일 로드 오류: {e}")
+            st.stop()
+
+        show_validation(report)
+
+        replace = st.checkbox("같은 기준일의 기존 데이터를 지우고 저장 (파일에 없는 상품도 삭제)",
+                              key="upload_replace_snapshot")
+
+        # DB 저장 버튼 (저장 대상이 없거나 저장 작업이 진행 중이면 비활성화)
+        if st.button("데이터 저장하기", disabled=saving or not report['accepted']):
+            asof_date_str = str(asof_date) if asof_date else None
+            job = submit_job(f"{asof_date_str} {'교체' if replace else '업로드'} ({uploaded_file.name}, {len(clean):,}행)",
+                             upload_work(clean, asof_date_str, replace))
+            st.session_state.upload_job_id = job.id
+
+    if st.session_state.get('upload_job_id'):
+        st.subheader("💾 저장 작업")
+        st.caption(f"{UPLOAD_CHUNK_ROWS:,}행씩 나눠 저장하므로 저장 중에도 다른 화면의 조회가 가능합니다.")
+        show_job('upload_job_id', show_upload_result, show_upload_failure)
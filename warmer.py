@@ -0,0 +1,116 @@
+# 공유 조회 결과 캐시 예열(warm-up)
+# 업로드로 데이터가 바뀐 뒤 처음 페이지를 여는 사용자가 조회/집계 비용을 모두 치르지 않도록,
+# 기본 화면이 읽는 조회 결과를 백그라운드 스레드에서 미리 frame_cache에 넣어 둡니다.
+#   - 운용사별 분석 : 운용사 요약
+#   - 수익률 분석   : 처음 열었을 때의 기본 조건(최근 1년, 1Y/3Y)의 레코드 수, 분포 요약, 순위 표
+#   - 상품별 분석   : 총 자산 상위 WARM_TOP_MANAGERS개 운용사의 상품 데이터 (히트맵/자산 규모 차트 입력)
+# 업로드 작업이 커밋한 뒤와 사이드바 메뉴를 눌렀을 때 request_warm()을 부릅니다.
+# 예열 스레드는 프로세스에 하나이며, 예열 중에 들어온 요청은 한 번으로 합쳐 끝난 뒤 다시 실행합니다.
+# 운용사 요약은 모든 기준일을 읽는 가장 비싼 집계이고 예열 조회는 쓰기 스레드(write_queue)와 같은 DB 파일을
+# 읽으므로, 쓰기 작업이 대기 중이거나 실행 중이면 큐가 빌 때까지 기다렸다가 예열하고, 예열 도중 쓰기 작업이
+# 들어오면 남은 조회를 멈춘 뒤 큐가 비면 다시 시작합니다 (업로드 안에서 요청한 예열은 업로드가 커밋된 뒤 실행).
+# 마지막으로 끝까지 예열한 data_version이 그대로면(메뉴 이동 등) 조회 없이 건너뜁니다.
+import threading
+import time
+import traceback
+from datetime import datetime
+
+from config import WARM_TOP_MANAGERS
+from database import get_data_version
+from frame_cache import warm_frame
+from write_queue import writer_busy
+
+# 쓰기 작업이 끝났는지 다시 확인하는 주기 (초)
+WRITER_POLL_SECONDS = 0.5
+
+_wake = threading.Event()
+_lock = threading.Lock()
+_thread = None
+_status = {'runs': 0, 'loaded': 0, 'skipped': 0, 'deferred': 0, 'version': None, 'finished_at': None, 'ms': None,
+           'error': None}
+
+
+class WriterBusy(Exception):
+    """예열 도중 쓰기 작업이 들어와 남은 조회를 멈춤"""
+
+
+def _warm(key):
+    if writer_busy():
+        raise WriterBusy()
+    return warm_frame(key)
+
+
+def warm_defaults():
+    """기본 화면의 조회 결과를 공유 캐시에 넣는 함수 (반환값: 새로 조회한 결과 수)
+
+    조회마다 쓰기 작업이 있는지 먼저 확인하고, 있으면 WriterBusy를 냅니다.
+    """
+    # 페이지 모듈은 처음 예열할 때만 import (views 패키지의 지연 import와 같은 이유)
+    from views import managers, products, returns
+
+    loaded = 0
+    for key in managers.default_keys() + returns.default_keys():
+        loaded += _warm(key)[1]
+
+    if WARM_TOP_MANAGERS:
+        df_manager, _ = _warm(managers.MANAGER_SUMMARY_KEY)
+        top_managers = df_manager['manager'].head(WARM_TOP_MANAGERS).astype(str).tolist()
+        for key in products.default_keys(top_managers):
+            loaded += _warm(key)[1]
+    return loaded
+
+
+def _wait_for_writer():
+    """쓰기 큐가 빌 때까지 기다리는 함수"""
+    while writer_busy():
+        time.sleep(WRITER_POLL_SECONDS)
+
+
+def _warm_loop():
+    warmed_version = None    # 마지막으로 끝까지 예열한 data_version
+    while True:
+        _wake.wait()
+        _wake.clear()
+        _wait_for_writer()
+        started = time.perf_counter()
+        version, loaded, error = None, 0, None
+        try:
+            version = get_data_version()
+            if version == warmed_version:
+                with _lock:
+                    _status['skipped'] += 1
+                continue
+            loaded = warm_defaults()
+            warmed_version = version
+        except WriterBusy:
+            # 쓰기 작업이 끝난 뒤 다시 예열 (이미 넣은 결과는 캐시에 남아 다시 조회하지 않음)
+            with _lock:
+                _status['deferred'] += 1
+            _wake.set()
+            continue
+        except Exception:
+            error = traceback.format_exc()
+        with _lock:
+            _status.update(
+                runs=_status['runs'] + 1, loaded=_status['loaded'] + loaded, version=version,
+                finished_at=datetime.now(), ms=(time.perf_counter() - started) * 1000, error=error,
+            )
+
+
+def request_warm():
+    """캐시 예열을 요청하는 함수 (바로 반환하고 예열은 백그라운드 스레드에서 실행)"""
+    global _thread
+    with _lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=_warm_loop, name='cache-warmer', daemon=True)
+            _thread.start()
+    _wake.set()
+
+
+def warm_status():
+    """예열 상태 {runs, loaded, skipped, deferred, version, finished_at, ms, error}를 반환하는 함수
+
+    skipped는 데이터가 그대로여서 건너뛴 요청 수, deferred는 쓰기 작업 때문에 멈췄다가 다시 시작한 횟수입니다.
+    """
+    with _lock:
+        return dict(_status)
@@ -0,0 +1,157 @@
+# DB 쓰기 작업 큐 (단일 쓰기 스레드)
+# 업로드처럼 오래 걸리는 쓰기 작업을 사용자 rerun 밖에서 실행합니다.
+#   - 프로세스에 쓰기 스레드가 하나뿐이라 앱 안의 쓰기 작업은 항상 한 번에 하나씩, 들어온 순서대로 실행됩니다
+#   - 작업 함수는 work(job, conn) 형태이며, job.update()로 단계와 처리 행 수를 알립니다
+#   - 세션은 submit_job()이 돌려준 작업 id를 session_state에 두고 get_job()으로 진행 상황을 조회합니다
+# 작업 함수가 예외 없이 끝나면 마지막으로 커밋하고, 예외가 나면 커밋되지 않은 변경만 롤백합니다
+# (작업 중간에 커밋한 묶음은 남습니다).
+import itertools
+import queue
+import threading
+import traceback
+from datetime import datetime
+
+from config import WRITE_JOB_HISTORY
+from database import get_db_connection
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+FINISHED_STATES = (DONE, FAILED)
+
+STATE_LABELS = {
+    QUEUED: '대기 중',
+    RUNNING: '실행 중',
+    DONE: '완료',
+    FAILED: '실패',
+}
+
+WARNING_LIMIT = 50            # 작업마다 보관하는 경고 메시지 수
+
+_queue = queue.Queue()
+_jobs = {}                    # 작업 id -> WriteJob (최근 WRITE_JOB_HISTORY개의 끝난 작업까지 보관)
+_jobs_lock = threading.Lock()
+_ids = itertools.count(1)
+_writer = None
+
+
+class WriteJob:
+    """쓰기 작업 하나의 상태 (쓰기 스레드가 갱신하고 세션이 snapshot()으로 읽음)"""
+
+    def __init__(self, title, work):
+        self.id = next(_ids)
+        self.title = title
+        self.work = work
+        self._lock = threading.Lock()
+        self._state = {
+            'id': self.id,
+            'title': title,
+            'state': QUEUED,
+            'stage': None,
+            'done': 0,
+            'total': None,
+            'result': None,
+            'error': None,
+            'traceback': None,
+            'warnings': [],
+            'submitted_at': datetime.now(),
+            'started_at': None,
+            'finished_at': None,
+        }
+
+    def update(self, **fields):
+        """작업 상태 값(단계, 처리 건수 등)을 갱신하는 함수"""
+        with self._lock:
+            self._state.update(fields)
+
+    def warn(self, message):
+        """작업 경고 메시지를 추가하는 함수 (WARNING_LIMIT개까지)"""
+        with self._lock:
+            if len(self._state['warnings']) < WARNING_LIMIT:
+                self._state['warnings'].append(message)
+
+    def snapshot(self):
+        """현재 작업 상태의 복사본을 반환하는 함수"""
+        with self._lock:
+            state = dict(self._state, warnings=list(self._state['warnings']))
+        state['position'] = queue_position(self.id) if state['state'] == QUEUED else 0
+        return state
+
+    @property
+    def finished(self):
+        with self._lock:
+            return self._state['state'] in FINISHED_STATES
+
+
+def _run(job):
+    """작업 하나를 새 연결에서 실행하는 함수"""
+    job.update(state=RUNNING, started_at=datetime.now())
+    conn = get_db_connection()
+    try:
+        result = job.work(job, conn)
+        conn.commit()
+        job.update(state=DONE, result=result)
+    except Exception as e:
+        conn.rollback()
+        job.update(state=FAILED, error=str(e), traceback=traceback.format_exc())
+    finally:
+        conn.close()
+        job.update(finished_at=datetime.now())
+
+
+def _writer_loop():
+    while True:
+        job = _queue.get()
+        try:
+            _run(job)
+        finally:
+            _queue.task_done()
+            _forget_old_jobs()
+
+
+def _ensure_writer():
+    global _writer
+    with _jobs_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_writer_loop, name='db-writer', daemon=True)
+            _writer.start()
+
+
+def _forget_old_jobs():
+    """끝난 작업을 최근 WRITE_JOB_HISTORY개만 남기는 함수"""
+    with _jobs_lock:
+        finished = [job_id for job_id, job in _jobs.items() if job.finished]
+        for job_id in finished[:-WRITE_JOB_HISTORY]:
+            del _jobs[job_id]
+
+
+def submit_job(title, work):
+    """쓰기 작업을 큐에 넣고 WriteJob을 반환하는 함수"""
+    job = WriteJob(title, work)
+    with _jobs_lock:
+        _jobs[job.id] = job
+    _ensure_writer()
+    _queue.put(job)
+    return job
+
+
+def writer_busy():
+    """대기 중이거나 실행 중인 쓰기 작업이 있는지 반환하는 함수"""
+    return _queue.unfinished_tasks > 0
+
+
+def get_job(job_id):
+    """작업 id의 현재 상태 딕셔너리를 반환하는 함수 (없으면 None)"""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    return job.snapshot() if job else None
+
+
+def queue_position(job_id):
+    """대기 중인 작업이 앞에 몇 개의 작업을 두고 있는지 반환하는 함수 (실행 중인 작업 포함)"""
+    with _jobs_lock:
+        jobs = list(_jobs.values())
+    return sum(1 for job in jobs if job.id < job_id and not job.finished)
+
+
+def wait_for_jobs():
+    """큐에 들어간 작업이 모두 끝날 때까지 기다리는 함수 (명령행 도구/테스트용)"""
+    _queue.join()